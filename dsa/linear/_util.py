@@ -1,9 +1,12 @@
+from .memory import MemoryReport, own_size, payload_size, sizeof
 import typing as ty
 
 T = ty.TypeVar("T")
 
 
 class Node(ty.Generic[T]):
+    __slots__ = ("value", "next", "prev")
+
     def __init__(
         self, value: T, *, next: "Node[T] | None" = None, prev: "Node[T] | None" = None
     ) -> None:
@@ -23,6 +26,8 @@ class Node(ty.Generic[T]):
 
 
 class SimpleLinkedList(ty.Generic[T]):
+    __slots__ = ("_head", "_tail", "_size")
+
     def __init__(self, iterable: ty.Iterable[Node[T]] | None = None) -> None:
         self._head: Node[T] | None = None
         self._tail: Node[T] | None = None
@@ -163,6 +168,8 @@ class SimpleLinkedList(ty.Generic[T]):
 
 
 class ValueList(ty.Generic[T]):
+    __slots__ = ("_list",)
+
     def __init__(self) -> None:
         self._list: SimpleLinkedList[T] = SimpleLinkedList()
 
@@ -193,6 +200,17 @@ class ValueList(ty.Generic[T]):
     def __reversed__(self) -> ty.Generator[T, None, None]:
         return self._iter(reversed(self._list))
 
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, len(self))
+        report.add("container", own_size(self) + sizeof(self._list))
+        report.add("nodes", sum(map(sizeof, self._list)))
+        if payload:
+            report.add("payload", payload_size(self))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
     def __str__(self) -> str:
         vals = ", ".join(map(repr, self._list))
         return "[" + vals + "]"
@@ -261,30 +279,334 @@ class Hashable(ty.Protocol):
 _HashableType = ty.TypeVar("_HashableType", str, int, float, bytes, Hashable)
 
 
-def _myhash_function(value: float | int | bytes | str, *, shift: int = 2):
+def _myhash_encode(value: float | int | bytes | str) -> tuple[int, bytes]:
+    "The seed and the bytes `_myhash_function` folds into a hash."
     if not isinstance(value, (str, float, bytes, int)):
         raise TypeError(
             "Unhashable type. Expected float, int, "
             f"str or bytes, got {type(value).__name__}"
         )
-    hash_value = 1
     if isinstance(value, (float, int)):
-        value = str(float(value)).encode()
-        hash_value = 2
-    elif isinstance(value, str):
-        value = value.encode()
-        hash_value = 4
+        return 2, str(float(value)).encode()
+    if isinstance(value, str):
+        return 4, value.encode()
+    return 1, value
+
+
+_MASK64 = (1 << 64) - 1
+_FIBONACCI = 0x9E3779B97F4A7C15  # 2**64 divided by the golden ratio
+
+
+def fold(hash_value: int) -> int:
+    """
+    Fold a hash of any size into 64 bits, every bit of it counts.
+    Python hashes a non negative int to its remainder modulo the
+    Mersenne prime 2**61 - 1.
+    """
+    return hash(hash_value) & _MASK64
+
+
+def _myhash_function(value: float | int | bytes | str, *, shift: int = 8):
+    hash_value, value = _myhash_encode(value)
+    if shift == 8:  # Whole bytes never overlap, that is a big endian read
+        return fold(int.from_bytes(bytes((hash_value,)) + value))
     for byte in value:
         hash_value <<= shift
         hash_value += byte
-    return hash_value
+    return fold(hash_value)
+
+
+# Protocol isinstance checks are slow, builtin keys skip them.
+_NATIVE_TYPES = frozenset((str, bytes, int, float, bool))
 
 
 def myhash(hashable: _HashableType, /) -> int:
-    if isinstance(hashable, Hashable):
+    "A 64 bit hash of `hashable`, the one cached in the container entries."
+    if type(hashable) not in _NATIVE_TYPES and isinstance(hashable, Hashable):
         hash_value = hashable.__myhash__()
         assert isinstance(
             hash_value, int
         ), f"Hash value must be an integer, got {hash_value!r}"
-        return hash_value
+        return fold(hash_value)
     return _myhash_function(hashable)
+
+
+# Below this many values, setting up the arrays costs more than it saves.
+_BULK_MINIMUM = 64
+_MERSENNE61 = (1 << 61) - 1  # `fold` takes non negative ints modulo it
+
+
+def _myhash_fold(np, seeds: list[int], data: bytes, lengths: list[int]) -> list[int]:
+    """
+    Vectorised `_myhash_function` over values given by their seeds and
+    their `lengths` worth of bytes, concatenated in `data`. Modulo
+    2**61 - 1, a power of two is a bit rotation, every byte is rotated
+    by its place in its value and the bytes of a value are summed from
+    prefix sums of their 32 bit halves, uint64 wraparound cancelling out.
+    """
+    u64 = np.uint64
+    mersenne = u64(_MERSENNE61)
+
+    def rotate(values, shifts):
+        return ((values << shifts) & mersenne) + (values >> (u64(61) - shifts))
+
+    def reduce(values):
+        return (values & mersenne) + (values >> u64(61))
+
+    sizes = np.asarray(lengths, np.int64)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    owners = np.repeat(np.arange(sizes.size), sizes)
+    after = ends[owners] - np.arange(len(data)) - 1  # Bytes after each one
+    weights = (after * 8 % 61).astype(u64)
+    terms = rotate(np.frombuffer(data, np.uint8).astype(u64), weights)
+    sums = []
+    for half in terms & u64(0xFFFFFFFF), terms >> u64(32):
+        prefix = np.zeros(len(data) + 1, u64)
+        np.cumsum(half, out=prefix[1:])
+        sums.append(prefix[ends] - prefix[starts])
+    low, high = sums
+    seeded = rotate(np.asarray(seeds, u64), (sizes * 8 % 61).astype(u64))
+    hashes = reduce(reduce(low) + rotate(high, u64(32)) + seeded)
+    return np.where(hashes >= mersenne, hashes - mersenne, hashes).tolist()
+
+
+def myhash_many(hashables: ty.Iterable[_HashableType], /) -> list[int]:
+    """
+    `myhash` every item of `hashables`, a sequence or a NumPy array.
+    With NumPy installed, strings, numbers and bytes are encoded a kind
+    at a time into one buffer and hashed with vectorised uint64
+    arithmetic instead of a big int per value.
+    """
+    if hasattr(hashables, "tolist"):
+        hashables = hashables.tolist()  # NumPy arrays, to python scalars
+    hashables = list(hashables)
+    if len(hashables) < _BULK_MINIMUM:
+        return list(map(myhash, hashables))
+    try:
+        import numpy as np
+    except ImportError:
+        return list(map(myhash, hashables))
+    kinds = set(map(type, hashables))
+    hashes: list[int] = [0] * len(hashables)
+    seeds: list[int] = []
+    chunks: list[bytes] = []
+    lengths: list[int] = []
+    order: list[int] = []
+    for kind in kinds:
+        indices: ty.Sequence[int]
+        if len(kinds) == 1:
+            indices, values = range(len(hashables)), hashables
+        else:
+            indices = [i for i, h in enumerate(hashables) if type(h) is kind]
+            values = [hashables[i] for i in indices]
+        if kind is str:
+            seed, joined = 4, "".join(values)
+            if joined.isascii():
+                encoded, sizes = joined.encode(), [*map(len, values)]
+            else:
+                parts = [value.encode() for value in values]
+                encoded, sizes = b"".join(parts), [*map(len, parts)]
+        elif kind is bytes:
+            seed, encoded, sizes = 1, b"".join(values), [*map(len, values)]
+        elif kind in _NATIVE_TYPES:
+            texts = [*map(str, map(float, values))]
+            seed, encoded, sizes = 2, "".join(texts).encode(), [*map(len, texts)]
+        else:
+            for index, value in zip(indices, values):
+                hashes[index] = myhash(value)
+            continue
+        seeds += [seed] * len(sizes)
+        chunks.append(encoded)
+        lengths += sizes
+        order += indices
+    if order:
+        folded = _myhash_fold(np, seeds, b"".join(chunks), lengths)
+        for index, hash_value in zip(order, folded):
+            hashes[index] = hash_value
+    return hashes
+
+
+def bucket_index(hash_value: int, size: int) -> int:
+    """
+    Fibonacci hashing of the 64 bit `hash_value` into a power of two
+    `size`. Plain modulo would only look at the lowest bits.
+    """
+    return (hash_value * _FIBONACCI & _MASK64) >> (65 - size.bit_length())
+
+
+def fitting_size(count: int, max_load: float, size: int = 8) -> int:
+    "Double `size` till `count` entries fit in it under `max_load`."
+    while count >= size * max_load:
+        size <<= 1
+    return size
+
+
+class IncrementalRehash(ty.Generic[T]):
+    """
+    Moves the chains of a bucket array into a bigger one a few buckets
+    at a time. Buckets of `source` below `index` have been migrated,
+    an entry lives in `source` if its old bucket was not migrated yet
+    and in `target` otherwise, so it is only ever looked up in one.
+    """
+
+    __slots__ = ("source", "target", "index", "_hashof")
+
+    def __init__(
+        self, source: Array[ValueList[T]], size: int, hashof: ty.Callable[[T], int]
+    ) -> None:
+        self.source = source
+        self.target: Array[ValueList[T]] = Array(size)
+        self.target.fill(ValueList)
+        self.index = 0
+        self._hashof = hashof
+
+    def done(self) -> bool:
+        return self.index >= self.source._size
+
+    def step(self, buckets: int) -> bool:
+        "Migrate up to `buckets` buckets, returns whether the rehash is done."
+        source, target, hashof = self.source, self.target, self._hashof
+        stop = min(self.index + buckets, source._size)
+        for index in range(self.index, stop):
+            for entry in source[index]:
+                target[bucket_index(hashof(entry), target._size)].append(entry)
+            source[index] = ty.cast(ValueList[T], None)
+        self.index = stop
+        return self.done()
+
+    def bucket(self, hash_value: int) -> ValueList[T]:
+        index = bucket_index(hash_value, self.source._size)
+        if index >= self.index:
+            return self.source[index]
+        return self.target[bucket_index(hash_value, self.target._size)]
+
+
+class ChainedBuckets(ty.Generic[T]):
+    """
+    The bucket array shared by the chained hash containers. Subclasses
+    set `_hashof` to read the cached hash of a stored entry and
+    `_payloadof` to read the objects it stores.
+    Given `rehash_steps`, growing the array is amortized over the next
+    insertions and deletions, each one migrating that many buckets,
+    instead of redistributing every entry at once. Lookups leave the
+    rehash where it is, iterating completes it.
+    """
+
+    _hashof: ty.Callable[[T], int]
+    _payloadof: ty.Callable[[T], tuple[object, ...]]
+    _rehash: IncrementalRehash[T] | None = None
+    _rehash_steps: int | None = None
+
+    def _init_buckets(self, capacity: int = 0, rehash_steps: int | None = None):
+        assert rehash_steps is None or rehash_steps > 0, rehash_steps
+        self._max_load: float = 0.7
+        size = fitting_size(capacity, self._max_load)
+        self._store: Array[ValueList[T]] = Array(size)
+        self._store.fill(ValueList)
+        self._used: int = 0
+        self._rehash = None
+        self._rehash_steps = rehash_steps
+
+    def _clear_buckets(self):
+        if self._rehash is not None:
+            self._store, self._rehash = self._rehash.target, None
+        self._store.fill(ValueList)
+        self._used = 0
+
+    def _bucket(self, hash_value: int) -> ValueList[T]:
+        "The chain `hash_value` belongs to, a lookup never moves a rehash."
+        rehash = self._rehash
+        if rehash is not None:
+            return rehash.bucket(hash_value)
+        return self._store[bucket_index(hash_value, self._store._size)]
+
+    def _write_bucket(self, hash_value: int) -> ValueList[T]:
+        "The chain to insert `hash_value` in or delete it from, moving a rehash along."
+        rehash = self._rehash
+        if rehash is not None and rehash.step(ty.cast(int, self._rehash_steps)):
+            self._store, self._rehash = rehash.target, None
+        return self._bucket(hash_value)
+
+    def _buckets(self, reverse: bool = False) -> ty.Iterator[ValueList[T]]:
+        """
+        Every chain. A rehash in progress is completed first, entries
+        would otherwise be yielded from both arrays or skipped.
+        """
+        self.rehash()
+        return reversed(self._store) if reverse else iter(self._store)
+
+    @property
+    def _size(self) -> int:
+        store = self._store if self._rehash is None else self._rehash.target
+        return store._size
+
+    @property
+    def _load_factor(self) -> float:
+        return self._used / self._size
+
+    @property
+    def rehashing(self) -> bool:
+        return self._rehash is not None
+
+    def rehash(self):
+        "Complete an incremental rehash in progress right away."
+        if self._rehash is not None:
+            self._rehash.step(self._rehash.source._size)
+            self._store, self._rehash = self._rehash.target, None
+
+    def _grow(self, size: int, eager: bool):
+        self.rehash()
+        self._rehash = IncrementalRehash(self._store, size, self._hashof)
+        if eager:
+            self.rehash()
+
+    def _reserve(self, count: int):
+        "Grow once, up front, so that `count` more entries fit."
+        size = fitting_size(self._used + count, self._max_load, self._size)
+        if size > self._size:
+            self._grow(size, eager=True)
+
+    def _stabilize(self):
+        if self._load_factor < self._max_load:
+            return
+        self._grow(self._size * 2, eager=self._rehash_steps is None)
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        """
+        Bytes held by the bucket arrays (both of them while rehashing),
+        the chain nodes, the entries and, given `payload`, the stored
+        objects. Also reports the load factor and a histogram of chain
+        lengths.
+        """
+        report = MemoryReport(type(self).__name__, self._used, {}, self._load_factor)
+        report.add("container", own_size(self))
+        stores = [self._store]
+        if self._rehash is not None:
+            report.add("container", sizeof(self._rehash))
+            stores = [self._rehash.source, self._rehash.target]
+        chains: dict[int, int] = {}
+        payloads: list[object] = []
+        for store in stores:
+            report.add("buckets", sizeof(store) + sizeof(store._list))
+            for slot in store._list:
+                report.add("buckets", sizeof(slot))
+                chain = slot.value
+                if chain is None:  # Migrated by the rehash
+                    continue
+                chains[len(chain)] = chains.get(len(chain), 0) + 1
+                # `sizeof(chain)` would count the chain nodes a second time
+                report.add("buckets", own_size(chain) + sizeof(chain._list))
+                for node in chain._list:
+                    entry = node.value
+                    report.add("chain nodes", sizeof(node))
+                    report.add("entries", sizeof(entry) + sizeof(self._hashof(entry)))
+                    if payload:
+                        payloads.extend(self._payloadof(entry))
+        if payload:
+            report.add("payload", payload_size(payloads))
+        report.chain_lengths = dict(sorted(chains.items()))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
@@ -1,3 +1,4 @@
+from .memory import MemoryReport, own_size, payload_size, sizeof
 import typing as ty
 
 
@@ -22,6 +23,8 @@ def isnone(value: ty.Any) -> bool:
 
 
 class Bucket(ty.Generic[T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: Optional[T] = sentinel) -> None:
         self.value: Optional[T] = value
 
@@ -79,3 +82,16 @@ class Array(ty.Generic[T]):
     def clear(self):
         for bucket in self._buckets:
             bucket.clear()
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self._size)
+        report.add("container", own_size(self))
+        report.add("buckets", sizeof(self._buckets))
+        report.add("buckets", sum(map(sizeof, self._buckets)))
+        if payload:
+            values = (value for value in self if value is not sentinel)
+            report.add("payload", payload_size(values))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
@@ -0,0 +1,183 @@
+"""
+Blocking variants of the queues in `queue`, for threads and for asyncio.
+
+They keep the store and ordering of the queue they extend, a
+`ThreadPriorityQueue` orders by its `heap_type` like the
+`PriorityQueue`. `append` and `pop` still raise `QueueFull` and
+`QueueEmpty` right away, `put` and `get` wait for room or an item.
+Every item put is a task, `join` waits till `task_done` was called
+once for each of them.
+"""
+
+from .queue import Queue, LIFOQueue, PriorityQueue, QueueEmpty, QueueFull
+import asyncio, threading, typing as ty
+
+_T = ty.TypeVar("_T")
+
+__all__ = (
+    "ThreadQueue",
+    "ThreadLIFOQueue",
+    "ThreadPriorityQueue",
+    "AsyncQueue",
+    "AsyncLIFOQueue",
+    "AsyncPriorityQueue",
+)
+
+
+class _ThreadSafe(Queue[_T]):
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, maxsize: int | None = None
+    ) -> None:
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._unfinished_tasks = 0
+        super().__init__(iterable, maxsize)
+
+    def put(self, value: _T, block: bool = True, timeout: float | None = None):
+        "Add `value`, waiting up to `timeout` seconds for room if `block`."
+        with self._not_full:
+            if block and not self._not_full.wait_for(
+                lambda: not self.full(), timeout
+            ):
+                raise QueueFull
+            super().append(value)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> _T:
+        "Remove the next item, waiting up to `timeout` seconds for it if `block`."
+        with self._not_empty:
+            if block and not self._not_empty.wait_for(
+                lambda: not self.empty(), timeout
+            ):
+                raise QueueEmpty
+            value = super().pop()
+            self._not_full.notify()
+            return value
+
+    def append(self, value: _T):
+        self.put(value, block=False)
+
+    def pop(self) -> _T:
+        return self.get(block=False)
+
+    def task_done(self):
+        with self._all_tasks_done:
+            if self._unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks -= 1
+            if not self._unfinished_tasks:
+                self._all_tasks_done.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        "Wait till every task is done, returns False on a timeout."
+        with self._all_tasks_done:
+            return self._all_tasks_done.wait_for(
+                lambda: not self._unfinished_tasks, timeout
+            )
+
+
+class ThreadQueue(_ThreadSafe[_T], Queue[_T]):
+    ...
+
+
+class ThreadLIFOQueue(_ThreadSafe[_T], LIFOQueue[_T]):
+    ...
+
+
+class ThreadPriorityQueue(_ThreadSafe[_T], PriorityQueue[_T]):
+    ...
+
+
+class _Async(Queue[_T]):
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, maxsize: int | None = None
+    ) -> None:
+        self._getters: list[asyncio.Future[None]] = []
+        self._putters: list[asyncio.Future[None]] = []
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._unfinished_tasks = 0
+        super().__init__(iterable, maxsize)
+
+    @staticmethod
+    def _wakeup_next(waiters: list[asyncio.Future[None]]):
+        while waiters:
+            waiter = waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(
+        self,
+        waiters: list[asyncio.Future[None]],
+        ready: ty.Callable[[], bool],
+        timeout: float | None,
+    ):
+        async with asyncio.timeout(timeout):
+            while not ready():
+                waiter = asyncio.get_running_loop().create_future()
+                waiters.append(waiter)
+                try:
+                    await waiter
+                except BaseException:
+                    waiter.cancel()
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+                    elif ready():  # Pass the wakeup on to the next waiter
+                        self._wakeup_next(waiters)
+                    raise
+
+    async def put(self, value: _T, timeout: float | None = None):
+        "Add `value`, waiting up to `timeout` seconds for room."
+        try:
+            await self._wait(self._putters, lambda: not self.full(), timeout)
+        except TimeoutError:
+            raise QueueFull from None
+        self.put_nowait(value)
+
+    async def get(self, timeout: float | None = None) -> _T:
+        "Remove the next item, waiting up to `timeout` seconds for it."
+        try:
+            await self._wait(self._getters, lambda: not self.empty(), timeout)
+        except TimeoutError:
+            raise QueueEmpty from None
+        return self.get_nowait()
+
+    def put_nowait(self, value: _T):
+        super().append(value)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    def get_nowait(self) -> _T:
+        value = super().pop()
+        self._wakeup_next(self._putters)
+        return value
+
+    append = put_nowait
+    pop = get_nowait
+
+    def task_done(self):
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if not self._unfinished_tasks:
+            self._finished.set()
+
+    async def join(self):
+        await self._finished.wait()
+
+
+class AsyncQueue(_Async[_T], Queue[_T]):
+    ...
+
+
+class AsyncLIFOQueue(_Async[_T], LIFOQueue[_T]):
+    ...
+
+
+class AsyncPriorityQueue(_Async[_T], PriorityQueue[_T]):
+    ...
@@ -1,54 +1,178 @@
+"""
+A disjoint set, a union-find forest.
+
+Every element points to a parent in its partition, the roots to
+themselves, `find` follows the pointers to the root halving the path
+on its way and `merge` hangs the smaller tree under the root of the
+larger one, so both are close to `O(1)` amortised. The members of a
+partition are also chained in a ring, merging two partitions splices
+their rings, so a partition is only gathered into a `set` when asked
+for, in `O(size)`.
+
+Given `dense`, elements are non negative ints and the forest lives in
+arrays indexed by them, otherwise in dicts keyed by the elements.
+"""
+
+from .memory import MemoryReport, own_size, payload_size, sizeof
+from array import array
 import typing as ty
 
+_ABSENT = -1  # The parent of the indices of a dense set that are not elements
+
+
+def _is_index(element: object) -> bool:
+    "An int a dense set can hold, bools are ints but never elements."
+    return isinstance(element, int) and not isinstance(element, bool)
+
 
 class DisjointSet[T]:
-    __slots__ = ("_set", "_size")
+    __slots__ = (
+        "_parent",
+        "_sizes",
+        "_next",
+        "_dense",
+        "_find",
+        "_find_pair",
+        "_elements",
+        "_size",
+    )
 
-    def __init__(self, iterable: ty.Iterable[T] | None = None) -> None:
-        self._set: dict[T, set[T]] = {}
+    def __init__(
+        self, iterable: ty.Iterable[T] | None = None, *, dense: bool = False
+    ) -> None:
+        self._dense = dense
+        # Dicts keyed by the elements or arrays indexed by them
+        self._parent: ty.Any
+        self._sizes: ty.Any  # Only up to date for the roots
+        self._next: ty.Any  # The partition rings
+        self._init_forest()
+        # Dense elements are checked once up front, the walks never check
+        self._find: ty.Callable[[T], T]
+        self._find_pair: ty.Callable[[T, T], tuple[T, T]]
+        if dense:
+            self._find, self._find_pair = self._dense_root, self._dense_roots
+        else:
+            self._find, self._find_pair = self._root, self._roots
+        self._elements: int = 0
         self._size: int = 0
         if iterable is not None:
             self.extend(iterable)
 
+    def _init_forest(self):
+        if self._dense:
+            self._parent, self._sizes, self._next = array("q"), array("q"), array("q")
+        else:
+            self._parent, self._sizes, self._next = {}, {}, {}
+
+    @property
+    def dense(self) -> bool:
+        return self._dense
+
     @property
     def elements(self) -> int:
-        return len(self._set)
+        return self._elements
 
     def __len__(self) -> int:
         return self._size
 
+    def _members(self) -> ty.Iterator[T]:
+        if self._dense:
+            parent = self._parent
+            return (e for e in range(len(parent)) if parent[e] >= 0)
+        return iter(self._parent)
+
     def __iter__(self) -> ty.Iterator[set[T]]:
-        seen: set[int] = set()
-        for partition in self._set.values():
-            if id(partition) not in seen:
-                seen.add(id(partition))
-                yield partition
+        parent = self._parent
+        for element in self._members():
+            if parent[element] == element:
+                yield self._ring(element)
 
     def contains(self, element: T):
-        return element in self._set
+        if self._dense:
+            return (
+                _is_index(element)
+                and 0 <= element < len(self._parent)
+                and self._parent[element] >= 0
+            )
+        return element in self._parent
 
     __contains__ = contains
 
     def add(self, element: T):
-        if element in self._set:
+        if self.contains(element):
             raise ValueError(element)
-        self._set[element] = {element}
+        if self._dense:
+            if not _is_index(element) or element < 0:
+                raise TypeError(f"a dense disjoint set holds ints >= 0: {element!r}")
+            missing = element + 1 - len(self._parent)
+            if missing > 0:
+                for store in self._parent, self._sizes, self._next:
+                    store.extend(array("q", [_ABSENT]) * missing)
+        self._parent[element] = element
+        self._sizes[element] = 1
+        self._next[element] = element
+        self._elements += 1
         self._size += 1
 
     def extend(self, iterable: ty.Iterable[T]):
         for element in iterable:
             self.add(element)
 
+    def _root(self, element: T) -> T:
+        "The root of `element`, a missing key fails the first lookup."
+        parent = self._parent
+        up = parent[element]
+        while up != element:
+            # Path halving, every other node is pointed to its grandparent
+            grandparent = parent[up]
+            parent[element] = grandparent
+            element, up = grandparent, parent[grandparent]
+        return element
+
+    def _roots(self, e1: T, e2: T) -> tuple[T, T]:
+        "The roots of `e1` and `e2`, without a walk for the ones a step away."
+        parent = self._parent
+        r1, r2 = parent[e1], parent[e2]
+        if parent[r1] != r1:
+            r1 = self._root(r1)
+        if parent[r2] != r2:
+            r2 = self._root(r2)
+        return r1, r2
+
+    def _check_dense(self, element: T):
+        # Negative ints would index the arrays from their end
+        parent = self._parent
+        if not (
+            _is_index(element)
+            and 0 <= element < len(parent)
+            and parent[element] >= 0
+        ):
+            raise KeyError(element)
+
+    def _dense_root(self, element: T) -> T:
+        self._check_dense(element)
+        return self._root(element)
+
+    def _dense_roots(self, e1: T, e2: T) -> tuple[T, T]:
+        self._check_dense(e1)
+        self._check_dense(e2)
+        return self._roots(e1, e2)
+
+    def find(self, element: T) -> T:
+        "The root representing the partition of `element`."
+        return self._find(element)
+
     def merge(self, e1: T, e2: T):
-        p1 = self._set[e1]
-        p2 = self._set[e2]
-        if p1 is p2:
+        r1, r2 = self._find_pair(e1, e2)
+        if r1 == r2:
             return
-        if len(p1) > len(p2):
-            p1, p2 = p2, p1
-        for e in p1:
-            self._set[e] = p2
-        p2 |= p1
+        sizes = self._sizes
+        if sizes[r1] > sizes[r2]:
+            r1, r2 = r2, r1
+        self._parent[r1] = r2
+        sizes[r2] += sizes[r1]
+        _next = self._next
+        _next[r1], _next[r2] = _next[r2], _next[r1]  # Splice the rings
         self._size -= 1
 
     def merge_all(self, e1: T, *e2s: T):
@@ -56,7 +180,7 @@ class DisjointSet[T]:
             self.merge(e1, e2)
 
     def merge_if(self, predicate: ty.Callable[[T], object | bool]):
-        targets = filter(predicate, self._set)
+        targets = filter(predicate, self._members())
         sentinel = object()
         e1 = ty.cast(T, next(targets, sentinel))
         if e1 is not sentinel:
@@ -64,26 +188,82 @@ class DisjointSet[T]:
                 self.merge(e1, e2)
 
     def same(self, e1: T, e2: T):
-        return self._set[e1] is self._set[e2]
+        r1, r2 = self._find_pair(e1, e2)
+        return r1 == r2
 
     def disjoint(self, e1: T, e2: T):
-        return self._set[e1] is not self._set[e2]
+        r1, r2 = self._find_pair(e1, e2)
+        return r1 != r2
 
     def clear(self):
-        self._set.clear()
+        self._init_forest()
+        self._elements = 0
+        self._size = 0
+
+    def _ring(self, element: T) -> set[T]:
+        _next = self._next
+        members, member = {element}, _next[element]
+        while member != element:
+            members.add(member)
+            member = _next[member]
+        return members
 
-    def partition(self, element: T):
-        return self._set[element]
+    def partition(self, element: T) -> set[T]:
+        "The members of the partition of `element`, gathered in a new set."
+        if not self.contains(element):
+            raise KeyError(element)
+        return self._ring(element)
+
+    def partition_size(self, element: T) -> int:
+        return self._sizes[self._find(element)]
+
+    def _discard(self, elements: ty.Iterable[T]):
+        parent, sizes, _next = self._parent, self._sizes, self._next
+        for element in elements:
+            if self._dense:
+                parent[element] = sizes[element] = _next[element] = _ABSENT
+            else:
+                del parent[element], sizes[element], _next[element]
+            self._elements -= 1
 
     def remove(self, element: T):
-        self._set[element].remove(element)
-        del self._set[element]
+        """
+        Remove `element` from its partition, the rest of which is rebuilt
+        into a tree of depth one, `O(size)` of the partition.
+        """
+        members = self.partition(element)
+        members.remove(element)
+        self._discard((element,))
+        if not members:
+            self._size -= 1
+            return
+        root = next(iter(members))
+        parent, _next = self._parent, self._next
+        previous = root
+        for member in members:
+            parent[member] = root
+            if member != root:
+                _next[previous] = member
+                previous = member
+        _next[previous] = root
+        self._sizes[root] = len(members)
 
     def remove_partition(self, element: T):
-        for elem in self._set[element]:
-            del self._set[elem]
+        self._discard(self.partition(element))
         self._size -= 1
 
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self.elements)
+        report.add("container", own_size(self))
+        report.add("forest", sum(map(sizeof, (self._parent, self._sizes))))
+        report.add("rings", sizeof(self._next))
+        if payload and not self._dense:
+            report.add("payload", payload_size(self._parent))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
     def unique(self, element: T):
         self.remove(element)
         self.add(element)
@@ -1,4 +1,9 @@
-from ._util import ValueList, myhash, Hashable, Array
+from ._util import ChainedBuckets, Hashable, bucket_index, fitting_size
+from ._util import myhash, myhash_many
+from .memory import MemoryReport, own_size, payload_size, sizeof
+from abc import abstractmethod
+from itertools import chain, islice
+from operator import attrgetter
 import typing as ty
 
 _KeyType = ty.TypeVar("_KeyType", str, int, float, bytes, Hashable)
@@ -16,66 +21,88 @@ def _identity(item: _T) -> _T:
 
 
 _missing = _MISSING()
+_BATCH = 4096  # Keys `update` hashes at once
 
 
 class KeyValueNode(ty.Generic[_KeyType, _ValueType]):
-    def __init__(self, key: _KeyType, value: _ValueType) -> None:
+    __slots__ = ("key", "value", "hash")
+
+    def __init__(
+        self, key: _KeyType, value: _ValueType, hash: int | None = None
+    ) -> None:
         self.key = key
         self.value = value
+        self.hash = myhash(key) if hash is None else hash
 
     def __myhash__(self) -> int:
-        return myhash(self.key)
+        return self.hash
 
+    def matches(self, key: _KeyType, hash: int) -> bool:
+        "Compare the cached hashes first, keys only when they collide."
+        return self.hash == hash and (self.key is key or self.key == key)
 
-class HashTable(ty.MutableMapping[_KeyType, _ValueType]):
-    def __init__(
-        self, iterable: ty.Iterable[tuple[_KeyType, _ValueType]] | None = None, /
-    ) -> None:
-        self._store: Array[ValueList[KeyValueNode[_KeyType, _ValueType]]] = Array(8)
-        self._max_load: float = 0.7
-        self._store.fill(ValueList)
-        self._used: int = 0
-        if iterable is not None:
-            self.update(iterable)
 
-    def _setitem(self, key: _KeyType, value: _ValueType):
-        _hash = myhash(key)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for slot in vlist:
-            if myhash(slot) == _hash:
-                slot.value = value
-                return
-        node = KeyValueNode(key, value)
-        vlist.append(node)
-        self._used += 1
-        self._stabilize()
+class HashTableABC(ty.MutableMapping[_KeyType, _ValueType]):
+    """
+    The mapping methods the hash tables share, written over the lookup
+    primitives and the iterators each storage layout implements.
+    """
 
-    def _delitem(self, key: _KeyType) -> KeyValueNode[_KeyType, _ValueType] | _MISSING:
-        _hash = myhash(key)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for index, slot in enumerate(vlist):
-            if myhash(slot) == _hash:
-                node = vlist.delvalue(index)
-                self._used -= 1
-                return node
-        return _missing
+    _used: int
+
+    @abstractmethod
+    def _setitem(self, key: _KeyType, value: _ValueType, _hash: int | None = None):
+        ...
 
+    @abstractmethod
+    def _delitem(self, key: _KeyType) -> _ValueType | _MISSING:
+        "Remove `key`, returns its value."
+        ...
+
+    @abstractmethod
     def _getitem(self, key: _KeyType) -> _ValueType | _MISSING:
-        _hash = myhash(key)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for slot in vlist:
-            if myhash(slot) == _hash:
-                return slot.value
-        return _missing
+        ...
+
+    @abstractmethod
+    def _reserve(self, count: int):
+        ...
+
+    @abstractmethod
+    def values(self) -> ty.Generator[_ValueType, None, None]:
+        ...
+
+    @abstractmethod
+    def keys(self) -> ty.Generator[_KeyType, None, None]:
+        ...
+
+    @abstractmethod
+    def items(self) -> ty.Generator[tuple[_KeyType, _ValueType], None, None]:
+        ...
+
+    @abstractmethod
+    def __reversed__(self) -> ty.Generator[_ValueType, None, None]:
+        ...
+
+    @abstractmethod
+    def popitem(self) -> tuple[_KeyType, _ValueType]:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        ...
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
 
     def __contains__(self, key: object) -> bool:
         return not isinstance(self._getitem(ty.cast(_KeyType, key)), _MISSING)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, HashTable):
+        if not isinstance(other, HashTableABC):
             return False
         keys: set[_KeyType] = set(*other, *self)
         for key in keys:
@@ -95,48 +122,23 @@ class HashTable(ty.MutableMapping[_KeyType, _ValueType]):
             return default
         return value
 
-    def _iter(
-        self,
-        transform: ty.Callable[[KeyValueNode[_KeyType, _ValueType]], _T],
-        prep_store=_identity,
-        prep_vlist=_identity,
-    ) -> ty.Generator[_T, None, None]:
-        for vlist in prep_store(self._store):
-            for slot in prep_vlist(vlist):
-                yield transform(slot)
-
-    def values(self) -> ty.Generator[_ValueType, None, None]:
-        return self._iter(lambda slot: slot.value)
-
-    def keys(self) -> ty.Generator[_KeyType, None, None]:
-        return self._iter(lambda slot: slot.key)
-
-    def items(self) -> ty.Generator[tuple[_KeyType, _ValueType], None, None]:
-        return self._iter(lambda slot: (slot.key, slot.value))
-
-    __iter__ = keys
-
-    def __reversed__(self) -> ty.Generator[_ValueType, None, None]:
-        return self._iter(lambda slot: slot.value, reversed, reversed)
-
     def __setitem__(self, key: _KeyType, value: _ValueType) -> None:
         self._setitem(key, value)
 
     def __delitem__(self, key: _KeyType) -> None:
-        node = self._delitem(key)
-        if isinstance(node, _MISSING):
+        if isinstance(self._delitem(key), _MISSING):
             raise KeyError(key)
 
     def __getitem__(self, key: _KeyType) -> _ValueType:
         return ty.cast(_ValueType, self.get(key))
 
     def pop(self, key: _KeyType, default: _T = _missing) -> _ValueType | _T:
-        node = self._delitem(key)
-        if isinstance(node, _MISSING):
+        value = self._delitem(key)
+        if isinstance(value, _MISSING):
             if isinstance(default, _MISSING):
                 raise KeyError(key)
             return default
-        return node.value
+        return value
 
     def setdefault(self, key: _KeyType, default: _ValueType) -> _ValueType:
         value = self._getitem(key)
@@ -147,51 +149,361 @@ class HashTable(ty.MutableMapping[_KeyType, _ValueType]):
 
     def update(
         self,
-        other: "HashTable[_KeyType, _ValueType] | ty.Iterable[tuple[_KeyType, _ValueType]]",
+        other: "HashTableABC[_KeyType, _ValueType] | ty.Iterable[tuple[_KeyType, _ValueType]]",
     ):
-        iterable = other.items() if isinstance(other, HashTable) else other
-        for key, value in iterable:
-            self._setitem(key, value)  # type: ignore
+        """
+        Grow once up front when the size of `other` is known. Items are
+        read lazily, their keys hashed in batches of `_BATCH`.
+        """
+        if isinstance(other, ty.Mapping):
+            other = other.items()
+        if isinstance(other, ty.Sized):
+            self._reserve(len(other))
+        items = iter(other)
+        while batch := [*islice(items, _BATCH)]:
+            hashes = myhash_many([key for key, _ in batch])
+            for (key, value), _hash in zip(batch, hashes):
+                self._setitem(key, value, _hash)
+
+    def __str__(self) -> str:
+        items = [f"{key!r}: {value!r}" for key, value in self.items()]
+        return "{" + ", ".join(items) + "}"
+
+    __repr__ = __str__
+
+    @classmethod
+    def fromkeys(
+        cls: type["HashTableABC[_U, _T]"],
+        iterable: ty.Iterable[_U],
+        value: _T | _MISSING = _missing,
+    ) -> "HashTableABC[_U, _T]":
+        value = ty.cast(_T, None) if isinstance(value, _MISSING) else value
+        capacity = len(iterable) if isinstance(iterable, ty.Sized) else 0
+        return cls(map(lambda key: (key, value), iterable), capacity=capacity)
+
+
+class HashTable(
+    ChainedBuckets[KeyValueNode[_KeyType, _ValueType]],
+    HashTableABC[_KeyType, _ValueType],
+):
+    _hashof = attrgetter("hash")
+    _payloadof = attrgetter("key", "value")
+
+    """
+    Separate chaining, each bucket a linked chain of `KeyValueNode`. The
+    open addressing backend is a class of its own, `CompactHashTable`,
+    sharing `HashTableABC` rather than this class, `HashTable.compact`
+    builds one.
+    """
+
+    def __init__(
+        self,
+        iterable: ty.Iterable[tuple[_KeyType, _ValueType]] | None = None,
+        /,
+        *,
+        capacity: int = 0,
+        rehash_steps: int | None = None,
+    ) -> None:
+        self._init_buckets(capacity, rehash_steps)
+        if iterable is not None:
+            self.update(iterable)
+
+    @staticmethod
+    def compact(
+        iterable: ty.Iterable[tuple[_U, _T]] | None = None,
+        /,
+        *,
+        capacity: int = 0,
+    ) -> "CompactHashTable[_U, _T]":
+        "A table with the open addressing backend, `CompactHashTable`."
+        return CompactHashTable(iterable, capacity=capacity)
+
+    def _setitem(self, key: _KeyType, value: _ValueType, _hash: int | None = None):
+        _hash = myhash(key) if _hash is None else _hash
+        vlist = self._write_bucket(_hash)
+        for slot in vlist:
+            if slot.matches(key, _hash):
+                slot.value = value
+                return
+        vlist.append(KeyValueNode(key, value, _hash))
+        self._used += 1
+        self._stabilize()
+
+    def _delitem(self, key: _KeyType) -> _ValueType | _MISSING:
+        _hash = myhash(key)
+        vlist = self._write_bucket(_hash)
+        for index, slot in enumerate(vlist):
+            if slot.matches(key, _hash):
+                vlist.delvalue(index)
+                self._used -= 1
+                return slot.value
+        return _missing
+
+    def _getitem(self, key: _KeyType) -> _ValueType | _MISSING:
+        _hash = myhash(key)
+        vlist = self._bucket(_hash)
+        for slot in vlist:
+            if slot.matches(key, _hash):
+                return slot.value
+        return _missing
+
+    def _iter(
+        self,
+        transform: ty.Callable[[KeyValueNode[_KeyType, _ValueType]], _T],
+        reverse: bool = False,
+    ) -> ty.Generator[_T, None, None]:
+        prep_vlist = reversed if reverse else _identity
+        for vlist in self._buckets(reverse):
+            for slot in prep_vlist(vlist):
+                yield transform(slot)
+
+    def values(self) -> ty.Generator[_ValueType, None, None]:
+        return self._iter(lambda slot: slot.value)
+
+    def keys(self) -> ty.Generator[_KeyType, None, None]:
+        return self._iter(lambda slot: slot.key)
+
+    def items(self) -> ty.Generator[tuple[_KeyType, _ValueType], None, None]:
+        return self._iter(lambda slot: (slot.key, slot.value))
+
+    __iter__ = keys
+
+    def __reversed__(self) -> ty.Generator[_ValueType, None, None]:
+        return self._iter(lambda slot: slot.value, reverse=True)
 
     def popitem(self) -> tuple[_KeyType, _ValueType]:
-        rev_items = self._iter(lambda s: (s.key, s.value), reversed, reversed)
+        rev_items = self._iter(lambda s: (s.key, s.value), reverse=True)
         for key, value in rev_items:
             self.pop(key)
             return key, value
         raise KeyError("Dictionary is empty.")
 
     def clear(self) -> None:
-        self._store.clear()
-        self._store.fill(ValueList)
-        self._used = 0
+        self._clear_buckets()
 
-    def __str__(self) -> str:
-        items = [f"{key!r}: {value!r}" for key, value in self.items()]
-        return "{" + ", ".join(items) + "}"
 
-    __repr__ = __str__
+_EMPTY = -1
+_DUMMY = -2
+_PERTURB_SHIFT = 5
+
+
+def _indices_typecode(size: int) -> str:
+    if size <= 0x80:
+        return "b"
+    if size <= 0x8000:
+        return "h"
+    if size <= 0x80000000:
+        return "i"
+    return "q"
+
+
+def _new_indices(size: int):
+    from array import array
+
+    return array(_indices_typecode(size), [_EMPTY]) * size
+
+
+class CompactHashTable(HashTableABC[_KeyType, _ValueType]):
+    """
+    Open addressing variant of the `HashTable`, laid out like CPython's dict.
+    A sparse `indices` array maps probe slots to positions in dense,
+    insertion ordered entry arrays holding the hashes, keys and values.
+    No node objects are created per entry and a lookup follows a short
+    probe sequence instead of walking a chain.
+    """
+
+    def __init__(
+        self,
+        iterable: ty.Iterable[tuple[_KeyType, _ValueType]] | None = None,
+        /,
+        *,
+        capacity: int = 0,
+    ) -> None:
+        from array import array
+
+        self._max_load: float = 0.7
+        self._initial_size = fitting_size(capacity, self._max_load)  # Kept by `clear`
+        self._indices = _new_indices(self._initial_size)
+        self._hashes = array("Q")
+        self._keys: list[_KeyType | _MISSING] = []
+        self._values: list[_ValueType | _MISSING] = []
+        self._used: int = 0
+        self._fill: int = 0
+        if iterable is not None:
+            self.update(iterable)
+
+    def _lookup(self, key: _KeyType, _hash: int) -> tuple[int, int]:
+        """
+        Returns the probe slot and the entry index of `key`,
+        or the first empty slot and `_EMPTY` when it is absent.
+        The probe sequence is CPython's, `slot * 5 + 1` mixed with the
+        higher bits of the hash as they are shifted in.
+        """
+        indices, hashes, keys = self._indices, self._hashes, self._keys
+        mask = len(indices) - 1
+        perturb = _hash
+        slot = bucket_index(_hash, mask + 1)
+        while True:
+            index = indices[slot]
+            if index == _EMPTY:
+                return slot, _EMPTY
+            if index != _DUMMY and hashes[index] == _hash:
+                _key = keys[index]
+                if _key is key or _key == key:
+                    return slot, index
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def _probes(self, index: int) -> int:
+        "The number of probes the live entry at `index` takes to be found."
+        indices = self._indices
+        mask = len(indices) - 1
+        perturb = _hash = self._hashes[index]
+        slot, probes = bucket_index(_hash, mask + 1), 1
+        while indices[slot] != index:
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+            probes += 1
+        return probes
+
+    def _setitem(self, key: _KeyType, value: _ValueType, _hash: int | None = None):
+        _hash = myhash(key) if _hash is None else _hash
+        slot, index = self._lookup(key, _hash)
+        if index != _EMPTY:
+            self._values[index] = value
+            return
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self._used += 1
+        self._fill += 1
+        self._stabilize()
+
+    def _delitem(self, key: _KeyType) -> _ValueType | _MISSING:
+        _hash = myhash(key)
+        slot, index = self._lookup(key, _hash)
+        if index == _EMPTY:
+            return _missing
+        value = self._values[index]
+        self._indices[slot] = _DUMMY
+        self._keys[index] = self._values[index] = _missing
+        self._used -= 1
+        while self._keys and self._keys[-1] is _missing:
+            self._hashes.pop()
+            self._keys.pop()
+            self._values.pop()
+        return value
+
+    def _getitem(self, key: _KeyType) -> _ValueType | _MISSING:
+        _hash = myhash(key)
+        _, index = self._lookup(key, _hash)
+        return _missing if index == _EMPTY else self._values[index]
+
+    def _entries(self, reverse: bool = False) -> ty.Iterator[int]:
+        indices = range(len(self._keys))
+        keys = self._keys
+        return (
+            i
+            for i in (reversed(indices) if reverse else indices)
+            if keys[i] is not _missing
+        )
+
+    def values(self) -> ty.Generator[_ValueType, None, None]:
+        for index in self._entries():
+            yield ty.cast(_ValueType, self._values[index])
+
+    def keys(self) -> ty.Generator[_KeyType, None, None]:
+        for index in self._entries():
+            yield ty.cast(_KeyType, self._keys[index])
+
+    def items(self) -> ty.Generator[tuple[_KeyType, _ValueType], None, None]:
+        for index in self._entries():
+            yield ty.cast(
+                tuple[_KeyType, _ValueType], (self._keys[index], self._values[index])
+            )
+
+    __iter__ = keys
+
+    def __reversed__(self) -> ty.Generator[_ValueType, None, None]:
+        for index in self._entries(reverse=True):
+            yield ty.cast(_ValueType, self._values[index])
+
+    def popitem(self) -> tuple[_KeyType, _ValueType]:
+        for index in self._entries(reverse=True):
+            key, value = self._keys[index], self._values[index]
+            self._delitem(ty.cast(_KeyType, key))
+            return ty.cast(tuple[_KeyType, _ValueType], (key, value))
+        raise KeyError("Dictionary is empty.")
+
+    def clear(self) -> None:
+        self._indices = _new_indices(self._initial_size)
+        del self._hashes[:]
+        self._keys.clear()
+        self._values.clear()
+        self._used = 0
+        self._fill = 0
 
     @property
     def _size(self) -> int:
-        return self._store._size
+        return len(self._indices)
 
     @property
     def _load_factor(self) -> float:
-        return self._used / self._size
+        return self._fill / self._size
 
     def _stabilize(self):
         if self._load_factor < self._max_load:
             return
-        values: list[tuple[_KeyType, _ValueType]] = [*self.items()]
-        self._store._grow(self._size)
-        self.clear()
-        self.update(values)
-
-    @classmethod
-    def fromkeys(
-        cls: type['HashTable[_U, _T]'],
-        iterable: ty.Iterable[_U],
-        value: _T | _MISSING = _missing,
-    ) -> "HashTable[_U, _T]":
-        value = ty.cast(_T, None) if isinstance(value, _MISSING) else value
-        return cls(map(lambda key: (key, value), iterable))
+        size = self._size
+        while self._used * 2 >= size * self._max_load:
+            size <<= 1
+        self._resize(size)
+
+    def _reserve(self, count: int):
+        size = fitting_size(self._used + count, self._max_load, self._size)
+        if size > self._size:
+            self._resize(size)
+
+    def _resize(self, size: int):
+        "Compact the entries and rebuild the indices, no key is rehashed."
+        from array import array
+
+        live = [*self._entries()]
+        hashes = array("Q", (self._hashes[i] for i in live))
+        self._keys = [self._keys[i] for i in live]
+        self._values = [self._values[i] for i in live]
+        self._hashes = hashes
+        self._indices = indices = _new_indices(size)
+        mask = size - 1
+        for index, _hash in enumerate(hashes):
+            perturb = _hash
+            slot = bucket_index(_hash, size)
+            while indices[slot] != _EMPTY:
+                perturb >>= _PERTURB_SHIFT
+                slot = (slot * 5 + perturb + 1) & mask
+            indices[slot] = index
+        self._fill = self._used
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        """
+        Bytes held by the indices, the entry arrays and, given `payload`,
+        the stored objects. The histogram counts the probes each live
+        entry takes to be found.
+        """
+        report = MemoryReport(type(self).__name__, self._used, {}, self._load_factor)
+        report.add("container", own_size(self))
+        report.add("indices", sizeof(self._indices))
+        entries = sizeof(self._hashes) + sizeof(self._keys) + sizeof(self._values)
+        report.add("entries", entries)
+        probes: dict[int, int] = {}
+        for index in self._entries():
+            count = self._probes(index)
+            probes[count] = probes.get(count, 0) + 1
+        if payload:
+            live = [*self._entries()]
+            keys = (self._keys[index] for index in live)
+            values = (self._values[index] for index in live)
+            report.add("payload", payload_size(chain(keys, values)))
+        report.chain_lengths = dict(sorted(probes.items()))
+        return report
@@ -1,6 +1,25 @@
-import typing as ty, enum
-
-__all__ = "heapify", "HeapType", "heappush", "heappop", "setheaptype", "getheaptype"
+from .memory import MemoryReport, own_size, payload_size, sizeof
+from array import array
+import heapq, typing as ty, enum
+
+__all__ = (
+    "heapify",
+    "HeapType",
+    "heappush",
+    "heappop",
+    "heappushmany",
+    "heappopmany",
+    "heappushpop",
+    "heapreplace",
+    "nsmallest",
+    "nlargest",
+    "merge",
+    "IndexedHeap",
+    "HeapHandle",
+    "ArrayHeap",
+    "setheaptype",
+    "getheaptype",
+)
 
 _T = ty.TypeVar("_T")
 _CompareF = ty.Callable[[_T, _T], bool]
@@ -71,6 +90,171 @@ _cmp_heap_type_map: dict[HeapType, _CompareF] = {
     HeapType.MINEQ: _min_heap_eq,
 }
 
+_SiftUp = ty.Callable[[ty.MutableSequence[_T], int], None]
+_SiftDown = ty.Callable[[ty.MutableSequence[_T], int, int], None]
+
+# The comparison of a heap type is pasted in, no call per comparison.
+# An item is sifted through a hole, moved once instead of at every level.
+_SIFT_TEMPLATE = """
+def siftup(heap, index):
+    value = heap[index]
+    while index > 0:
+        parent = (index - 1) >> 1
+        parent_value = heap[parent]
+        if parent_value {swaps} value:
+            heap[index] = parent_value
+            index = parent
+        else:
+            break
+    heap[index] = value
+
+
+def siftdown(heap, index, size):
+    value = heap[index]
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size and not heap[right] {swaps} heap[child]:
+            child = right
+        child_value = heap[child]
+        if value {swaps} child_value:
+            heap[index] = child_value
+            index = child
+            child = 2 * index + 1
+        else:
+            break
+    heap[index] = value
+"""
+
+
+# The same sifts over `HeapHandle`s, every handle moved learns its index.
+_INDEXED_SIFT_TEMPLATE = """
+def siftup(heap, index):
+    handle = heap[index]
+    value = handle.value
+    while index > 0:
+        parent = (index - 1) >> 1
+        parent_handle = heap[parent]
+        if parent_handle.value {swaps} value:
+            heap[index] = parent_handle
+            parent_handle.index = index
+            index = parent
+        else:
+            break
+    heap[index] = handle
+    handle.index = index
+
+
+def siftdown(heap, index, size):
+    handle = heap[index]
+    value = handle.value
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size and not heap[right].value {swaps} heap[child].value:
+            child = right
+        child_handle = heap[child]
+        if value {swaps} child_handle.value:
+            heap[index] = child_handle
+            child_handle.index = index
+            index = child
+            child = 2 * index + 1
+        else:
+            break
+    heap[index] = handle
+    handle.index = index
+"""
+
+# The same sifts over parallel priority and payload arrays, comparing
+# raw priorities and moving the payload along.
+_ARRAY_SIFT_TEMPLATE = """
+def siftup(priorities, payloads, index):
+    priority, payload = priorities[index], payloads[index]
+    while index > 0:
+        parent = (index - 1) >> 1
+        parent_priority = priorities[parent]
+        if parent_priority {swaps} priority:
+            priorities[index] = parent_priority
+            payloads[index] = payloads[parent]
+            index = parent
+        else:
+            break
+    priorities[index], payloads[index] = priority, payload
+
+
+def siftdown(priorities, payloads, index, size):
+    priority, payload = priorities[index], payloads[index]
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size and not priorities[right] {swaps} priorities[child]:
+            child = right
+        child_priority = priorities[child]
+        if priority {swaps} child_priority:
+            priorities[index] = child_priority
+            payloads[index] = payloads[child]
+            index = child
+            child = 2 * index + 1
+        else:
+            break
+    priorities[index], payloads[index] = priority, payload
+"""
+
+
+def _make_sifters(swaps: str, template: str = _SIFT_TEMPLATE) -> tuple[ty.Any, ty.Any]:
+    """
+    Sift routines for a heap where a parent and child are swapped
+    when `parent <swaps> child`, same as the `_cmp_heap_type_map` comparers.
+    """
+    namespace: dict[str, ty.Any] = {}
+    exec(template.format(swaps=swaps), namespace)
+    return namespace["siftup"], namespace["siftdown"]
+
+
+_swaps: dict[HeapType, str] = {
+    HeapType.MIN: ">",
+    HeapType.MAX: "<",
+    HeapType.MAXEQ: "<=",
+    HeapType.MINEQ: ">=",
+}
+_sifters: dict[HeapType, tuple[_SiftUp, _SiftDown]] = {
+    heap_type: _make_sifters(swaps) for heap_type, swaps in _swaps.items()
+}
+_indexed_sifters: dict[HeapType, tuple[_SiftUp, _SiftDown]] = {
+    heap_type: _make_sifters(swaps, _INDEXED_SIFT_TEMPLATE)
+    for heap_type, swaps in _swaps.items()
+}
+_array_sifters: dict[HeapType, tuple[ty.Callable[..., None], ...]] = {
+    heap_type: _make_sifters(swaps, _ARRAY_SIFT_TEMPLATE)
+    for heap_type, swaps in _swaps.items()
+}
+
+
+
+def _heapq_max(name: str) -> ty.Callable[..., ty.Any] | None:
+    "heapq's max-heap `name`, public from python 3.14, private before."
+    return getattr(heapq, name, None) or getattr(heapq, f"_{name}", None)
+
+
+# Plain lists of the strict heap types take heapq's C loops, they leave
+# the same layouts as the sifts above. The EQ types have no C twin.
+_list_heapify = {
+    HeapType.MIN: heapq.heapify,
+    HeapType.MAX: _heapq_max("heapify_max"),
+}
+_list_heappush = {
+    HeapType.MIN: heapq.heappush,
+    HeapType.MAX: _heapq_max("heappush_max"),
+}
+_list_heappop = {
+    HeapType.MIN: heapq.heappop,
+    HeapType.MAX: _heapq_max("heappop_max"),
+}
+_list_heapreplace = {
+    HeapType.MIN: heapq.heapreplace,
+    HeapType.MAX: _heapq_max("heapreplace_max"),
+}
+
 _default_heap_type: HeapType = HeapType.MIN
 
 
@@ -98,17 +282,24 @@ def heapify(heap: ty.MutableSequence, heap_type: ty.Optional[HeapType] = None) -
     Convert a mutable sequence (eg list) to a heap
     (MIN-HEAP default or specify using param heap_type)
     """
-    comparer, size = _cmp_heap_type_map[heap_type or _default_heap_type], len(heap)
+    heap_type = heap_type or _default_heap_type
+    if type(heap) is list and (fast := _list_heapify.get(heap_type)) is not None:
+        return fast(heap)
+    _, siftdown = _sifters[heap_type]
+    size = len(heap)
     for index in reversed(range(size // 2)):
-        _siftdown(heap, comparer, index, size)
+        siftdown(heap, index, size)
 
 
 def heappush(
     heap: ty.MutableSequence[_T], value: _T, heap_type: ty.Optional[HeapType] = None
 ) -> None:
-    comparer, index = _cmp_heap_type_map[heap_type or _default_heap_type], len(heap)
+    heap_type = heap_type or _default_heap_type
+    if type(heap) is list and (fast := _list_heappush.get(heap_type)) is not None:
+        return fast(heap, value)
+    siftup, _ = _sifters[heap_type]
     heap.append(value)
-    _siftup(heap, comparer, index)
+    siftup(heap, len(heap) - 1)
 
 
 def heappop(
@@ -116,36 +307,404 @@ def heappop(
     index: int | None = None,
     heap_type: ty.Optional[HeapType] = None,
 ) -> _T:
-    comparer, index = _cmp_heap_type_map[heap_type or _default_heap_type], index or 0
-    heap[index], heap[-1] = heap[-1], heap[index]
-    value = heap.pop()
-    _siftdown(heap, comparer, index, len(heap))
+    heap_type = heap_type or _default_heap_type
+    index = index or 0
+    if index < 0:
+        index += len(heap)
+    if index == 0 and type(heap) is list:
+        if (fast := _list_heappop.get(heap_type)) is not None:
+            return fast(heap)
+    siftup, siftdown = _sifters[heap_type]
+    last = heap.pop()
+    if index == len(heap):
+        return last
+    value, heap[index] = heap[index], last
+    # Off the root, the last value may belong above the hole as well as below
+    parent = (index - 1) >> 1
+    if index > 0 and _cmp_heap_type_map[heap_type](heap[parent], last):
+        siftup(heap, index)
+    else:
+        siftdown(heap, index, len(heap))
     return value
 
 
-def _siftup(heap: ty.MutableSequence[_T], comparer: _CompareF[_T], index: int):
-    while index > 0:
+def heappushmany(
+    heap: ty.MutableSequence[_T],
+    values: ty.Iterable[_T],
+    heap_type: ty.Optional[HeapType] = None,
+) -> None:
+    """
+    Push all `values` to the heap. Pushing `k` values one by one takes
+    `O(k*log(n))`, a big batch is appended and the whole heap heapified
+    in `O(n)` instead.
+    """
+    values = list(values)
+    size = len(heap) + len(values)
+    if len(values) * size.bit_length() > 2 * size:
+        heap.extend(values)
+        heapify(heap, heap_type)
+        return
+    siftup, _ = _sifters[heap_type or _default_heap_type]
+    for value in values:
+        heap.append(value)
+        siftup(heap, len(heap) - 1)
+
+
+def heappopmany(
+    heap: ty.MutableSequence[_T], k: int, heap_type: ty.Optional[HeapType] = None
+) -> list[_T]:
+    """
+    Pop the first `k` values off the heap, in heap order.
+    Popping everything sorts the heap at once.
+    """
+    heap_type = heap_type or _default_heap_type
+    if k >= len(heap):
+        reverse = heap_type in (HeapType.MAX, HeapType.MAXEQ)
+        values = sorted(heap, reverse=reverse)  # type: ignore[type-var]
+        heap.clear()
+        return values
+    _, siftdown = _sifters[heap_type]
+    values = []
+    for _ in range(k):
+        last = heap.pop()
+        value, heap[0] = heap[0], last
+        values.append(value)
+        siftdown(heap, 0, len(heap))
+    return values
+
+
+def heappushpop(
+    heap: ty.MutableSequence[_T], value: _T, heap_type: ty.Optional[HeapType] = None
+) -> _T:
+    """
+    Push `value` then pop the heap in one go, `value` comes straight
+    back when it would have been popped, without touching the heap.
+    """
+    heap_type = heap_type or _default_heap_type
+    if heap and not _cmp_heap_type_map[heap_type](heap[0], value):
+        value, heap[0] = heap[0], value
+        _sifters[heap_type][1](heap, 0, len(heap))
+    return value
+
+
+def heapreplace(
+    heap: ty.MutableSequence[_T], value: _T, heap_type: ty.Optional[HeapType] = None
+) -> _T:
+    """
+    Pop the heap then push `value` in one go, the heap must not be
+    empty and the popped value may be bigger than `value`.
+    """
+    heap_type = heap_type or _default_heap_type
+    if type(heap) is list and (fast := _list_heapreplace.get(heap_type)) is not None:
+        return fast(heap, value)
+    _, siftdown = _sifters[heap_type]
+    head, heap[0] = heap[0], value
+    siftdown(heap, 0, len(heap))
+    return head
+
+
+def _nbest(
+    n: int,
+    iterable: ty.Iterable[_T],
+    key: ty.Callable[[_T], ty.Any] | None,
+    largest: bool,
+) -> list[_T]:
+    """
+    The `n` best values, a heap of the `n` best so far is kept with the
+    worst of them on top to be replaced. Ties go to the first seen.
+    """
+    if n <= 0:
+        return []
+    key = key or (lambda value: value)
+    sign = -1 if largest else 1
+    entries = (
+        (key(value), sign * order, value) for order, value in enumerate(iterable)
+    )
+    heap = [entry for _, entry in zip(range(n), entries)]
+    heap_type = HeapType.MIN if largest else HeapType.MAX
+    heapify(heap, heap_type)
+    comparer = _cmp_heap_type_map[heap_type]
+    for entry in entries:
+        if comparer(entry, heap[0]):  # Orders differ, values are never compared
+            heapreplace(heap, entry, heap_type)
+    heap.sort(reverse=largest)
+    return [value for _, _, value in heap]
+
+
+def nsmallest(
+    n: int, iterable: ty.Iterable[_T], key: ty.Callable[[_T], ty.Any] | None = None
+) -> list[_T]:
+    "The `n` smallest values, like `sorted(iterable, key=key)[:n]`."
+    return _nbest(n, iterable, key, largest=False)
+
+
+def nlargest(
+    n: int, iterable: ty.Iterable[_T], key: ty.Callable[[_T], ty.Any] | None = None
+) -> list[_T]:
+    "The `n` largest values, like `sorted(iterable, key=key, reverse=True)[:n]`."
+    return _nbest(n, iterable, key, largest=True)
+
+
+def merge(
+    *iterables: ty.Iterable[_T],
+    key: ty.Callable[[_T], ty.Any] | None = None,
+    heap_type: ty.Optional[HeapType] = None,
+) -> ty.Generator[_T, None, None]:
+    """
+    Lazily merge streams sorted in heap order (ascending for min-heaps,
+    descending for max-heaps) into a single sorted stream.
+    A heap of the heads of the streams yields the next value.
+    Equal values come out in the order of their streams.
+    """
+    heap_type = heap_type or _default_heap_type
+    key = key or (lambda value: value)
+    sign = -1 if heap_type in (HeapType.MAX, HeapType.MAXEQ) else 1
+    heap: list[list] = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append([key(value), sign * order, value, iterator])
+            break
+    heapify(heap, heap_type)
+    while heap:
+        entry = heap[0]
+        _, _, value, iterator = entry
+        yield value
+        for value in iterator:
+            entry[0], entry[2] = key(value), value
+            heapreplace(heap, entry, heap_type)
+            break
+        else:
+            heappop(heap, 0, heap_type)
+
+
+class HeapHandle(ty.Generic[_T]):
+    "A value pushed to an `IndexedHeap` and its index, kept up to date by sifts."
+
+    __slots__ = ("value", "index")
+
+    def __init__(self, value: _T, index: int) -> None:
+        self.value = value
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"HeapHandle({self.value!r}, index={self.index})"
+
+
+class IndexedHeap(ty.Generic[_T]):
+    """
+    A heap handing out a handle for every value pushed, the handle
+    follows its value around the heap so that it can be changed
+    (`decrease_key`, `increase_key`, `update`) or removed in `O(log(n))`.
+    """
+
+    __slots__ = ("_heap", "_heap_type", "_swaps", "_siftup", "_siftdown")
+
+    def __init__(
+        self,
+        iterable: ty.Iterable[_T] | None = None,
+        heap_type: ty.Optional[HeapType] = None,
+    ) -> None:
+        self._heap_type = heap_type or _default_heap_type
+        self._swaps = _cmp_heap_type_map[self._heap_type]
+        self._siftup, self._siftdown = _indexed_sifters[self._heap_type]
+        self._heap: list[HeapHandle[_T]] = []
+        if iterable is not None:
+            self.pushmany(iterable)
+
+    @property
+    def heap_type(self) -> HeapType:
+        return self._heap_type
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, handle: object) -> bool:
+        if not isinstance(handle, HeapHandle):
+            return False
+        index = handle.index
+        return 0 <= index < len(self._heap) and self._heap[index] is handle
+
+    def _check(self, handle: HeapHandle[_T]) -> int:
+        if handle not in self:
+            raise ValueError(f"{handle!r} is not in this heap")
+        return handle.index
+
+    def push(self, value: _T) -> HeapHandle[_T]:
+        handle = HeapHandle(value, len(self._heap))
+        self._heap.append(handle)
+        self._siftup(self._heap, handle.index)
+        return handle
+
+    def pushmany(self, values: ty.Iterable[_T]) -> list[HeapHandle[_T]]:
+        "Push all `values` and heapify once, returns their handles."
+        heap = self._heap
+        handles = [HeapHandle(value, len(heap) + i) for i, value in enumerate(values)]
+        heap.extend(handles)
+        size = len(heap)
+        for index in reversed(range(size // 2)):
+            self._siftdown(heap, index, size)
+        return handles
+
+    def peek(self) -> _T:
+        return self._heap[0].value
+
+    def pop(self) -> _T:
+        if not self._heap:
+            raise IndexError("pop from an empty heap")
+        return self.remove(self._heap[0])
+
+    def remove(self, handle: HeapHandle[_T]) -> _T:
+        "Remove the value of `handle` from the heap, the handle is invalidated."
+        index = self._check(handle)
+        last = self._heap.pop()
+        if last is not handle:
+            self._heap[index] = last
+            self._fix(index)
+        handle.index = -1
+        return handle.value
+
+    def _fix(self, index: int):
+        "Restore the heap after the value at `index` changed."
+        heap = self._heap
         parent = (index - 1) >> 1
-        pv, cv = heap[parent], heap[index]
-        if comparer(pv, cv):
-            heap[index], heap[parent] = pv, cv
-            index = parent
+        if index > 0 and self._swaps(heap[parent].value, heap[index].value):
+            self._siftup(heap, index)
         else:
-            break
+            self._siftdown(heap, index, len(heap))
 
+    def update(self, handle: HeapHandle[_T], value: _T):
+        "Change the value of `handle`, in whichever direction."
+        index = self._check(handle)
+        handle.value = value
+        self._fix(index)
 
-def _siftdown(
-    heap: ty.MutableSequence[_T], comparer: _CompareF[_T], parent: int, size: int
-):
-    while True:
-        left = 2 * parent + 1
-        right = left + 1
-        if left >= size:
-            break
-        index = left if right >= size or comparer(heap[right], heap[left]) else right
-        pv, cv = heap[parent], heap[index]
-        if comparer(pv, cv):
-            heap[index], heap[parent] = pv, cv
-            parent = index
+    def decrease_key(self, handle: HeapHandle[_T], value: _T):
+        if handle.value < value:  # type: ignore[operator]
+            raise ValueError(f"{value!r} is greater than {handle.value!r}")
+        self.update(handle, value)
+
+    def increase_key(self, handle: HeapHandle[_T], value: _T):
+        if value < handle.value:  # type: ignore[operator]
+            raise ValueError(f"{value!r} is less than {handle.value!r}")
+        self.update(handle, value)
+
+    def __str__(self) -> str:
+        return f"IndexedHeap({[handle.value for handle in self._heap]})"
+
+    __repr__ = __str__
+
+
+class ArrayHeap(ty.Generic[_T]):
+    """
+    A heap of `(priority, payload)` pairs stored as a struct of arrays,
+    float priorities in a contiguous `array('d')` and the payloads in a
+    parallel list. Sifts compare raw floats, payloads are never compared
+    and no tuple is allocated per entry.
+    """
+
+    __slots__ = ("_priorities", "_payloads", "_heap_type", "_siftup", "_siftdown")
+
+    def __init__(
+        self,
+        priorities: ty.Iterable[float] | None = None,
+        payloads: ty.Iterable[_T] | None = None,
+        heap_type: ty.Optional[HeapType] = None,
+    ) -> None:
+        self._heap_type = heap_type or _default_heap_type
+        self._siftup, self._siftdown = _array_sifters[self._heap_type]
+        self._priorities = array("d")
+        self._payloads: list[_T] = []
+        if priorities is not None:
+            self.pushmany(priorities, payloads)
+
+    @property
+    def heap_type(self) -> HeapType:
+        return self._heap_type
+
+    @property
+    def priorities(self) -> array:
+        """
+        A copy of the priorities, in heap order. A view would pin the
+        array's buffer and make every push or pop raise BufferError.
+        """
+        return self._priorities[:]
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def push(self, priority: float, payload: _T = ty.cast(_T, None)):
+        self._priorities.append(priority)
+        self._payloads.append(payload)
+        self._siftup(self._priorities, self._payloads, len(self._payloads) - 1)
+
+    def pushmany(
+        self, priorities: ty.Iterable[float], payloads: ty.Iterable[_T] | None = None
+    ):
+        """
+        Push all `priorities`, each with its payload, then heapify once.
+        NumPy arrays and float64 buffers (bytes, memoryviews) are copied
+        in bulk, without creating a python float per priority.
+        """
+        size = len(self._priorities)
+        if hasattr(priorities, "astype"):  # NumPy arrays, as float64 bytes
+            priorities = priorities.astype("float64").tobytes()
+        if isinstance(priorities, (bytes, bytearray, memoryview)):
+            self._priorities.frombytes(priorities)
         else:
-            break
+            self._priorities.extend(priorities)
+        added = len(self._priorities) - size
+        if payloads is None:
+            self._payloads.extend([ty.cast(_T, None)] * added)
+        else:
+            self._payloads.extend(payloads)
+        if len(self._payloads) != len(self._priorities):
+            del self._priorities[size:], self._payloads[size:]
+            raise ValueError("priorities and payloads differ in length")
+        total = len(self._payloads)
+        for index in reversed(range(total // 2)):
+            self._siftdown(self._priorities, self._payloads, index, total)
+
+    def peek(self) -> tuple[float, _T]:
+        if not self._payloads:
+            raise IndexError("peek at an empty heap")
+        return self._priorities[0], self._payloads[0]
+
+    def pop(self) -> tuple[float, _T]:
+        priorities, payloads = self._priorities, self._payloads
+        if not payloads:
+            raise IndexError("pop from an empty heap")
+        priority, payload = priorities.pop(), payloads.pop()
+        if payloads:
+            priority, priorities[0] = priorities[0], priority
+            payload, payloads[0] = payloads[0], payload
+            self._siftdown(priorities, payloads, 0, len(payloads))
+        return priority, payload
+
+    def pushpop(self, priority: float, payload: _T = ty.cast(_T, None)):
+        "Push then pop in one go, like `heappushpop`."
+        priorities, payloads = self._priorities, self._payloads
+        swaps = _cmp_heap_type_map[self._heap_type]
+        if payloads and not swaps(priorities[0], priority):
+            priority, priorities[0] = priorities[0], priority
+            payload, payloads[0] = payloads[0], payload
+            self._siftdown(priorities, payloads, 0, len(payloads))
+        return priority, payload
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, len(self))
+        report.add("container", own_size(self))
+        report.add("priorities", sizeof(self._priorities))
+        report.add("payload refs", sizeof(self._payloads))
+        if payload:
+            report.add("payload", payload_size(self._payloads))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
+    def __str__(self) -> str:
+        pairs = [*zip(self._priorities, self._payloads)]
+        return f"ArrayHeap({pairs})"
+
+    __repr__ = __str__
@@ -1,9 +1,16 @@
+from ..memory import MemoryReport, own_size, payload_size, sizeof
+from .buffer import fill, tolist
+from .cursor import Cursor
+from .pool import NodePool
+from array import array
 import typing as ty
 
 _T = ty.TypeVar("_T")
 
 
 class NodeABC(ty.Generic[_T]):
+    __slots__ = ()
+
     value: _T
     next: "NodeABC[_T] | None"
     prev: "NodeABC[_T] | None"
@@ -13,6 +20,18 @@ class NodeABC(ty.Generic[_T]):
 
 
 class ListABC(ty.Protocol[_T]):
+    _pool: NodePool | None = None
+
+    @property
+    def pool(self) -> NodePool | None:
+        "The pool new nodes are taken from, None when they are allocated."
+        return self._pool
+
+    def release(self, node: NodeABC[_T]):
+        "Hand a deleted node back to the pool once its value was read."
+        if self._pool is not None:
+            self._pool.release(node)
+
     def nodefactory(self, value: _T) -> NodeABC[_T]:
         ...
 
@@ -42,3 +61,70 @@ class ListABC(ty.Protocol[_T]):
 
     def extend(self, iterable: ty.Iterable):
         ...
+
+    def reverse(self):
+        ...
+
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        ...
+
+    def sort(self, key: ty.Callable[[_T], ty.Any] | None = None, reverse=False):
+        ...
+
+    def _unsupported(self, operation: str) -> ty.NoReturn:
+        raise TypeError(f"{type(self).__name__} does not support {operation}")
+
+    def cursor(self, index: int = 0) -> Cursor[_T]:
+        "A cursor on node `index`, for the backends with single node links."
+        self._unsupported("cursors")
+
+    def concat(self, other: ty.Self):
+        self._unsupported("concat")
+
+    def splice(self, index: int, other: ty.Self):
+        self._unsupported("splice")
+
+    def split_at(self, index: int) -> ty.Self:
+        self._unsupported("split_at")
+
+    def _check_family(self, other: "ListABC[_T]"):
+        "Nodes only move between two distinct lists of the same type."
+        if type(other) is not type(self):
+            raise TypeError(
+                f"cannot move nodes between a {type(self).__name__}"
+                f" and a {type(other).__name__}"
+            )
+        if other is self:
+            raise ValueError("cannot move the nodes of a list into itself")
+
+    def values(self, reverse: bool = False) -> ty.Iterator[_T]:
+        return (node.value for node in (reversed(self) if reverse else self))
+
+    def extend_from_buffer(self, buffer: ty.Any):
+        "Extend with the items of an `array.array`, `memoryview` or NumPy array."
+        self.extend(tolist(buffer))
+
+    def to_array(self, out: ty.Any = None, typecode: str | None = None) -> ty.Any:
+        """
+        The values in a new `array.array` of `typecode`, or copied to the
+        start of the preallocated buffer `out` in its format, packed
+        straight from the walk over the nodes.
+        """
+        if out is not None:
+            return fill(out, self.values(), self.size())
+        if typecode is None:
+            raise TypeError("to_array needs a typecode or an out buffer")
+        return array(typecode, self.values())
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self.size())
+        report.add("container", own_size(self))
+        report.add("nodes", sum(map(sizeof, self)))
+        if self._pool is not None:
+            report.add("pool", sum(map(sizeof, self._pool)))
+        if payload:
+            report.add("payload", payload_size(node.value for node in self))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
@@ -1,5 +1,10 @@
 from .abc import ListABC
+from .cursor import Cursor, _current, filter_inplace
 from .node import CircularNode
+from .buffer import tolist
+from .pool import NodePool
+from .sort import merge_sort
+from itertools import islice
 import typing as ty
 
 
@@ -7,7 +12,10 @@ _T = ty.TypeVar("_T")
 
 
 class CircularDoublyList(ListABC[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        self._pool = NodePool(CircularNode, pool_size) if pool_size else None
         self._head: CircularNode[_T] | None = None
         self._size: int = 0
         if iterable is not None:
@@ -17,6 +25,8 @@ class CircularDoublyList(ListABC[_T]):
         return self._size
 
     def nodefactory(self, value: _T) -> CircularNode[_T]:
+        if self._pool is not None:
+            return self._pool.acquire(value)
         return CircularNode(value)
 
     def empty(self) -> bool:
@@ -31,6 +41,8 @@ class CircularDoublyList(ListABC[_T]):
         if self._head is None or _index < 0 or _index >= self._size:
             raise IndexError
         node = self._head
+        # Walk from the nearer end
+        index = _index - self._size if _index > self._size // 2 else _index
         if index < 0:
             while index != 0:
                 index += 1
@@ -41,10 +53,10 @@ class CircularDoublyList(ListABC[_T]):
                 node = ty.cast(CircularNode[_T], node.next)
         return node
 
-    def _iter(self, _next) -> ty.Iterator[CircularNode[_T]]:
+    def _iter(self, _next, start=None) -> ty.Iterator[CircularNode[_T]]:
         if self._head is None:
             return
-        head = self._head
+        head = self._head if start is None else start(self._head)
         for _ in range(self._size):
             yield head
             head = _next(head)
@@ -53,23 +65,24 @@ class CircularDoublyList(ListABC[_T]):
         return self._iter(lambda node: node.next)
 
     def __reversed__(self) -> ty.Iterator[CircularNode[_T]]:
-        return self._iter(lambda node: node.prev)
+        # From the tail, the node before the head
+        return self._iter(lambda node: node.prev, lambda head: head.prev)
 
     def insert(self, index: int, node: CircularNode[_T]):
         node.clear()
+        index = self._size + index if index < 0 else index
         if self._head is None:
             self._head = node
         else:
-            try:
-                target = self.getnode(index)
-            except IndexError:
-                target = self._head
+            # Past either end, the node goes in between the tail and head
+            inside = 0 < index < self._size
+            target = self.getnode(index) if inside else self._head
             target.prev.next = node
             node.prev = target.prev
             node.next = target
             target.prev = node
-        if index == 0:
-            self._head = self._head.prev
+            if index <= 0:
+                self._head = node
         self._size += 1
 
     def extend(self, iterable: ty.Iterable[_T]):
@@ -83,31 +96,192 @@ class CircularDoublyList(ListABC[_T]):
             temp = node
             size += 1
 
-        if head is head.next:
-            return
+        first = head.next
+        self.release(head)
+        if first is not head:
+            self._append_chain(first, temp, size)
 
-        head = head.next
+    def extend_from_buffer(self, buffer: ty.Any):
+        "Creates the nodes in one pass over the converted buffer."
+        values = tolist(buffer)
+        if self._pool is not None or not values:
+            return self.extend(values)
+        nodes = [*map(CircularNode, values)]
+        for node, following in zip(nodes, islice(nodes, 1, None)):
+            node.next = following
+            following.prev = node
+        self._append_chain(nodes[0], nodes[-1], len(nodes))
 
+    def _append_chain(
+        self, first: CircularNode[_T], last: CircularNode[_T], size: int
+    ):
+        "Link the chain of `size` nodes from `first` to `last` before the head."
         if self._head is None:
-            temp.next = head
-            head.prev = temp
-            self._head = head
-            self._size = size
+            last.next = first
+            first.prev = last
+            self._head = first
         else:
-            self._head.prev.next = head
-            head.prev = self._head.prev
-            temp.next = self._head
-            self._head.prev = temp
-            self._size += size
+            self._head.prev.next = first
+            first.prev = self._head.prev
+            last.next = self._head
+            self._head.prev = last
+        self._size += size
 
     def delnode(self, index: int) -> CircularNode[_T]:
         target = self.getnode(index)
         if self._size == 1:
             self._head = None
-        if index == 0:
+        elif target is self._head:
             self._head = target.next
         target.next.prev = target.prev
         target.prev.next = target.next
         self._size -= 1
         target.clear()
         return target
+
+    def reverse(self):
+        "Swaps the links of every node, allocates nothing."
+        if self._head is None:
+            return
+        node = head = self._head
+        for _ in range(self._size):
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+        self._head = head.next  # The old tail
+
+    def sort(self, key: ty.Callable[[_T], ty.Any] | None = None, reverse=False):
+        if self._head is None:
+            return
+        last = self._head.prev
+        last.next = None  # Open the circle for the sort
+        try:
+            head, tail, error = merge_sort(self._head, self._size, key, reverse)
+        except BaseException:
+            last.next = self._head  # A raising key touched no node
+            raise
+        node, before = head, tail
+        while node is not None:
+            node.prev, before, node = before, node, node.next
+        tail.next = self._head = head
+        if error is not None:
+            raise error
+
+    def concat(self, other: "CircularDoublyList[_T]"):
+        "Move the nodes of `other` to the end, `O(1)`, `other` is left empty."
+        self.splice(self._size, other)
+
+    def splice(self, index: int, other: "CircularDoublyList[_T]"):
+        "Move the nodes of `other` before node `index`, `other` is left empty."
+        self._check_family(other)
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        first, size = other._head, other._size
+        if first is None:
+            return
+        other.clear()
+        if self._head is None:
+            self._head, self._size = first, size
+            return
+        last = first.prev
+        after = self.getnode(index) if index < self._size else self._head
+        first.prev, after.prev.next = after.prev, first
+        last.next, after.prev = after, last
+        if index == 0:
+            self._head = first
+        self._size += size
+
+    def split_at(self, index: int) -> "CircularDoublyList[_T]":
+        "Move the nodes from `index` on to a new list, returned."
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        rest = type(self)()
+        if index == self._size or self._head is None:
+            return rest
+        if index == 0:
+            rest._head, rest._size = self._head, self._size
+            self.clear()
+            return rest
+        first, head = self.getnode(index), self._head
+        last, before = head.prev, first.prev
+        # Close each part into its own circle
+        before.next, head.prev = head, before
+        last.next, first.prev = first, last
+        rest._head, rest._size = first, self._size - index
+        self._size = index
+        return rest
+
+    def cursor(self, index: int = 0) -> "CircularCursor[_T]":
+        "A cursor on node `index`, `size()` for past the end."
+        index = self._size + index if index < 0 else index
+        if not 0 <= index <= self._size:
+            raise IndexError
+        return CircularCursor(self, index)
+
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        return filter_inplace(self.cursor(), predicate)
+
+
+class CircularCursor(Cursor[_T]):
+    """
+    Past the end is the position after the last node, before the head.
+    The cursor counts its index so that it stops after a lap.
+    """
+
+    __slots__ = ("_list", "_node", "_index")
+
+    def __init__(self, _list: CircularDoublyList[_T], index: int) -> None:
+        self._list = _list
+        self._index = index
+        self._node = _list.getnode(index) if index < _list._size else None
+
+    def __bool__(self) -> bool:
+        return self._node is not None
+
+    @property
+    def value(self) -> _T:
+        return _current(self._node).value
+
+    def replace(self, value: _T):
+        _current(self._node).value = value
+
+    def advance(self) -> bool:
+        current = _current(self._node)
+        self._index += 1
+        self._node = current.next if self._index < self._list._size else None
+        return self._node is not None
+
+    def _link(self, after: CircularNode[_T], node: CircularNode[_T]):
+        "Link `node` before `after` without moving the head."
+        node.prev, node.next = after.prev, after
+        after.prev.next = node
+        after.prev = node
+        self._list._size += 1
+
+    def insert_before(self, value: _T):
+        _list, node = self._list, self._list.nodefactory(value)
+        if _list._head is None:
+            _list._head = node
+            _list._size += 1
+        else:
+            self._link(_list._head if self._node is None else self._node, node)
+            if self._index == 0:
+                _list._head = node
+        self._index += 1
+
+    def insert_after(self, value: _T):
+        current = _current(self._node)
+        self._link(current.next, self._list.nodefactory(value))
+
+    def remove_current(self) -> _T:
+        _list, current = self._list, _current(self._node)
+        if _list._size == 1:
+            _list._head = None
+        else:
+            current.prev.next = current.next
+            current.next.prev = current.prev
+            if current is _list._head:
+                _list._head = current.next
+        _list._size -= 1
+        self._node = current.next if self._index < _list._size else None
+        current.clear()
+        value = current.value
+        _list.release(current)
+        return value
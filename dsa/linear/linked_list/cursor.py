@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+import typing as ty
+
+_T = ty.TypeVar("_T")
+_N = ty.TypeVar("_N")
+
+
+class Cursor(ABC, ty.Generic[_T]):
+    """
+    A position in a linked list, on a node or past the last one.
+    Changes made through the cursor take `O(1)` and keep it valid,
+    changing the list by other means leaves the cursor stale.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __bool__(self) -> bool:
+        "Whether the cursor is on a node, not past the end of the list."
+        ...
+
+    @property
+    @abstractmethod
+    def value(self) -> _T:
+        ...
+
+    @abstractmethod
+    def replace(self, value: _T):
+        "Replace the value of the current node."
+        ...
+
+    @abstractmethod
+    def advance(self) -> bool:
+        "Move to the next node, returns whether there is one."
+        ...
+
+    @abstractmethod
+    def insert_before(self, value: _T):
+        "Insert `value` before the current node, the cursor stays on it."
+        ...
+
+    @abstractmethod
+    def insert_after(self, value: _T):
+        "Insert `value` after the current node, the cursor stays on it."
+        ...
+
+    @abstractmethod
+    def remove_current(self) -> _T:
+        "Remove the current node and move to the next, returns its value."
+        ...
+
+
+def _current(node: _N | None) -> _N:
+    if node is None:
+        raise IndexError("cursor is past the end of the list")
+    return node
+
+
+def filter_inplace(cursor: Cursor[_T], predicate: ty.Callable[[_T], object]) -> int:
+    "Remove the values failing `predicate` in a single pass, returns how many."
+    removed = 0
+    while cursor:
+        if predicate(cursor.value):
+            cursor.advance()
+        else:
+            cursor.remove_current()
+            removed += 1
+    return removed
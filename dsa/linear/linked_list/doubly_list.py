@@ -1,13 +1,22 @@
 from .abc import ListABC, NodeABC
+from .cursor import Cursor, _current, filter_inplace
 from .node import Node
+from .buffer import tolist
+from .pool import NodePool
+from .sort import merge_sort
+from itertools import islice
 import typing as ty
 
 _T = ty.TypeVar("_T")
 
 
 class DoublyList(ListABC[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        self._pool = NodePool(Node, pool_size) if pool_size else None
         self._head: NodeABC[_T] | None = None
+        self._tail: NodeABC[_T] | None = None
         self._size: int = 0
         if iterable is not None:
             self.extend(iterable)
@@ -16,16 +25,26 @@ class DoublyList(ListABC[_T]):
         return self._size
 
     def nodefactory(self, value: _T) -> NodeABC[_T]:
+        if self._pool is not None:
+            return self._pool.acquire(value)
         return Node(value)
 
     def empty(self) -> bool:
         return self._head is None
 
     def getnode(self, index: int) -> NodeABC[_T]:
+        "Walks from the nearer end, `O(min(index, size - index))`."
         index = self._size + index if index < 0 else index
-        for current, node in enumerate(self):
-            if current == index:
+        if not 0 <= index < self._size:
+            raise IndexError
+        if index < self._size // 2:
+            nodes, steps = iter(self), index
+        else:
+            nodes, steps = reversed(self), self._size - 1 - index
+        for node in nodes:
+            if not steps:
                 return node
+            steps -= 1
         raise IndexError
 
     def __iter__(self) -> ty.Iterator[NodeABC[_T]]:
@@ -45,45 +64,65 @@ class DoublyList(ListABC[_T]):
             temp = node
             size += 1
 
-        if self.empty():
-            self._head = head.next
-            self._size = size
+        first = head.next
+        self.release(head)
+        if first is not None:
+            self._append_chain(first, temp, size)
+
+    def extend_from_buffer(self, buffer: ty.Any):
+        "Creates the nodes in one pass over the converted buffer."
+        values = tolist(buffer)
+        if self._pool is not None or not values:
+            return self.extend(values)
+        nodes = [*map(Node, values)]
+        for node, following in zip(nodes, islice(nodes, 1, None)):
+            node.next = following
+            following.prev = node
+        self._append_chain(nodes[0], nodes[-1], len(nodes))
+
+    def _append_chain(self, first: NodeABC[_T], last: NodeABC[_T], size: int):
+        "Link the chain of `size` nodes from `first` to `last` after the tail."
+        first.prev = self._tail
+        if self._tail is None:
+            self._head = first
         else:
-            lastnode = self.getnode(-1)
-            if head.next is not None:
-                head.next.prev = lastnode
-            lastnode.next = head.next
-            self._size += size
+            self._tail.next = first
+        self._tail = last
+        self._size += size
 
     def clear(self):
         self._head = None
+        self._tail = None
         self._size = 0
 
     def insert(self, index: int, node: NodeABC[_T]):
         node.clear()
-        if index == 0 or self.empty():
+        index = self._size + index if index < 0 else index
+        if index <= 0 or self._head is None:
             node.next = self._head
             if self._head is not None:
                 self._head.prev = node
+            else:
+                self._tail = node
             self._head = node
+        elif index >= self._size:
+            self._tail.next = node  # type: ignore
+            node.prev = self._tail
+            self._tail = node
         else:
-            try:
-                target = self.getnode(index)
-                target.prev.next = node  # type: ignore
-                node.next = target
-                node.prev = target.prev
-                target.prev = node
-            except IndexError:
-                lastnode = self.getnode(-1)
-                lastnode.next = node
-                node.prev = lastnode
+            target = self.getnode(index)
+            target.prev.next = node  # type: ignore
+            node.next = target
+            node.prev = target.prev
+            target.prev = node
         self._size += 1
 
     def delnode(self, index: int) -> NodeABC[_T]:
-        index = self._size + index if index < 0 else index
         target = self.getnode(index)
-        if index == 0:
-            self._head = self._head.next  # type: ignore
+        if target is self._head:
+            self._head = target.next
+        if target is self._tail:
+            self._tail = target.prev
         if target.prev is not None:
             target.prev.next = target.next
         if target.next is not None:
@@ -93,6 +132,136 @@ class DoublyList(ListABC[_T]):
         return target
 
     def __reversed__(self) -> ty.Iterator[NodeABC[_T]]:
-        return reversed(self)
+        tail = self._tail
+        while tail is not None:
+            yield tail
+            tail = tail.prev
+
+    def reverse(self):
+        "Swaps the links of every node, allocates nothing."
+        node = self._head
+        while node is not None:
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+        self._head, self._tail = self._tail, self._head
+
+    def sort(self, key: ty.Callable[[_T], ty.Any] | None = None, reverse=False):
+        self._head, self._tail, error = merge_sort(
+            self._head, self._size, key, reverse
+        )
+        node, before = self._head, None
+        while node is not None:
+            node.prev, before, node = before, node, node.next
+        if error is not None:
+            raise error
+
+    def concat(self, other: "DoublyList[_T]"):
+        "Move the nodes of `other` to the end, `O(1)`, `other` is left empty."
+        self.splice(self._size, other)
+
+    def splice(self, index: int, other: "DoublyList[_T]"):
+        "Move the nodes of `other` before node `index`, `other` is left empty."
+        self._check_family(other)
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        first, last, size = other._head, other._tail, other._size
+        if first is None or last is None:
+            return
+        other.clear()
+        if index == self._size:
+            self._append_chain(first, last, size)
+            return
+        after = self.getnode(index)
+        before = after.prev
+        first.prev, last.next, after.prev = before, after, last
+        if before is None:
+            self._head = first
+        else:
+            before.next = first
+        self._size += size
+
+    def split_at(self, index: int) -> "DoublyList[_T]":
+        "Move the nodes from `index` on to a new list, returned."
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        rest = type(self)()
+        if index == self._size:
+            return rest
+        first = self.getnode(index)
+        before, tail, size = first.prev, self._tail, self._size
+        if before is None:
+            self.clear()
+        else:
+            before.next = None
+            self._tail, self._size = before, index
+        rest._append_chain(first, tail, size - index)
+        return rest
+
+    def cursor(self, index: int = 0) -> "DoublyCursor[_T]":
+        "A cursor on node `index`, `size()` for past the end."
+        index = self._size + index if index < 0 else index
+        if not 0 <= index <= self._size:
+            raise IndexError
+        return DoublyCursor(self, None if index == self._size else self.getnode(index))
 
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        return filter_inplace(self.cursor(), predicate)
 
+
+class DoublyCursor(Cursor[_T]):
+    __slots__ = ("_list", "_node")
+
+    def __init__(self, _list: DoublyList[_T], node: NodeABC[_T] | None) -> None:
+        self._list = _list
+        self._node = node
+
+    def __bool__(self) -> bool:
+        return self._node is not None
+
+    @property
+    def value(self) -> _T:
+        return _current(self._node).value
+
+    def replace(self, value: _T):
+        _current(self._node).value = value
+
+    def advance(self) -> bool:
+        self._node = _current(self._node).next
+        return self._node is not None
+
+    def _link(self, before: NodeABC[_T] | None, node: NodeABC[_T]):
+        "Link `node` after `before`, at the head when `before` is None."
+        _list = self._list
+        after = _list._head if before is None else before.next
+        node.prev, node.next = before, after
+        if before is None:
+            _list._head = node
+        else:
+            before.next = node
+        if after is None:
+            _list._tail = node
+        else:
+            after.prev = node
+        _list._size += 1
+
+    def insert_before(self, value: _T):
+        before = self._list._tail if self._node is None else self._node.prev
+        self._link(before, self._list.nodefactory(value))
+
+    def insert_after(self, value: _T):
+        self._link(_current(self._node), self._list.nodefactory(value))
+
+    def remove_current(self) -> _T:
+        _list, current = self._list, _current(self._node)
+        if current.prev is None:
+            _list._head = current.next
+        else:
+            current.prev.next = current.next
+        if current.next is None:
+            _list._tail = current.prev
+        else:
+            current.next.prev = current.prev
+        self._node = current.next
+        _list._size -= 1
+        current.clear()
+        value = current.value
+        _list.release(current)
+        return value
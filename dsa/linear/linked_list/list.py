@@ -2,22 +2,49 @@ from .circular_list import CircularDoublyList as _CircularDoublyList
 from .sequence import MutableSequenceMixin as _MutableSequenceMixin
 from .singly_list import SinglyList as _SinglyList
 from .doubly_list import DoublyList as _DoublyList
+from .unrolled_list import UnrolledList as _UnrolledList
 import typing as ty
 
 _T = ty.TypeVar("_T")
-__all__ = "SinglyLinkedList", "CirDoublyLinkedList", "DoublyLinkedList"
+__all__ = (
+    "SinglyLinkedList",
+    "CirDoublyLinkedList",
+    "DoublyLinkedList",
+    "UnrolledLinkedList",
+)
 
 
 class SinglyLinkedList(_MutableSequenceMixin[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
-        super().__init__(_SinglyList(iterable))
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        super().__init__(_SinglyList(iterable, pool_size=pool_size))
 
 
 class DoublyLinkedList(_MutableSequenceMixin[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
-        super().__init__(_DoublyList(iterable))
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        super().__init__(_DoublyList(iterable, pool_size=pool_size))
 
 
 class CirDoublyLinkedList(_MutableSequenceMixin[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
-        super().__init__(_CircularDoublyList(iterable))
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        super().__init__(_CircularDoublyList(iterable, pool_size=pool_size))
+
+
+class UnrolledLinkedList(_MutableSequenceMixin[_T]):
+    _list: _UnrolledList[_T]
+
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, block_size: int = 64
+    ) -> None:
+        super().__init__(_UnrolledList(iterable, block_size=block_size))
+
+    def __iter__(self) -> ty.Iterator[_T]:
+        return self._list.values()
+
+    def __reversed__(self) -> ty.Iterator[_T]:
+        return self._list.values(reverse=True)
@@ -6,6 +6,8 @@ T = ty.TypeVar("T")
 
 
 class ForwardNode(NodeABC[T]):
+    __slots__ = ("value", "next")
+
     def __init__(self, value: T, *, next: "ForwardNode | None" = None) -> None:
         self.value: T = value
         self.next: ForwardNode | None = next
@@ -15,6 +17,8 @@ class ForwardNode(NodeABC[T]):
 
 
 class Node(NodeABC[T]):
+    __slots__ = ("value", "next", "prev")
+
     def __init__(
         self, value: T, *, next: "Node|None" = None, prev: "Node|None" = None
     ) -> None:
@@ -28,6 +32,8 @@ class Node(NodeABC[T]):
 
 
 class CircularNode(ty.Generic[T]):
+    __slots__ = ("value", "next", "prev")
+
     def __init__(
         self,
         value: T,
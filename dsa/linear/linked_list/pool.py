@@ -0,0 +1,62 @@
+import typing as ty
+
+_N = ty.TypeVar("_N")
+
+
+class NodePool(ty.Generic[_N]):
+    """
+    A bounded free list of nodes. A list given a pool takes its new nodes
+    from it and gives the ones it deletes back, so a list churning
+    through pushes and pops reuses the same nodes instead of allocating
+    and collecting one per item. Nodes released past `maxsize` are
+    dropped to the garbage collector.
+    """
+
+    __slots__ = ("_factory", "_free", "maxsize", "hits", "misses", "dropped")
+
+    def __init__(self, factory: ty.Callable[[ty.Any], _N], maxsize: int) -> None:
+        assert maxsize > 0, maxsize
+        self._factory = factory
+        self._free: list[_N] = []
+        self.maxsize = maxsize
+        self.hits = 0  # Nodes reused from the pool
+        self.misses = 0  # Nodes allocated, the pool being empty
+        self.dropped = 0  # Nodes released to a full pool
+
+    def acquire(self, value: ty.Any) -> _N:
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.value = value  # type: ignore[attr-defined]
+            return node
+        self.misses += 1
+        return self._factory(value)
+
+    def release(self, node: _N):
+        "Take `node` back, unlinked and without its value."
+        if len(self._free) >= self.maxsize:
+            self.dropped += 1
+            return
+        node.clear()  # type: ignore[attr-defined]
+        node.value = None  # type: ignore[attr-defined]
+        self._free.append(node)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "free": len(self._free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+        }
+
+    def __iter__(self) -> ty.Iterator[_N]:
+        "The free nodes."
+        return iter(self._free)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def __str__(self) -> str:
+        return f"NodePool({self.stats()})"
+
+    __repr__ = __str__
@@ -1,4 +1,7 @@
+from ..memory import MemoryReport, own_size
 from .abc import ListABC
+from .cursor import Cursor
+from .pool import NodePool
 import typing as ty
 
 _T = ty.TypeVar("_T")
@@ -33,20 +36,73 @@ class MutableSequenceMixin(ty.MutableSequence[_T]):
         self._list.extend(values)
 
     def pop(self, index: int = -1) -> _T:
-        return self._list.delnode(index).value
+        node = self._list.delnode(index)
+        value = node.value
+        self._list.release(node)
+        return value
 
     def remove(self, value: _T) -> None:
         index = self.index(value)
-        self._list.delnode(index)
+        self._list.release(self._list.delnode(index))
+
+    @property
+    def pool(self) -> NodePool | None:
+        "The node pool of the list, None when it allocates its nodes."
+        return self._list.pool
+
+    def cursor(self, index: int = 0) -> Cursor[_T]:
+        "A cursor on item `index` of the list, for backends that have one."
+        return self._list.cursor(index)
+
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        "Remove the items failing `predicate` in a single pass, returns how many."
+        return self._list.filter_inplace(predicate)
+
+    @classmethod
+    def from_array(cls, buffer: ty.Any, /, **kwargs: ty.Any) -> ty.Self:
+        "A list of the items of an `array.array`, `memoryview` or NumPy array."
+        self = cls(**kwargs)
+        self.extend_from_buffer(buffer)
+        return self
+
+    def extend_from_buffer(self, buffer: ty.Any) -> None:
+        self._list.extend_from_buffer(buffer)
+
+    def to_array(self, out: ty.Any = None, typecode: str | None = None) -> ty.Any:
+        "The items in an `array.array`, or copied to the preallocated `out`."
+        return self._list.to_array(out, typecode)
+
+    def sort(
+        self, *, key: ty.Callable[[_T], ty.Any] | None = None, reverse: bool = False
+    ) -> None:
+        "A stable sort, the nodes are relinked rather than reallocated."
+        self._list.sort(key, reverse)
+
+    def concat(self, other: ty.Self) -> None:
+        "Move the items of `other` to the end, it is left empty."
+        self._list.concat(other._list)
+
+    def splice(self, index: int, other: ty.Self) -> None:
+        "Move the items of `other` before item `index`, it is left empty."
+        self._list.splice(index, other._list)
+
+    def split_at(self, index: int) -> ty.Self:
+        "Move the items from `index` on to a new list of the same type."
+        rest = type(self).__new__(type(self))
+        MutableSequenceMixin.__init__(rest, self._list.split_at(index))
+        return rest
 
     def __iadd__(self, values: ty.Iterable[_T]) -> ty.Self:
         self._list.extend(values)
         return self
 
     def reverse(self) -> None:
-        values = map(lambda node: node.value, reversed(self._list))
-        self._list.clear()
-        self._list.extend(values)
+        "Reverses the links in place, no node is allocated."
+        self._list.reverse()
+
+    def reversed_view(self) -> "ReversedView[_T]":
+        "A read only view of the items in reverse order, nothing is copied."
+        return ReversedView(self)
 
     def count(self, value: ty.Any) -> int:
         count = 0
@@ -69,5 +125,50 @@ class MutableSequenceMixin(ty.MutableSequence[_T]):
     def __iter__(self) -> ty.Iterator[_T]:
         return map(lambda node: node.value, iter(self._list))
 
+    def __reversed__(self) -> ty.Iterator[_T]:
+        return map(lambda node: node.value, reversed(self._list))
+
     def __len__(self) -> int:
         return self._list.size()
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = self._list.memory_report(payload)
+        report.name = type(self).__name__
+        report.add("container", own_size(self))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
+
+class ReversedView(ty.Sequence[_T]):
+    """
+    The items of a list in reverse order, read live from the list. Iterating
+    walks the list backwards, indexing maps to the mirrored index.
+    """
+
+    __slots__ = ("_sequence",)
+
+    def __init__(self, sequence: ty.Sequence[_T]) -> None:
+        self._sequence = sequence
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __getitem__(self, index: int) -> _T:  # type: ignore[override]
+        size = len(self._sequence)
+        index = size + index if index < 0 else index
+        if not 0 <= index < size:
+            raise IndexError("reversed view index out of range")
+        return self._sequence[size - 1 - index]
+
+    def __iter__(self) -> ty.Iterator[_T]:
+        return reversed(self._sequence)
+
+    def __reversed__(self) -> ty.Iterator[_T]:
+        return iter(self._sequence)
+
+    def __str__(self) -> str:
+        return f"ReversedView({list(self)})"
+
+    __repr__ = __str__
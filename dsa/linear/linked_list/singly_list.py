@@ -1,13 +1,22 @@
 import typing as ty
 from .node import ForwardNode
 from .abc import ListABC, NodeABC
+from .cursor import Cursor, _current, filter_inplace
+from .buffer import tolist
+from .pool import NodePool
+from .sort import merge_sort
+from itertools import islice
 
 _T = ty.TypeVar("_T")
 
 
 class SinglyList(ListABC[_T]):
-    def __init__(self, iterable: ty.Iterable[_T] | None = None, /) -> None:
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, pool_size: int = 0
+    ) -> None:
+        self._pool = NodePool(ForwardNode, pool_size) if pool_size else None
         self._head: None | NodeABC[_T] = None
+        self._tail: None | NodeABC[_T] = None
         self._size = 0
         if iterable is not None:
             self.extend(iterable)
@@ -16,6 +25,8 @@ class SinglyList(ListABC[_T]):
         return self._size
 
     def nodefactory(self, value: _T) -> NodeABC[_T]:
+        if self._pool is not None:
+            return self._pool.acquire(value)
         return ForwardNode(value)
 
     def empty(self) -> bool:
@@ -23,6 +34,8 @@ class SinglyList(ListABC[_T]):
 
     def getnode(self, index: int) -> NodeABC[_T]:
         index = self._size + index if index < 0 else index
+        if index == self._size - 1 and self._tail is not None:
+            return self._tail
         for current, node in enumerate(self):
             if current == index:
                 return node
@@ -43,44 +56,197 @@ class SinglyList(ListABC[_T]):
             temp = temp.next
             size += 1
 
-        if self.empty():
-            self._head = head.next
-            self._size = size
+        first = head.next
+        self.release(head)
+        if first is not None:
+            self._append_chain(first, temp, size)
+
+    def extend_from_buffer(self, buffer: ty.Any):
+        "Creates the nodes in one pass over the converted buffer."
+        values = tolist(buffer)
+        if self._pool is not None or not values:
+            return self.extend(values)
+        nodes = [*map(ForwardNode, values)]
+        for node, following in zip(nodes, islice(nodes, 1, None)):
+            node.next = following
+        self._append_chain(nodes[0], nodes[-1], len(nodes))
+
+    def _append_chain(self, first: NodeABC[_T], last: NodeABC[_T], size: int):
+        "Link the chain of `size` nodes from `first` to `last` after the tail."
+        if self._tail is None:
+            self._head = first
         else:
-            lastnode = self.getnode(-1)
-            lastnode.next = head.next
-            self._size += size
+            self._tail.next = first
+        self._tail = last
+        self._size += size
 
     def clear(self):
         self._head = None
+        self._tail = None
         self._size = 0
 
     def insert(self, index: int, node: NodeABC[_T]):
         node.clear()
-        if index == 0 or self.empty():
+        index = self._size + index if index < 0 else index
+        if index <= 0 or self._tail is None:
             node.next = self._head
             self._head = node
+            if self._tail is None:
+                self._tail = node
+        elif index >= self._size:
+            self._tail.next = node
+            self._tail = node
         else:
-            try:
-                before = self.getnode(index - 1)
-                node.next = before.next
-                before.next = node
-            except IndexError:
-                lastnode = self.getnode(-1)
-                lastnode.next = node
+            before = self.getnode(index - 1)
+            node.next = before.next
+            before.next = node
         self._size += 1
 
     def delnode(self, index: int) -> NodeABC[_T]:
         index = self._size + index if index < 0 else index
-        target = self.getnode(index)
-        if index == 0:
-            self._head = self._head.next # type: ignore
+        if index == 0 and self._head is not None:
+            target = self._head
+            self._head = target.next
+            before = None
         else:
-            before = self.getnode(index - 1)
+            before = self.getnode(index - 1) if index > 0 else None
+            if before is None or before.next is None:
+                raise IndexError
+            target = before.next
             before.next = target.next
+        if target is self._tail:
+            self._tail = before
         target.clear()
         self._size -= 1
         return target
 
     def __reversed__(self) -> ty.Iterator[NodeABC[_T]]:
-        return reversed(self)
+        "Without back links, the nodes are gathered first, `O(n)` memory."
+        return reversed([*self])
+
+    def reverse(self):
+        "Points every node at the one before it, allocates nothing."
+        before, node = None, self._head
+        while node is not None:
+            node.next, before, node = before, node, node.next
+        self._head, self._tail = self._tail, self._head
+
+    def sort(self, key: ty.Callable[[_T], ty.Any] | None = None, reverse=False):
+        self._head, self._tail, error = merge_sort(
+            self._head, self._size, key, reverse
+        )
+        if error is not None:
+            raise error
+
+    def concat(self, other: "SinglyList[_T]"):
+        "Move the nodes of `other` to the end, `O(1)`, `other` is left empty."
+        self.splice(self._size, other)
+
+    def splice(self, index: int, other: "SinglyList[_T]"):
+        "Move the nodes of `other` before node `index`, `other` is left empty."
+        self._check_family(other)
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        first, last, size = other._head, other._tail, other._size
+        if first is None or last is None:
+            return
+        other.clear()
+        if index == self._size:
+            self._append_chain(first, last, size)
+            return
+        if index == 0:
+            last.next, self._head = self._head, first
+        else:
+            before = self.getnode(index - 1)
+            last.next, before.next = before.next, first
+        self._size += size
+
+    def split_at(self, index: int) -> "SinglyList[_T]":
+        "Move the nodes from `index` on to a new list, returned."
+        index = max(0, min(self._size + index if index < 0 else index, self._size))
+        rest = type(self)()
+        if index == self._size:
+            return rest
+        if index == 0:
+            first = self._head
+        else:
+            before = self.getnode(index - 1)
+            first, before.next = before.next, None
+        rest._append_chain(first, self._tail, self._size - index)
+        if index == 0:
+            self.clear()
+        else:
+            self._tail, self._size = before, index
+        return rest
+
+    def cursor(self, index: int = 0) -> "SinglyCursor[_T]":
+        "A cursor on node `index`, `size()` for past the end."
+        index = self._size + index if index < 0 else index
+        if not 0 <= index <= self._size:
+            raise IndexError
+        before = self.getnode(index - 1) if index else None
+        return SinglyCursor(self, before)
+
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        return filter_inplace(self.cursor(), predicate)
+
+
+class SinglyCursor(Cursor[_T]):
+    "Remembers the node before the current one, to relink it in `O(1)`."
+
+    __slots__ = ("_list", "_before", "_node")
+
+    def __init__(self, _list: SinglyList[_T], before: NodeABC[_T] | None) -> None:
+        self._list = _list
+        self._before = before
+        self._node = _list._head if before is None else before.next
+
+    def __bool__(self) -> bool:
+        return self._node is not None
+
+    @property
+    def value(self) -> _T:
+        return _current(self._node).value
+
+    def replace(self, value: _T):
+        _current(self._node).value = value
+
+    def advance(self) -> bool:
+        self._before = _current(self._node)
+        self._node = self._node.next
+        return self._node is not None
+
+    def insert_before(self, value: _T):
+        _list, node = self._list, self._list.nodefactory(value)
+        node.next = self._node
+        if self._before is None:
+            _list._head = node
+        else:
+            self._before.next = node
+        if self._node is None:
+            _list._tail = node
+        self._before = node
+        _list._size += 1
+
+    def insert_after(self, value: _T):
+        current = _current(self._node)
+        node = self._list.nodefactory(value)
+        node.next = current.next
+        current.next = node
+        if current is self._list._tail:
+            self._list._tail = node
+        self._list._size += 1
+
+    def remove_current(self) -> _T:
+        _list, current = self._list, _current(self._node)
+        if self._before is None:
+            _list._head = current.next
+        else:
+            self._before.next = current.next
+        if current is _list._tail:
+            _list._tail = self._before
+        self._node = current.next
+        _list._size -= 1
+        current.clear()
+        value = current.value
+        _list.release(current)
+        return value
@@ -0,0 +1,78 @@
+"Stable bottom-up merge sort relinking the nodes of a list in place."
+
+import typing as ty
+
+
+class _Sentinel:
+    __slots__ = ("next",)
+
+    def __init__(self) -> None:
+        self.next: ty.Any = None
+
+
+def _cut(node: ty.Any, count: int) -> ty.Any:
+    "Cut the chain after `count` nodes from `node`, returns the rest."
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest, node.next = node.next, None
+    return rest
+
+
+def merge_sort(
+    head: ty.Any,
+    size: int,
+    key: ty.Callable[[ty.Any], ty.Any] | None = None,
+    reverse: bool = False,
+) -> tuple[ty.Any, ty.Any, BaseException | None]:
+    """
+    Sort the `size` nodes chained by `next` from `head`, the last one
+    pointing to None, by relinking them. Runs of 1, 2, 4... nodes are
+    merged pass by pass, without recursion, allocating a sentinel only.
+    Given a `key`, every key is computed before any node is touched, into
+    a dict by node, so values are never compared nor replaced.
+    Should a comparison raise, the runs still apart are chained after
+    the merged nodes, every node is kept though the order is partial,
+    and the error is returned for the caller to raise once its own links
+    are mended. Returns the new head, tail and that error, `prev` links
+    are left to the caller.
+    """
+    keys: dict[ty.Any, ty.Any] | None = None
+    if key is not None:
+        keys, node = {}, head
+        while node is not None:
+            keys[node] = key(node.value)
+            node = node.next
+    sentinel, width = _Sentinel(), 1
+    tail = head
+    while width < size:
+        tail, current = sentinel, head
+        while current is not None:
+            left = current
+            right = _cut(left, width)
+            current = _cut(right, width)
+            try:
+                while left is not None and right is not None:
+                    if keys is None:
+                        first, second = left.value, right.value
+                    else:
+                        first, second = keys[left], keys[right]
+                    # Equal values keep their order, reversed or not
+                    if first < second if reverse else second < first:
+                        tail.next, tail, right = right, right, right.next
+                    else:
+                        tail.next, tail, left = left, left, left.next
+            except BaseException as error:
+                for rest in left, right, current:
+                    tail.next = rest
+                    while tail.next is not None:
+                        tail = tail.next
+                return sentinel.next, tail, error
+            tail.next = left if left is not None else right
+            while tail.next is not None:
+                tail = tail.next
+        head, width = sentinel.next, width * 2
+    return head, tail, None
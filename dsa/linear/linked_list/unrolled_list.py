@@ -0,0 +1,227 @@
+from ..memory import MemoryReport, own_size, payload_size, sizeof
+from .abc import ListABC, NodeABC
+from .node import ForwardNode
+import typing as ty
+
+_T = ty.TypeVar("_T")
+
+
+class Block(ty.Generic[_T]):
+    "A node of an `UnrolledList`, up to `block_size` values in a row."
+
+    __slots__ = ("values", "next", "prev")
+
+    def __init__(self, values: list[_T]) -> None:
+        self.values = values
+        self.next: Block[_T] | None = None
+        self.prev: Block[_T] | None = None
+
+
+class Element(NodeABC[_T]):
+    "The node view of a value of an `UnrolledList`, its block and offset."
+
+    __slots__ = ("block", "offset")
+
+    def __init__(self, block: Block[_T], offset: int) -> None:
+        self.block = block
+        self.offset = offset
+
+    @property
+    def value(self) -> _T:  # type: ignore[override]
+        return self.block.values[self.offset]
+
+    @value.setter
+    def value(self, value: _T):
+        self.block.values[self.offset] = value
+
+    def clear(self):
+        ...
+
+
+class UnrolledList(ListABC[_T]):
+    """
+    A doubly linked list of blocks each holding up to `block_size`
+    values, one node per block instead of one per value. Indexing walks
+    blocks, not values, from the nearer end and inserting or deleting
+    in the middle moves at most a block of values. A full block is
+    split in two, a block under half full is merged into the next one.
+    """
+
+    def __init__(
+        self, iterable: ty.Iterable[_T] | None = None, /, *, block_size: int = 64
+    ) -> None:
+        assert block_size >= 2, block_size
+        self._block_size = block_size
+        self._head: Block[_T] | None = None
+        self._tail: Block[_T] | None = None
+        self._size: int = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def size(self) -> int:
+        return self._size
+
+    def nodefactory(self, value: _T) -> NodeABC[_T]:
+        return ForwardNode(value)
+
+    def empty(self) -> bool:
+        return self._head is None
+
+    def clear(self):
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+    def blocks(self, reverse: bool = False) -> ty.Iterator[Block[_T]]:
+        block, step = (self._tail, "prev") if reverse else (self._head, "next")
+        while block is not None:
+            yield block
+            block = getattr(block, step)
+
+    def _locate(self, index: int) -> tuple[Block[_T], int]:
+        "The block of value `index` and the offset of the value in it."
+        index = self._size + index if index < 0 else index
+        if not 0 <= index < self._size:
+            raise IndexError
+        if index < self._size // 2:
+            for block in self.blocks():
+                if index < len(block.values):
+                    return block, index
+                index -= len(block.values)
+        else:
+            index = self._size - 1 - index
+            for block in self.blocks(reverse=True):
+                if index < len(block.values):
+                    return block, len(block.values) - 1 - index
+                index -= len(block.values)
+        raise IndexError
+
+    def getnode(self, index: int) -> NodeABC[_T]:
+        return Element(*self._locate(index))
+
+    def _link_after(self, block: Block[_T] | None, new: Block[_T]):
+        "Link `new` after `block`, at the head when `block` is None."
+        new.prev = block
+        new.next = self._head if block is None else block.next
+        if new.next is None:
+            self._tail = new
+        else:
+            new.next.prev = new
+        if block is None:
+            self._head = new
+        else:
+            block.next = new
+
+    def _unlink(self, block: Block[_T]):
+        if block.prev is None:
+            self._head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self._tail = block.prev
+        else:
+            block.next.prev = block.prev
+
+    def insert(self, index: int, node: NodeABC[_T]):
+        index = self._size + index if index < 0 else index
+        value = node.value
+        if self._tail is None:
+            block = Block([value])
+            self._link_after(None, block)
+        elif index >= self._size:
+            block = self._tail
+            block.values.append(value)
+        else:
+            block, offset = self._locate(max(index, 0))
+            block.values.insert(offset, value)
+        self._size += 1
+        if len(block.values) > self._block_size:
+            half = len(block.values) // 2
+            self._link_after(block, Block(block.values[half:]))
+            del block.values[half:]
+
+    def delnode(self, index: int) -> NodeABC[_T]:
+        block, offset = self._locate(index)
+        node = self.nodefactory(block.values.pop(offset))
+        self._size -= 1
+        following = block.next
+        if not block.values:
+            self._unlink(block)
+        elif (
+            following is not None
+            and len(block.values) < self._block_size // 2
+            and len(block.values) + len(following.values) <= self._block_size
+        ):
+            block.values.extend(following.values)
+            self._unlink(following)
+        return node
+
+    def extend(self, iterable: ty.Iterable[_T]):
+        size = self._block_size
+        block = self._tail
+        values = iter(iterable)
+        if block is not None and len(block.values) < size:
+            room = size - len(block.values)
+            chunk = [value for _, value in zip(range(room), values)]
+            block.values.extend(chunk)
+            self._size += len(chunk)
+        while True:
+            chunk = [value for _, value in zip(range(size), values)]
+            if not chunk:
+                break
+            self._link_after(self._tail, Block(chunk))
+            self._size += len(chunk)
+
+    def filter_inplace(self, predicate: ty.Callable[[_T], object]) -> int:
+        "Remove the values failing `predicate` block by block, returns how many."
+        removed = 0
+        for block in [*self.blocks()]:
+            kept = [value for value in block.values if predicate(value)]
+            removed += len(block.values) - len(kept)
+            if kept:
+                block.values[:] = kept
+            else:
+                self._unlink(block)
+        self._size -= removed
+        return removed
+
+    def reverse(self):
+        "Reverses the order of the blocks and the values in each of them."
+        block = self._head
+        while block is not None:
+            block.values.reverse()
+            block.next, block.prev = block.prev, block.next
+            block = block.prev
+        self._head, self._tail = self._tail, self._head
+
+    def sort(self, key: ty.Callable[[_T], ty.Any] | None = None, reverse=False):
+        "Sorts the values and refills the blocks, none are allocated."
+        values = sorted(self.values(), key=key, reverse=reverse)  # type: ignore
+        start = 0
+        for block in self.blocks():
+            end = start + len(block.values)
+            block.values[:] = values[start:end]
+            start = end
+
+    def values(self, reverse: bool = False) -> ty.Iterator[_T]:
+        for block in self.blocks(reverse):
+            yield from reversed(block.values) if reverse else block.values
+
+    def __iter__(self) -> ty.Iterator[NodeABC[_T]]:
+        for block in self.blocks():
+            for offset in range(len(block.values)):
+                yield Element(block, offset)
+
+    def __reversed__(self) -> ty.Iterator[NodeABC[_T]]:
+        for block in self.blocks(reverse=True):
+            for offset in reversed(range(len(block.values))):
+                yield Element(block, offset)
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self._size)
+        report.add("container", own_size(self))
+        for block in self.blocks():
+            report.add("nodes", sizeof(block) + sizeof(block.values))
+        if payload:
+            report.add("payload", payload_size(self.values()))
+        return report
@@ -0,0 +1,77 @@
+"""
+Memory accounting for the containers of this package.
+
+Every container offers `memory_report()`, it walks the internal
+structures (bucket arrays, chain nodes, entries) and sums their sizes
+per category, `__sizeof__` reports the same without the payload so
+`sys.getsizeof` accounts for the whole structure.
+
+Sizes are the ones `sys.getsizeof` reports. Attribute dictionaries of
+instances without `__slots__` are included, note that on recent pythons
+reading `__dict__` materialises it. Payload objects are counted once
+each and shallowly, what they refer to is not followed.
+"""
+
+import dataclasses as dt, sys, typing as ty
+
+
+def sizeof(obj: object) -> int:
+    "Size of an object together with its attribute dictionary."
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(vars(obj))
+    return size
+
+
+def own_size(container: object) -> int:
+    """
+    Size of a container object itself, `sizeof` would call back into
+    its `__sizeof__` which is implemented with a memory report.
+    """
+    size = object.__sizeof__(container)
+    if hasattr(container, "__dict__"):
+        size += sys.getsizeof(vars(container))
+    return size
+
+
+def payload_size(objects: ty.Iterable[object]) -> int:
+    "Shallow size of the distinct objects in `objects`."
+    seen: set[int] = set()
+    size = 0
+    for obj in objects:
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            size += sys.getsizeof(obj)
+    return size
+
+
+@dt.dataclass(slots=True)
+class MemoryReport:
+    name: str
+    entries: int
+    categories: dict[str, int] = dt.field(default_factory=dict)
+    load_factor: float | None = None
+    # Chain length (probe count for open addressing) to bucket count
+    chain_lengths: dict[int, int] | None = None
+
+    def add(self, category: str, size: int):
+        self.categories[category] = self.categories.get(category, 0) + size
+
+    @property
+    def total(self) -> int:
+        return sum(self.categories.values())
+
+    @property
+    def per_entry(self) -> float:
+        return self.total / self.entries if self.entries else 0.0
+
+    def __str__(self) -> str:
+        lines = [f"{self.name}: {self.total} bytes, {self.entries} entries"]
+        width = max(map(len, self.categories), default=0)
+        for category, size in self.categories.items():
+            lines.append(f"  {category:<{width}}  {size:>12}")
+        if self.load_factor is not None:
+            lines.append(f"  load factor: {self.load_factor:.3f}")
+        if self.chain_lengths is not None:
+            lines.append(f"  chain lengths: {self.chain_lengths}")
+        return "\n".join(lines)
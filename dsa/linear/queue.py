@@ -1,11 +1,13 @@
 from .linked_list import list as _list
 from . import heap as _heap
+from .memory import MemoryReport, own_size, payload_size, sizeof
+from .ring_buffer import RingBuffer
 import typing as ty
 
 _T = ty.TypeVar("_T")
 
 
-__all__ = "Queue", "LIFOQueue", "PriorityQueue", "Deque"
+__all__ = "Queue", "LIFOQueue", "PriorityQueue", "Deque", "RingQueue", "RingDeque"
 
 
 class QueueError(Exception):
@@ -24,8 +26,8 @@ class Queue(ty.Generic[_T]):
     def __init__(
         self, iterable: ty.Iterable[_T] | None = None, maxsize: int | None = None
     ) -> None:
-        self._queue = self._store_factory()
         self._maxsize = maxsize or 0
+        self._queue = self._store_factory()
         self._size = 0
         if iterable is not None:
             self.extend(iterable)
@@ -64,6 +66,23 @@ class Queue(ty.Generic[_T]):
         for value in iterable:
             self.append(value)
 
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        "The report of the underlying store, plus the queue object."
+        store = self._queue
+        if hasattr(store, "memory_report"):
+            report = store.memory_report(payload)
+            report.name = type(self).__name__
+        else:
+            report = MemoryReport(type(self).__name__, len(store))
+            report.add("store", sizeof(store))
+            if payload:
+                report.add("payload", payload_size(store))
+        report.add("container", own_size(self))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
     def __str__(self) -> str:
         name = self.__class__.__name__
         return f"{name}({list(self._queue)})"
@@ -120,3 +139,39 @@ class Deque(LIFOQueue[_T]):
     def extendleft(self, iterable: ty.Iterable[_T]):
         for value in iterable:
             self.appendleft(value)
+
+    def reverse(self):
+        "Reverses the deque in place, the store is not copied."
+        self._queue.reverse()
+
+
+def _ring_buffer(maxsize: int) -> RingBuffer:
+    "A ring buffer store, sized once and for all for a bounded queue."
+    return RingBuffer(capacity=maxsize, fixed=maxsize > 0)
+
+
+class RingQueue(Queue[_T]):
+    "A `Queue` over a ring buffer, no allocation per item."
+
+    _queue: RingBuffer[_T]
+
+    def _store_factory(self) -> ty.MutableSequence:
+        return _ring_buffer(self._maxsize)
+
+    def _pop(self) -> _T:
+        return self._queue.popleft()
+
+
+class RingDeque(Deque[_T]):
+    "A `Deque` over a ring buffer, no allocation per item."
+
+    _queue: RingBuffer[_T]
+
+    def _store_factory(self) -> ty.MutableSequence:
+        return _ring_buffer(self._maxsize)
+
+    def _appendleft(self, value: _T):
+        self._queue.appendleft(value)
+
+    def _popleft(self) -> _T:
+        return self._queue.popleft()
@@ -0,0 +1,169 @@
+from .memory import MemoryReport, own_size, payload_size, sizeof
+import typing as ty
+
+_T = ty.TypeVar("_T")
+
+
+class RingBuffer(ty.MutableSequence[_T]):
+    """
+    A growable circular array. Items live in a power of two sized list
+    from `head` on, wrapping around its end, so appending and popping
+    at either end is O(1) and allocates nothing per item. Given a
+    `capacity` and `fixed`, the buffer never holds more than `capacity`
+    items and appending to a full one raises an `OverflowError`.
+    """
+
+    __slots__ = ("_buffer", "_head", "_size", "_mask", "_limit")
+
+    def __init__(
+        self,
+        iterable: ty.Iterable[_T] | None = None,
+        /,
+        *,
+        capacity: int = 0,
+        fixed: bool = False,
+    ) -> None:
+        assert not fixed or capacity > 0, "a fixed buffer needs a capacity"
+        size = 8
+        while size < capacity:
+            size <<= 1
+        self._buffer: list[_T | None] = [None] * size
+        self._head = 0
+        self._size = 0
+        self._mask = size - 1
+        self._limit = capacity if fixed else None
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def capacity(self) -> int:
+        "The number of items held before the buffer grows, or overflows."
+        return len(self._buffer) if self._limit is None else self._limit
+
+    def full(self) -> bool:
+        return self._size == self.capacity
+
+    def _grow(self):
+        if self._limit is not None:
+            raise OverflowError(f"ring buffer is full, capacity {self._limit}")
+        buffer, head = self._buffer, self._head
+        size = len(buffer)
+        self._buffer = buffer[head:] + buffer[:head] + [None] * size
+        self._head = 0
+        self._mask = size * 2 - 1
+
+    def _index(self, index: int) -> int:
+        "Position in the buffer of item `index`, negative indices allowed."
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return (self._head + index) & self._mask
+
+    def append(self, value: _T):
+        if self._size == len(self._buffer) or self._size == self._limit:
+            self._grow()
+        self._buffer[(self._head + self._size) & self._mask] = value
+        self._size += 1
+
+    def appendleft(self, value: _T):
+        if self._size == len(self._buffer) or self._size == self._limit:
+            self._grow()
+        self._head = (self._head - 1) & self._mask
+        self._buffer[self._head] = value
+        self._size += 1
+
+    def popleft(self) -> _T:
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        head = self._head
+        value, self._buffer[head] = self._buffer[head], None
+        self._head = (head + 1) & self._mask
+        self._size -= 1
+        return ty.cast(_T, value)
+
+    def pop(self, index: int = -1) -> _T:
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        if index == 0:
+            return self.popleft()
+        if index != -1 and index != self._size - 1:
+            value = self[index]
+            del self[index]
+            return value
+        tail = (self._head + self._size - 1) & self._mask
+        value, self._buffer[tail] = self._buffer[tail], None
+        self._size -= 1
+        return ty.cast(_T, value)
+
+    def __getitem__(self, index: int) -> _T:
+        return ty.cast(_T, self._buffer[self._index(index)])
+
+    def __setitem__(self, index: int, value: _T):
+        self._buffer[self._index(index)] = value
+
+    def _shift(self, indices: ty.Iterable[int], step: int):
+        "Move the items at `indices` by `step` places."
+        buffer, head, mask = self._buffer, self._head, self._mask
+        for index in indices:
+            buffer[(head + index + step) & mask] = buffer[(head + index) & mask]
+
+    def __delitem__(self, index: int):
+        self._index(index)  # Bounds check
+        index %= self._size
+        # Move the shorter side of the buffer over the hole
+        if index < self._size // 2:
+            self._shift(range(index - 1, -1, -1), 1)
+            self.popleft()
+        else:
+            self._shift(range(index + 1, self._size), -1)
+            self.pop()
+
+    def insert(self, index: int, value: _T):
+        size = self._size
+        index = max(0, min(index + size if index < 0 else index, size))
+        if index < size // 2:
+            self.appendleft(value)
+            self._shift(range(1, index + 1), -1)
+        else:
+            self.append(value)
+            self._shift(range(size - 1, index - 1, -1), 1)
+        self[index] = value
+
+    def extend(self, values: ty.Iterable[_T]):
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self._buffer[:] = [None] * len(self._buffer)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> ty.Generator[_T, None, None]:
+        buffer, head, mask = self._buffer, self._head, self._mask
+        for index in range(self._size):
+            yield ty.cast(_T, buffer[(head + index) & mask])
+
+    def __reversed__(self) -> ty.Generator[_T, None, None]:
+        buffer, head, mask = self._buffer, self._head, self._mask
+        for index in range(self._size - 1, -1, -1):
+            yield ty.cast(_T, buffer[(head + index) & mask])
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self._size)
+        report.add("container", own_size(self))
+        report.add("buffer", sizeof(self._buffer))
+        if payload:
+            report.add("payload", payload_size(self))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
+    def __str__(self) -> str:
+        return f"RingBuffer({list(self)})"
+
+    __repr__ = __str__
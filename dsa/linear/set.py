@@ -1,65 +1,87 @@
-from ._util import ValueList, Hashable, Array, myhash
+from ._util import ChainedBuckets, Hashable, myhash, myhash_many
+from itertools import islice
+from operator import itemgetter
 import typing as ty
 
 _ValueType = ty.TypeVar("_ValueType", str, int, float, bytes, Hashable)
-
-
-class Set(ty.MutableSet[_ValueType]):
-    def __init__(self, iterable: ty.Iterable[_ValueType] | None = None, /) -> None:
-        self._store: Array[ValueList[_ValueType]] = Array(8)
-        self._store.fill(ValueList)
-        self._max_load: float = 0.7
-        self._used: int = 0
+_BATCH = 4096  # Values `update` hashes at once
+
+
+# Every chain holds `(hash, value)` entries so probes never rehash.
+class Set(ChainedBuckets[tuple[int, _ValueType]], ty.MutableSet[_ValueType]):
+    _hashof = itemgetter(0)
+    _payloadof = itemgetter(slice(1, None))
+
+    def __init__(
+        self,
+        iterable: ty.Iterable[_ValueType] | None = None,
+        /,
+        *,
+        capacity: int = 0,
+        rehash_steps: int | None = None,
+    ) -> None:
+        self._init_buckets(capacity, rehash_steps)
         if iterable is not None:
-            for item in iterable:
-                self.add(item)
+            self.update(iterable)
+
+    def update(self, iterable: ty.Iterable[_ValueType]):
+        "Add all values, growing the buckets a single time given their count."
+        if isinstance(iterable, Set):
+            self._reserve(len(iterable))
+            for entry in iterable._entries():
+                if not self._has(entry):
+                    self._append(entry)
+            return
+        if isinstance(iterable, ty.Sized):
+            self._reserve(len(iterable))
+        values = iter(iterable)
+        while batch := [*islice(values, _BATCH)]:
+            for value, _hash in zip(batch, myhash_many(batch)):
+                self._add(value, _hash)
+
+    def _find(self, value: ty.Any, _hash: int, write: bool = False):
+        "The bucket chain of `value` and its index there, -1 if it is missing."
+        vlist = self._write_bucket(_hash) if write else self._bucket(_hash)
+        for index, (h, v) in enumerate(vlist):
+            if h == _hash and (v is value or v == value):
+                return vlist, index
+        return vlist, -1
 
-    @property
-    def _size(self) -> int:
-        return self._store._size
+    def contains(self, value: ty.Any):
+        return self._find(value, myhash(value))[1] >= 0
 
-    @property
-    def _load_factor(self) -> float:
-        return self._used / self._size
+    def add(self, value: _ValueType):
+        self._add(value, myhash(value))
 
-    def _stabilize(self):
-        if self._load_factor < self._max_load:
+    def _add(self, value: _ValueType, _hash: int):
+        vlist, index = self._find(value, _hash, write=True)
+        if index >= 0:
             return
-        values = list(self)
-        self._store._grow(self._size)
-        self._store.fill(ValueList)
-        for value in values:
-            self.add(value)
+        vlist.append((_hash, value))
+        self._used += 1
+        self._stabilize()
 
-    def contains(self, value: ty.Any):
-        _hash = myhash(value)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for v in vlist:
-            if myhash(v) == _hash:
-                return True
-        return False
+    def _has(self, entry: tuple[int, _ValueType]) -> bool:
+        "Membership test reusing the cached hash of another set's entry."
+        return self._find(entry[1], entry[0])[1] >= 0
 
-    def add(self, value: _ValueType):
-        _hash = myhash(value)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for _value in vlist:
-            if myhash(_value) == _hash:
-                return
-        vlist.append(value)
+    def _append(self, entry: tuple[int, _ValueType]):
+        "Store an entry known to be missing, tuples are shared between sets."
+        self._write_bucket(entry[0]).append(entry)
         self._used += 1
         self._stabilize()
 
-    def _remove(self, value: _ValueType) -> bool:
-        _hash = myhash(value)
-        index = _hash % self._size
-        vlist = self._store[index]
-        for idx, _value in enumerate(vlist):
-            if myhash(_value) == _hash:
-                vlist.delvalue(idx)
-                return True
-        return False
+    def _entries(self) -> ty.Generator[tuple[int, _ValueType], None, None]:
+        for vlist in self._buckets():
+            yield from vlist
+
+    def _remove(self, value: _ValueType, _hash: int | None = None) -> bool:
+        _hash = myhash(value) if _hash is None else _hash
+        vlist, index = self._find(value, _hash, write=True)
+        if index < 0:
+            return False
+        vlist.delvalue(index)
+        return True
 
     def discard(self, value: _ValueType) -> None:
         self._used -= self._remove(value)
@@ -76,17 +98,80 @@ class Set(ty.MutableSet[_ValueType]):
         raise ValueError("pop from an empty set.")
 
     def clear(self) -> None:
-        self._store.fill(ValueList)
-        self._used = 0
+        self._clear_buckets()
+
+    @staticmethod
+    def _coerce(other: ty.Iterable[_ValueType]) -> "Set[_ValueType]":
+        return other if isinstance(other, Set) else Set(other)
 
     def union(self, other: "ty.AbstractSet[_ValueType]") -> "Set[_ValueType]":
-        return Set([*self, *other])
+        larger, smaller = sorted((self, self._coerce(other)), key=len, reverse=True)
+        result: Set[_ValueType] = Set(capacity=len(larger) + len(smaller))
+        for entry in larger._entries():
+            result._append(entry)
+        result.update(smaller)
+        return result
 
     def intersection(self, other: "ty.AbstractSet[_ValueType]") -> "Set[_ValueType]":
-        return Set([item for item in self if item in other])
+        smaller, larger = sorted((self, self._coerce(other)), key=len)
+        result: Set[_ValueType] = Set(capacity=len(smaller))
+        for entry in smaller._entries():
+            if larger._has(entry):
+                result._append(entry)
+        return result
 
     def difference(self, other: "ty.AbstractSet[_ValueType]") -> "Set[_ValueType]":
-        return Set([item for item in self if item not in self.intersection(other)])
+        other = self._coerce(other)
+        result: Set[_ValueType] = Set(capacity=len(self))
+        for entry in self._entries():
+            if not other._has(entry):
+                result._append(entry)
+        return result
+
+    def symmetric_difference(
+        self, other: "ty.AbstractSet[_ValueType]"
+    ) -> "Set[_ValueType]":
+        other = self._coerce(other)
+        result = self.difference(other)
+        result._reserve(len(other))
+        for entry in other._entries():
+            if not self._has(entry):
+                result._append(entry)
+        return result
+
+    def __ior__(self, other: "ty.AbstractSet[_ValueType]") -> ty.Self:  # type: ignore
+        self.update(other)
+        return self
+
+    def __iand__(self, other: "ty.AbstractSet[ty.Any]") -> ty.Self:
+        other = self._coerce(other)
+        doomed = [entry for entry in self._entries() if not other._has(entry)]
+        for _hash, value in doomed:
+            self._used -= self._remove(value, _hash)
+        return self
+
+    def __isub__(self, other: "ty.AbstractSet[ty.Any]") -> ty.Self:
+        other = self._coerce(other)
+        if len(other) > len(self):
+            doomed = [entry for entry in self._entries() if other._has(entry)]
+        else:
+            doomed = [*other._entries()]
+        for _hash, value in doomed:
+            self._used -= self._remove(value, _hash)
+        return self
+
+    def __ixor__(self, other: "ty.AbstractSet[_ValueType]") -> ty.Self:  # type: ignore
+        other = self._coerce(other)
+        if other is self:
+            self.clear()
+            return self
+        self._reserve(len(other))
+        for _hash, value in other._entries():
+            if not self._remove(value, _hash):
+                self._append((_hash, value))
+            else:
+                self._used -= 1
+        return self
 
     def __eq__(self, other: object) -> bool:
         return all(item in other for item in self) and all(
@@ -95,6 +180,7 @@ class Set(ty.MutableSet[_ValueType]):
 
     __and__ = intersection
     __sub__ = difference
+    __xor__ = symmetric_difference
     __or__ = __add__ = union
 
     def __contains__(self, x: object) -> bool:
@@ -111,9 +197,11 @@ class Set(ty.MutableSet[_ValueType]):
         return self._used
 
     def __iter__(self) -> ty.Generator[_ValueType, None, None]:
-        for vlist in self._store:
-            yield from vlist
+        for vlist in self._buckets():
+            for _, value in vlist:
+                yield value
 
     def __reversed__(self) -> ty.Generator[_ValueType, None, None]:
-        for vlist in reversed(self._store):
-            yield from reversed(vlist)
+        for vlist in self._buckets(reverse=True):
+            for _, value in reversed(vlist):
+                yield value
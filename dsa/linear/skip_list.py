@@ -0,0 +1,253 @@
+"""
+A skip list, an ordered map of linked lists stacked in levels.
+
+Every node is on level 0, a doubly linked list in key order, and on
+each level above with probability `p`, up to `max_level`. Searching
+starts on the top level and drops a level whenever the next key is too
+large, so `find`, `insert` and `delete` walk expected `O(log n)` nodes.
+Each link also counts the level 0 nodes it skips, giving the rank of a
+key and the item at an index in the same time.
+"""
+
+from .memory import MemoryReport, own_size, payload_size, sizeof
+from itertools import chain
+import random, typing as ty
+
+__all__ = ("SkipList",)
+
+
+class _Ordered(ty.Protocol):
+    def __lt__(self, other: ty.Any, /) -> bool: ...
+
+
+class SkipNode[K, V]:
+    __slots__ = ("key", "value", "next", "width", "prev")
+
+    def __init__(self, key: K, value: V, level: int) -> None:
+        self.key = key
+        self.value = value
+        self.next: list[SkipNode[K, V] | None] = [None] * level
+        # Level 0 nodes from this one to `next`, the end counts as one
+        self.width: list[int] = [1] * level
+        self.prev: SkipNode[K, V] | None = None
+
+    def clear(self):
+        self.next = [None] * len(self.next)
+        self.prev = None
+
+
+class SkipList[K: _Ordered, V](ty.MutableMapping[K, V]):
+    def __init__(
+        self,
+        iterable: ty.Iterable[tuple[K, V]] | None = None,
+        /,
+        *,
+        p: float = 0.5,
+        max_level: int = 32,
+    ) -> None:
+        assert 0 < p < 1, p
+        assert max_level >= 1, max_level
+        self._p = p
+        self._max_level = max_level
+        self._head = SkipNode[K, V](ty.cast(K, None), ty.cast(V, None), max_level)
+        self._tail: SkipNode[K, V] | None = None
+        self._level = 1  # Levels in use
+        self._size = 0
+        if iterable is not None:
+            for key, value in iterable:
+                self.insert(key, value)
+
+    @property
+    def p(self) -> float:
+        return self._p
+
+    @property
+    def max_level(self) -> int:
+        return self._max_level
+
+    def _random_level(self) -> int:
+        level, p, chance = 1, self._p, random.random
+        while level < self._max_level and chance() < p:
+            level += 1
+        return level
+
+    def _search(
+        self, key: K
+    ) -> tuple[list[SkipNode[K, V]], list[int], SkipNode[K, V] | None]:
+        """
+        The last node before `key` on each level in use, its position
+        (the head being 0), and the first node not before `key`.
+        """
+        before = [self._head] * self._level
+        positions = [0] * self._level
+        node, position = self._head, 0
+        for level in reversed(range(self._level)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node, following = following, following.next[level]
+            before[level], positions[level] = node, position
+        return before, positions, node.next[0]
+
+    def insert(self, key: K, value: V):
+        "Map `key` to `value`, replacing the value of a present key."
+        before, positions, found = self._search(key)
+        if found is not None and not key < found.key:
+            found.value = value
+            return
+        level = self._random_level()
+        head = self._head
+        for _ in range(self._level, level):
+            before.append(head)
+            positions.append(0)
+            head.width[len(before) - 1] = self._size + 1
+        self._level = max(self._level, level)
+        node, position = SkipNode(key, value, level), positions[0] + 1
+        for index in range(level):
+            previous, offset = before[index], position - positions[index]
+            node.next[index], previous.next[index] = previous.next[index], node
+            node.width[index] = previous.width[index] - offset + 1
+            previous.width[index] = offset
+        for index in range(level, self._level):
+            before[index].width[index] += 1
+        node.prev = None if before[0] is head else before[0]
+        if node.next[0] is None:
+            self._tail = node
+        else:
+            node.next[0].prev = node
+        self._size += 1
+
+    def delete(self, key: K) -> V:
+        "Remove `key`, returns its value."
+        before, _, found = self._search(key)
+        if found is None or key < found.key:
+            raise KeyError(key)
+        for index in range(self._level):
+            previous = before[index]
+            if previous.next[index] is found:
+                previous.width[index] += found.width[index] - 1
+                previous.next[index] = found.next[index]
+            else:
+                previous.width[index] -= 1
+        if found.next[0] is None:
+            self._tail = found.prev
+        else:
+            found.next[0].prev = found.prev
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        found.clear()
+        return found.value
+
+    def find(self, key: K) -> SkipNode[K, V] | None:
+        "The node of `key`, None when absent."
+        *_, found = self._search(key)
+        return None if found is None or key < found.key else found
+
+    def floor(self, key: K) -> tuple[K, V]:
+        "The item of the largest key not above `key`."
+        before, _, found = self._search(key)
+        if found is not None and not key < found.key:
+            return found.key, found.value
+        if before[0] is self._head:
+            raise KeyError(key)
+        return before[0].key, before[0].value
+
+    def ceil(self, key: K) -> tuple[K, V]:
+        "The item of the smallest key not below `key`."
+        *_, found = self._search(key)
+        if found is None:
+            raise KeyError(key)
+        return found.key, found.value
+
+    def rank(self, key: K) -> int:
+        "The number of keys below `key`."
+        _, positions, _ = self._search(key)
+        return positions[0]
+
+    def at(self, index: int) -> tuple[K, V]:
+        "The item at `index` in key order, negative indices allowed."
+        index = self._size + index if index < 0 else index
+        if not 0 <= index < self._size:
+            raise IndexError("skip list index out of range")
+        node, position, index = self._head, 0, index + 1  # The head is 0
+        for level in reversed(range(self._level)):
+            following = node.next[level]
+            while following is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node, following = following, following.next[level]
+        return node.key, node.value
+
+    def irange(
+        self, low: K | None = None, high: K | None = None, *, reverse: bool = False
+    ) -> ty.Iterator[tuple[K, V]]:
+        "The items with `low <= key < high` in key order, None leaves a side open."
+        if reverse:
+            node = self._tail
+            if high is not None:
+                node = self._search(high)[0][0]
+                node = None if node is self._head else node
+            while node is not None and (low is None or not node.key < low):
+                yield node.key, node.value
+                node = node.prev
+        else:
+            node = self._head.next[0] if low is None else self._search(low)[2]
+            while node is not None and (high is None or node.key < high):
+                yield node.key, node.value
+                node = node.next[0]
+
+    def items(self) -> ty.Iterator[tuple[K, V]]:  # type: ignore[override]
+        return self.irange()
+
+    def values(self) -> ty.Iterator[V]:  # type: ignore[override]
+        return (value for _, value in self.irange())
+
+    def __getitem__(self, key: K) -> V:
+        node = self.find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __contains__(self, key: object) -> bool:
+        return self.find(ty.cast(K, key)) is not None
+
+    __setitem__ = insert
+
+    def __delitem__(self, key: K):
+        self.delete(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> ty.Iterator[K]:
+        return (key for key, _ in self.irange())
+
+    def __reversed__(self) -> ty.Iterator[K]:
+        return (key for key, _ in self.irange(reverse=True))
+
+    def clear(self):
+        self._head = SkipNode[K, V](ty.cast(K, None), ty.cast(V, None), self._max_level)
+        self._tail = None
+        self._level = 1
+        self._size = 0
+
+    def memory_report(self, payload: bool = True) -> MemoryReport:
+        report = MemoryReport(type(self).__name__, self._size)
+        report.add("container", own_size(self))
+        node: SkipNode[K, V] | None = self._head
+        while node is not None:
+            size = sizeof(node) + sizeof(node.next) + sizeof(node.width)
+            report.add("head" if node is self._head else "nodes", size)
+            node = node.next[0]
+        if payload:
+            report.add("payload", payload_size(chain.from_iterable(self.items())))
+        return report
+
+    def __sizeof__(self) -> int:
+        return self.memory_report(payload=False).total
+
+    def __str__(self) -> str:
+        items = [f"{key!r}: {value!r}" for key, value in self.irange()]
+        return "SkipList({" + ", ".join(items) + "})"
+
+    __repr__ = __str__
@@ -0,0 +1,170 @@
+import typing as ty
+from ..tree.speed_test import timeit
+from . import array, disjoint_set as ds, hash_table as ht, heap, _util
+from .linked_list import list as ll, node as ln
+
+
+def allocated[
+    **P, T
+](function: ty.Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> tuple[T, int]:
+    "The result of `function` and the bytes it left allocated."
+    import gc, tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function(*args, **kwargs)
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def _dict_backed(cls: type) -> type:
+    "A twin of slotted `cls` keeping its attributes in a `__dict__`."
+    return type(cls.__name__, (), {"__init__": cls.__init__})
+
+
+def node_memory_test(n: int):
+    "Bytes per node, dict backed twins against the slotted classes."
+    classes: list[tuple[type, int]] = [  # The class and its argument count
+        (_util.Node, 1),
+        (ht.KeyValueNode, 2),
+        (array.Bucket, 1),
+        (ln.ForwardNode, 1),
+        (ln.Node, 1),
+        (ln.CircularNode, 1),
+    ]
+    arguments = [(value,) for value in range(n)]  # Not part of the measure
+    for cls, arity in classes:
+        args = arguments if arity == 1 else [a * 2 for a in arguments]
+        twin = _dict_backed(cls)
+        _, before = allocated(lambda: [twin(*a) for a in args])
+        _, after = allocated(lambda: [cls(*a) for a in args])
+        print(
+            f"{cls.__module__}.{cls.__name__}: "
+            f"{before / n:.1f} -> {after / n:.1f} bytes per node"
+        )
+
+
+def container_memory_test(n: int):
+    "Bytes per element of whole containers, payload excluded."
+    containers: list[ty.Callable[[list[int]], ty.Sized]] = [
+        ll.SinglyLinkedList,
+        ll.DoublyLinkedList,
+        ll.CirDoublyLinkedList,
+        lambda values: ht.HashTable(zip(values, values)),
+        lambda values: ht.CompactHashTable(zip(values, values)),
+    ]
+    values = list(range(n))
+    for container in containers:
+        built, size = allocated(container, values)
+        print(f"{type(built).__name__}: {size / n:.1f} bytes per element")
+
+
+def heap_speed_test(n: int, runs: int):
+    "Push then pop `n` floats, every heap type against `heapq`."
+    import heapq, random
+
+    values = [random.random() for _ in range(n)]
+    negated = [-value for value in values]
+
+    def heapq_pushpop(values: list[float]):
+        items: list[float] = []
+        for value in values:
+            heapq.heappush(items, value)
+        while items:
+            heapq.heappop(items)
+
+    for heap_type in heap.HeapType:
+
+        def pushpop(values: list[float]):
+            items: list[float] = []
+            for value in values:
+                heap.heappush(items, value, heap_type)
+            while items:
+                heap.heappop(items, 0, heap_type)
+
+        pushpop.__name__ = f"heap.{heap_type.name}"
+        timeit(runs, pushpop, values)
+    heapq_pushpop.__name__ = "heapq"
+    timeit(runs, heapq_pushpop, values)
+    heapq_pushpop.__name__ = "heapq, negated for a max-heap"
+    timeit(runs, heapq_pushpop, negated)
+
+
+def pool_churn_test(cycles: int, backlog: int = 100, pool_size: int = 64):
+    "Node allocations and GC passes of `cycles` push/pop pairs, pooled or not."
+    import gc, time
+
+    lists: list[type[ll.SinglyLinkedList]] = [
+        ll.SinglyLinkedList,
+        ll.DoublyLinkedList,
+        ll.CirDoublyLinkedList,
+    ]
+    for List in lists:
+        for size in 0, pool_size:
+            queue = List(range(backlog), pool_size=size)
+            gc.collect()
+            collections = gc.get_stats()[0]["collections"]
+            start = time.perf_counter()
+            for value in range(cycles):
+                queue.append(value)
+                queue.pop(0)
+            lapse = time.perf_counter() - start
+            collections = gc.get_stats()[0]["collections"] - collections
+            allocations = cycles if queue.pool is None else queue.pool.misses
+            print(
+                f"{List.__name__}(pool_size={size}): {allocations} node allocations,"
+                f" {collections} gen0 collections, {lapse:.3f}s"
+            )
+
+
+def buffer_speed_test(n: int, runs: int):
+    "Round trip `n` floats between an `array.array` and the linked lists."
+    from array import array
+
+    values = array("d", range(n))
+    lists: list[type[ll.SinglyLinkedList]] = [
+        ll.SinglyLinkedList,
+        ll.DoublyLinkedList,
+        ll.CirDoublyLinkedList,
+    ]
+    for List in lists:
+        built = List.from_array(values)
+        steps: dict[str, ty.Callable[[], object]] = {
+            "extend": lambda: List(values),
+            "from_array": lambda: List.from_array(values),
+            "array(list)": lambda: array("d", built),
+            "to_array": lambda: built.to_array(typecode="d"),
+        }
+        for name, step in steps.items():
+            step.__name__ = f"{List.__name__}, {name}"
+            timeit(runs, step)
+
+
+def disjoint_set_speed_test(n: int, unions: int, runs: int):
+    "Random unions over `n` elements, dict against dense forests."
+    import random
+
+    pairs = [(random.randrange(n), random.randrange(n)) for _ in range(unions)]
+    for dense in False, True:
+
+        def merge_pairs(pairs: list[tuple[int, int]]):
+            dset = ds.DisjointSet(range(n), dense=dense)
+            for e1, e2 in pairs:
+                dset.merge(e1, e2)
+
+        merge_pairs.__name__ = f"DisjointSet(dense={dense})"
+        timeit(runs, merge_pairs, pairs)
+        _, size = allocated(ds.DisjointSet, range(n), dense=dense)
+        print(f"DisjointSet(dense={dense}): {size / n:.1f} bytes per element")
+
+
+if __name__ == "__main__":
+    node_memory_test(1_000_000)
+    container_memory_test(1_000_000)
+    heap_speed_test(1_000_000, 3)
+    pool_churn_test(1_000_000)
+    buffer_speed_test(1_000_000, 3)
+    disjoint_set_speed_test(1_000_000, 5_000_000, 3)
@@ -67,6 +67,41 @@ def test_heappop_min():
     expected_output = [12, 30, 47, 38, 34, 50, 48, 43, 46]
     heap.heappop(input_heap, target_index)
     assert input_heap == expected_output
+    # The last value can be smaller than the parent of a hole in another subtree
+    middle = [0, 10, 1, 11, 12, 2, 3]
+    assert heap.heappop(middle, 4) == 12
+    assert middle == [0, 3, 1, 11, 10, 2]
+    for heap_type in heap.HeapType:
+        is_max = heap_type in (heap.HeapType.MAX, heap.HeapType.MAXEQ)
+        strict = heap.HeapType.MAX if is_max else heap.HeapType.MIN
+        unordered = heap._cmp_heap_type_map[strict]  # Equal values are in order
+        for size in range(1, 60):
+            values = [randint(1, 50) for _ in range(size)]
+            heap.heapify(values, heap_type)
+            index = randint(-size, size - 1)
+            expected = values[index]
+            assert heap.heappop(values, index, heap_type) == expected
+            parents = ((values[(i - 1) >> 1], values[i]) for i in range(1, size - 1))
+            assert not any(unordered(*pair) for pair in parents)
+
+
+def test_heap_list_fast_path():
+    from . import heap
+    from collections import UserList
+    from random import randint
+
+    # Plain lists go to heapq, other sequences to the sifts, same layouts
+    for heap_type in heap.HeapType:
+        values = [randint(1, 30) for _ in range(80)]
+        plain, generic = list(values), UserList(values)
+        for items in plain, generic:
+            heap.heapify(items, heap_type)
+            for value in values[:20]:
+                heap.heappush(items, value, heap_type)
+            popped = [heap.heappop(items, None, heap_type) for _ in range(30)]
+            popped.append(heap.heapreplace(items, 15, heap_type))
+            items.append(popped)
+        assert plain == list(generic)
 
 
 def _linked_list_seq_test(List):
@@ -137,6 +172,23 @@ def test_cirdoubly_linked_list():
     _linked_list_seq_test(CirDoublyLinkedList)
 
 
+def test_unrolled_linked_list():
+    from .linked_list.list import UnrolledLinkedList
+    from functools import partial
+
+    _linked_list_seq_test(UnrolledLinkedList)
+    _linked_list_seq_test(partial(UnrolledLinkedList, block_size=2))
+    mylist = UnrolledLinkedList(range(1000), block_size=16)
+    for index in range(0, 2000, 2):
+        mylist.insert(index, -1)
+    assert list(mylist) == [v for i in range(1000) for v in (-1, i)]
+    blocks = [len(block.values) for block in mylist._list.blocks()]
+    assert sum(blocks) == 2000 and max(blocks) <= 16
+    while len(mylist) > 10:
+        mylist.pop(len(mylist) // 3)
+    assert all(len(block.values) for block in mylist._list.blocks())
+
+
 def test_deque():
     from . import queue
 
@@ -282,9 +334,7 @@ def test_set():
     assert set(t1) == set([1.0, 'A', b'A']) and len(t1) == 3
 
 
-def test_hashtable():
-    from .hash_table import HashTable
-
+def _hashtable_test(HashTable):
     data = [
         ("brother", "simon"),
         ("sister", "faith"),
@@ -331,3 +381,834 @@ def test_hashtable():
 
     assert pydata == mydata
     assert len(pydict) == 0 and len(mydict) == 0
+
+
+def test_hashtable():
+    from .hash_table import HashTable
+
+    _hashtable_test(HashTable)
+
+
+def test_compact_hashtable():
+    from .hash_table import HashTable, CompactHashTable
+    import random as rand
+
+    _hashtable_test(CompactHashTable)
+
+    keys = rand.sample(range(100_000), k=2000)
+    pydict, mydict = {}, CompactHashTable()
+    for key in keys:
+        pydict[key] = mydict[key] = key * 2
+    for key in keys[::3]:
+        del pydict[key], mydict[key]
+    assert list(pydict.items()) == list(mydict.items())
+    assert list(reversed(pydict.values())) == list(reversed(mydict))
+    for key in keys[::3]:
+        assert key not in mydict
+        pydict[key] = mydict[key] = -key
+    assert list(pydict.items()) == list(mydict.items())
+    assert len(pydict) == len(mydict)
+    assert mydict._used <= mydict._fill < mydict._size
+    assert pydict.popitem() == mydict.popitem()
+    assert mydict.pop(keys[1]) == pydict.pop(keys[1]) and keys[1] not in mydict
+    mydict.clear()
+    assert len(mydict) == 0 and not list(mydict)
+
+    # Clearing keeps the capacity asked for, `HashTable.compact` builds one
+    table = HashTable.compact(((i, i) for i in range(10)), capacity=1000)
+    assert isinstance(table, CompactHashTable) and table[9] == 9
+    size = table._size
+    table.clear()
+    assert table._size == size
+    for i in range(1000):
+        table[i] = i
+    assert table._size == size
+
+
+def test_cached_hashes():
+    from .hash_table import HashTable, CompactHashTable
+    from .set import Set
+
+    calls = []
+
+    class Key:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def __myhash__(self) -> int:
+            calls.append(self.name)
+            return 42  # Everything collides, keys are told apart by equality
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Key) and other.name == self.name
+
+    keys = [Key(str(i)) for i in range(20)]
+    for Table in HashTable, CompactHashTable:
+        calls.clear()
+        table = Table((key, key.name) for key in keys)
+        assert len(table) == len(keys)
+        # Each key is hashed once, the resizes reuse the cached hashes
+        assert len(calls) == len(keys)
+        assert all(table[Key(key.name)] == key.name for key in keys)
+    s = Set(keys)
+    assert len(s) == len(keys) and Key("7") in s and Key("70") not in s
+    s.remove(Key("7"))
+    assert Key("7") not in s and len(s) == len(keys) - 1
+
+
+def test_incremental_rehash():
+    from .hash_table import HashTable
+    from .set import Set
+
+    table: HashTable[int, int] = HashTable(rehash_steps=1)
+    s: Set[int] = Set(rehash_steps=2)
+    pydict: dict[int, int] = {}
+    saw_rehash = False
+    for key in range(500):
+        table[key] = pydict[key] = key * key
+        s.add(key)
+        saw_rehash = saw_rehash or table.rehashing
+        assert table.get(key // 2, None) == pydict.get(key // 2)
+        assert (key // 3 in s) == (key // 3 in pydict)
+        if key % 7 == 0:
+            del table[key // 2], pydict[key // 2]
+            s.remove(key // 2)
+    assert saw_rehash
+    assert dict(table.items()) == pydict and len(table) == len(pydict)
+    assert sorted(s) == sorted(pydict)
+    assert sorted(reversed(s)) == sorted(s)
+    table.rehash()
+    s.rehash()
+    assert not table.rehashing and not s.rehashing
+    assert dict(table.items()) == pydict and sorted(s) == sorted(pydict)
+
+
+def test_rehash_read_while_iterating():
+    from .hash_table import HashTable
+    from .set import Set
+
+    for steps in 1, 4:
+        table: HashTable[int, int] = HashTable(rehash_steps=steps)
+        s: Set[int] = Set(rehash_steps=steps)
+        for key in range(6):
+            table[key] = key
+            s.add(key)
+        assert table.rehashing and s.rehashing
+        # Lookups made while iterating must neither fail nor move entries
+        assert sorted(k for k in table if table.get(k) >= 0) == [*range(6)]
+        assert sorted(v for v in s if v in s) == [*range(6)]
+        assert len(table) == len(s) == 6
+        table[6] = 6
+        s.add(6)
+        assert sorted(table) == sorted(s) == [*range(7)]
+
+
+def test_myhash_many():
+    from ._util import myhash, myhash_many
+    import random as rand
+
+    words = ["".join(rand.choices("abcdé", k=rand.randint(0, 90))) for _ in range(300)]
+    data = [*words, *range(-100, 100), 0.5, 1e300, True, b"", b"bytes" * 20]
+    data += ["x" * 5000, "", rand.randbytes(3000), 10**40, float("nan")]
+    rand.shuffle(data)
+    assert myhash_many(data) == [*map(myhash, data)]
+    for kind in str, int, bytes:  # A single kind takes its own path
+        values = [value for value in data if type(value) is kind]
+        assert myhash_many(values) == [*map(myhash, values)]
+    assert all(0 <= h < 1 << 64 for h in myhash_many(data))  # Fixed width
+    assert myhash_many(data[:10]) == [*map(myhash, data[:10])]
+    with pytest.raises(TypeError):
+        myhash_many([*data, object()])
+
+
+def test_presized_containers():
+    from .hash_table import HashTable, CompactHashTable
+    from .set import Set
+
+    keys = [f"key-{i}" for i in range(1000)]
+    for Table in HashTable, CompactHashTable:
+        table = Table(capacity=len(keys))
+        size = table._size
+        for key in keys:
+            table[key] = key
+        assert table._size == size and len(table) == len(keys)
+        loaded = Table.fromkeys(keys, 0)
+        assert loaded._size == size and set(loaded) == set(keys)
+        updated = Table()
+        updated.update(dict.fromkeys(keys, 1))
+        assert updated._size == size
+        updated.update((key, 0) for key in keys[::-1])  # Read lazily, in batches
+        assert dict(updated.items()) == dict(loaded.items())
+    s = Set(keys)
+    assert s._size == Set(capacity=len(keys))._size
+    s.update(map(str, range(100)))
+    assert len(s) == len(keys) + 100 and all(key in s for key in keys)
+
+
+def test_set_algebra():
+    from .set import Set
+    import random as rand
+
+    for _ in range(20):
+        a = set(rand.choices(range(300), k=rand.randint(0, 200)))
+        b = set(rand.choices(range(300), k=rand.randint(0, 200)))
+        s1, s2 = Set(a, rehash_steps=1), Set(b)
+        assert set(s1 | s2) == a | b and set(s2.union(b)) == b
+        assert set(s1 & s2) == a & b and set(s2 & s1) == a & b
+        assert set(s1 - s2) == a - b and set(s2 - s1) == b - a
+        assert set(s1 ^ s2) == a ^ b
+        assert set(s1.intersection(b)) == a & b and set(s1.difference(b)) == a - b
+        assert len(s1 ^ s2) == len(a ^ b)
+        for op in "__ior__", "__iand__", "__isub__", "__ixor__":
+            mine, theirs = Set(a, rehash_steps=2), set(a)
+            assert getattr(mine, op)(s2) is mine
+            getattr(theirs, op)(b)
+            assert set(mine) == theirs and len(mine) == len(theirs)
+            assert set(getattr(mine, op)(mine)) == getattr(theirs, op)(theirs)
+
+
+def test_memory_report():
+    from .hash_table import HashTable, CompactHashTable
+    from .linked_list.list import SinglyLinkedList, CirDoublyLinkedList
+    from .queue import Queue, PriorityQueue
+    from .memory import own_size, sizeof
+    from .disjoint_set import DisjointSet
+    from .set import Set
+    import sys
+
+    for Table in HashTable, CompactHashTable:
+        table = Table((i, str(i)) for i in range(200))
+        report = table.memory_report()
+        assert report.entries == 200 and report.load_factor == table._load_factor
+        assert sum(length * count for length, count in report.chain_lengths.items())
+        assert report.total - report.categories["payload"] == table.__sizeof__()
+        assert sys.getsizeof(table) > table.__sizeof__()
+    table = HashTable(((i, i) for i in range(200)), rehash_steps=1)
+    while not table.rehashing:
+        table[len(table)] = 0
+    report = table.memory_report()
+    assert sum(report.chain_lengths.values()) > table._size  # both arrays
+    assert sum(k * v for k, v in report.chain_lengths.items()) == len(table)
+    # Every chain node is counted once, the chains report their own nodes
+    table = HashTable((i, i) for i in range(50))
+    store, entries = table._store, [*table._iter(lambda slot: slot)]
+    chains = [slot.value for slot in store._list]
+    expected = sizeof(table._store) + sizeof(store._list) + own_size(table)
+    expected += sum(map(sizeof, store._list))
+    expected += sum(chain.__sizeof__() for chain in chains)  # With their nodes
+    expected += sum(sizeof(entry) + sizeof(entry.hash) for entry in entries)
+    assert table.__sizeof__() == expected
+    chains = Set(range(100)).memory_report().chain_lengths
+    assert sum(k * v for k, v in chains.items()) == 100
+    for Container in SinglyLinkedList, CirDoublyLinkedList, Queue, PriorityQueue:
+        small, big = Container(range(10)), Container(range(100))
+        assert big.memory_report().entries == 100
+        assert small.__sizeof__() < big.__sizeof__()
+    assert DisjointSet(range(10)).memory_report().categories["payload"] > 0
+
+
+def test_ring_buffer():
+    from .ring_buffer import RingBuffer
+    from collections import deque
+    import random as rand
+
+    for _ in range(50):
+        ring, model = RingBuffer(), deque()
+        for _ in range(200):
+            value, op = rand.random(), rand.randrange(7)
+            if op == 0:
+                ring.append(value), model.append(value)
+            elif op == 1:
+                ring.appendleft(value), model.appendleft(value)
+            elif op == 2 and model:
+                assert ring.pop() == model.pop()
+            elif op == 3 and model:
+                assert ring.popleft() == model.popleft()
+            elif op == 4:
+                index = rand.randint(-len(model) - 2, len(model) + 2)
+                ring.insert(index, value), model.insert(index, value)
+            elif op == 5 and model:
+                index = rand.randrange(-len(model), len(model))
+                assert ring.pop(index) == model[index]
+                del model[index]
+            elif op == 6 and model:
+                index = rand.randrange(len(model))
+                ring[index] = model[index] = value
+            assert list(ring) == list(model) and len(ring) == len(model)
+            assert list(reversed(ring)) == list(reversed(model))
+    ring = RingBuffer(range(3), capacity=5, fixed=True)
+    ring.extend([3, 4])
+    with pytest.raises(OverflowError):
+        ring.appendleft(-1)
+    with pytest.raises(IndexError):
+        ring[5]
+    assert ring.full() and ring.capacity == 5 and list(ring) == [*range(5)]
+
+
+def test_ring_queues():
+    from . import queue
+
+    q: queue.RingQueue[int] = queue.RingQueue(maxsize=3)
+    with pytest.raises(queue.QueueEmpty):
+        q.pop()
+    q.extend([1, 2, 3])
+    with pytest.raises(queue.QueueFull):
+        q.append(4)
+    assert [q.pop() for _ in range(3)] == [1, 2, 3]
+    d: queue.RingDeque[int] = queue.RingDeque(maxsize=7)
+    d.append(5)
+    d.extend([1, 2, 3])
+    d.extendleft([10, 20, 30])
+    with pytest.raises(queue.QueueFull):
+        d.appendleft(4)
+    assert d.pop() == 3 and d.popleft() == 30
+    assert [d.popleft() for _ in range(5)] == [20, 10, 5, 1, 2]
+    unbounded = queue.RingQueue(range(1000))
+    assert [unbounded.pop() for _ in range(1000)] == [*range(1000)]
+
+
+def test_thread_queues():
+    from . import blocking_queue as bq, queue
+    import random as rand, threading
+
+    sample = rand.choices(range(1000), k=500)
+    for Queue, expect in (
+        (bq.ThreadQueue, sample),
+        (bq.ThreadPriorityQueue, sorted(sample)),
+    ):
+        q, results = Queue(maxsize=8), []
+
+        def consume():
+            for _ in sample:
+                results.append(q.get(timeout=5))
+                q.task_done()
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for value in sample:
+            q.put(value, timeout=5)
+        assert q.join(timeout=5)
+        consumer.join()
+        assert sorted(results) == sorted(expect) and q.empty()
+    q = bq.ThreadLIFOQueue([1, 2], maxsize=2)
+    with pytest.raises(queue.QueueFull):
+        q.put(3, timeout=0.01)
+    with pytest.raises(queue.QueueFull):
+        q.append(3)
+    assert q.get() == 2 and q.pop() == 1
+    with pytest.raises(queue.QueueEmpty):
+        q.get(timeout=0.01)
+    assert not q.join(timeout=0.01)
+    q.task_done(), q.task_done()
+    with pytest.raises(ValueError):
+        q.task_done()
+
+
+def test_async_queues():
+    from . import blocking_queue as bq, heap, queue
+    import asyncio
+
+    class MaxQueue(bq.AsyncPriorityQueue):
+        heap_type = heap.HeapType.MAX
+
+    async def main():
+        q = bq.AsyncQueue(maxsize=2)
+        results = []
+
+        async def consume():
+            for _ in range(10):
+                results.append(await q.get())
+                q.task_done()
+
+        consumer = asyncio.create_task(consume())
+        for value in range(10):
+            await q.put(value)
+        await asyncio.wait_for(q.join(), 5)
+        await consumer
+        assert results == [*range(10)]
+        with pytest.raises(queue.QueueEmpty):
+            await q.get(timeout=0.01)
+        pq = MaxQueue([3, 1, 2], maxsize=3)
+        with pytest.raises(queue.QueueFull):
+            await pq.put(4, timeout=0.01)
+        assert [await pq.get() for _ in range(3)] == [3, 2, 1]
+        stack = bq.AsyncLIFOQueue([1, 2])
+        assert stack.pop() == 2 and stack.get_nowait() == 1
+
+    asyncio.run(main())
+
+
+def test_heap_batches():
+    from . import heap
+    import heapq, random as rand
+
+    types = {heap.HeapType.MIN: False, heap.HeapType.MINEQ: False}
+    types |= {heap.HeapType.MAX: True, heap.HeapType.MAXEQ: True}
+    for heap_type, reverse in types.items():
+        for _ in range(20):
+            data = rand.choices(range(100), k=rand.randint(0, 200))
+            batch = rand.choices(range(100), k=rand.choice((3, 300)))
+            mheap = list(data)
+            heap.heapify(mheap, heap_type)
+            heap.heappushmany(mheap, batch, heap_type)
+            k = rand.randint(0, len(mheap) + 5)
+            popped = heap.heappopmany(mheap, k, heap_type)
+            expected = sorted(data + batch, reverse=reverse)
+            assert popped == expected[:k]
+            value = rand.randrange(100)
+            rest = sorted([*mheap, value], reverse=reverse)
+            assert heap.heappushpop(mheap, value, heap_type) == rest.pop(0)
+            if mheap:
+                assert heap.heapreplace(mheap, value, heap_type) == rest.pop(0)
+                rest = sorted([*rest, value], reverse=reverse)
+            assert heap.heappopmany(mheap, len(mheap), heap_type) == rest
+        streams = [sorted(rand.choices(range(50), k=20), reverse=reverse)] * 3
+        merged = list(heap.merge(*streams, [], heap_type=heap_type))
+        assert merged == sorted(sum(streams, []), reverse=reverse)
+    words = rand.choices(["a", "bb", "ccc", "dd", "e"], k=100)
+    for n in 0, 3, 50, 200:
+        assert heap.nsmallest(n, words, key=len) == sorted(words, key=len)[:n]
+        assert heap.nlargest(n, words, key=len) == heapq.nlargest(n, words, key=len)
+        assert heap.nlargest(n, words) == sorted(words, reverse=True)[:n]
+
+
+def test_indexed_heap():
+    from .heap import HeapType, IndexedHeap
+    import random as rand
+
+    for heap_type in HeapType:
+        reverse = heap_type in (HeapType.MAX, HeapType.MAXEQ)
+        heap = IndexedHeap(rand.choices(range(100), k=50), heap_type)
+        handles = [heap.push(value) for value in rand.choices(range(100), k=50)]
+        removed = 0
+        for handle in rand.sample(handles, 30):
+            op = rand.randrange(4)
+            if op == 0:
+                heap.decrease_key(handle, handle.value - rand.randrange(50))
+            elif op == 1:
+                heap.increase_key(handle, handle.value + rand.randrange(50))
+            elif op == 2:
+                heap.update(handle, rand.randrange(-50, 150))
+            else:
+                assert heap.remove(handle) == handle.value and handle not in heap
+                removed += 1
+        assert all(heap._heap[handle.index] is handle for handle in heap._heap)
+        expected = sorted((handle.value for handle in heap._heap), reverse=reverse)
+        assert len(expected) == 100 - removed
+        assert [heap.pop() for _ in range(len(heap))] == expected
+    heap = IndexedHeap([3, 1, 2])
+    handle = heap.push(5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(handle, 6)
+    with pytest.raises(ValueError):
+        heap.increase_key(handle, 4)
+    heap.remove(handle)
+    with pytest.raises(ValueError):
+        heap.remove(handle)
+
+
+def test_array_heap():
+    from .heap import ArrayHeap, HeapType
+    from array import array
+    import random as rand
+
+    for heap_type in HeapType:
+        reverse = heap_type in (HeapType.MAX, HeapType.MAXEQ)
+        priorities = [rand.random() for _ in range(100)]
+        heap = ArrayHeap(priorities[:50], map(str, priorities[:50]), heap_type)
+        for priority in priorities[50:90]:
+            heap.push(priority, str(priority))
+        heap.pushmany(array("d", priorities[90:]).tobytes(), map(str, priorities[90:]))
+        assert heap.peek()[0] == sorted(priorities, reverse=reverse)[0]
+        popped = [heap.pop() for _ in range(len(heap))]
+        assert [p for p, _ in popped] == sorted(priorities, reverse=reverse)
+        assert all(str(priority) == payload for priority, payload in popped)
+    heap = ArrayHeap([3.0, 1.0])
+    assert heap.pushpop(0.5) == (0.5, None) and heap.pushpop(2.0) == (1.0, None)
+    with pytest.raises(ValueError):
+        heap.pushmany([1.0, 2.0], ["one"])
+    assert len(heap) == 2 and [*heap.priorities] == [2.0, 3.0]
+    priorities = heap.priorities  # A copy, the heap stays resizable
+    heap.push(1.0), heap.pop()
+    priorities[0] = -1.0
+    assert [*priorities] == [-1.0, 3.0] and [*heap.priorities] == [2.0, 3.0]
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    heap = ArrayHeap(np.arange(10, dtype=np.int32)[::-1])
+    assert [heap.pop()[0] for _ in range(10)] == [*map(float, range(10))]
+
+
+def test_linked_list_ends():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList, UnrolledLinkedList
+    from functools import partial
+    import random as rand
+
+    unrolled = partial(UnrolledLinkedList, block_size=4)
+    for List in SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList, unrolled:
+        mylist, pylist = List(), []
+        for _ in range(300):
+            op, value = rand.randrange(5), rand.random()
+            if op == 0:
+                mylist.append(value), pylist.append(value)
+            elif op == 1:
+                index = rand.randint(-len(pylist) - 2, len(pylist) + 2)
+                mylist.insert(index, value), pylist.insert(index, value)
+            elif op == 2 and pylist:
+                index = rand.randrange(-len(pylist), len(pylist))
+                assert mylist.pop(index) == pylist.pop(index)
+            elif op == 3:
+                values = rand.choices(range(10), k=rand.randrange(3))
+                mylist.extend(values), pylist.extend(values)
+            elif op == 4 and pylist:
+                index = rand.randrange(-len(pylist), len(pylist))
+                assert mylist[index] == pylist[index]
+            assert list(mylist) == pylist and len(mylist) == len(pylist)
+            if pylist:
+                assert mylist[-1] == pylist[-1]
+        with pytest.raises(IndexError):
+            mylist.pop(len(pylist))
+
+
+def test_linked_list_cursor():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList, UnrolledLinkedList
+    from .linked_list.cursor import Cursor
+    import random as rand
+
+    for List in SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList:
+        for start in 0, 3:
+            values = list(range(8))
+            mylist, pylist = List(values), values.copy()
+            cursor, index = mylist.cursor(start), start
+            for _ in range(200):
+                op, value = rand.randrange(5), rand.random()
+                if op == 0:
+                    cursor.insert_before(value), pylist.insert(index, value)
+                    index += 1
+                elif op == 1 and cursor:
+                    cursor.insert_after(value), pylist.insert(index + 1, value)
+                elif op == 2 and cursor:
+                    assert cursor.remove_current() == pylist.pop(index)
+                elif op == 3 and cursor:
+                    cursor.replace(value)
+                    pylist[index] = value
+                elif op == 4 and cursor:
+                    index += 1
+                    assert cursor.advance() == (index < len(pylist))
+                if cursor:
+                    assert cursor.value == pylist[index]
+                else:
+                    assert index == len(pylist)
+                assert list(mylist) == pylist and len(mylist) == len(pylist)
+                assert list(reversed(mylist)) == pylist[::-1]
+                if pylist:
+                    assert mylist[-1] == pylist[-1]
+            if not cursor:
+                with pytest.raises(IndexError):
+                    cursor.remove_current()
+
+    for List in SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList:
+        for size in range(6):
+            mylist = List(range(size))
+            assert mylist.filter_inplace(lambda value: value % 2) == (size + 1) // 2
+            assert list(mylist) == list(range(1, size, 2))
+            mylist.append(-1)
+            assert mylist[-1] == -1 and len(mylist) == size // 2 + 1
+
+    mylist = UnrolledLinkedList(range(50), block_size=4)
+    assert mylist.filter_inplace(lambda value: value % 5 == 0) == 40
+    assert list(mylist) == list(range(0, 50, 5)) and len(mylist) == 10
+    with pytest.raises(TypeError):
+        mylist.cursor()
+    with pytest.raises(TypeError):
+        mylist.splice(0, UnrolledLinkedList())
+    with pytest.raises(TypeError):
+        Cursor()  # type: ignore[abstract]  # An interface only
+
+
+def test_node_pool():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList
+
+    for List in SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList:
+        assert List(range(3)).pool is None
+        mylist = List(range(5), pool_size=4)
+        pool = mylist.pool
+        assert pool is not None and pool.misses == 6 and len(pool) == 1
+        pylist = list(range(5))
+        for value in range(100):
+            mylist.append(value), pylist.append(value)
+            assert mylist.pop(0) == pylist.pop(0)
+        assert list(mylist) == list(range(95, 100))
+        assert pool.misses == 6 and pool.hits == 100 and len(pool) == 1
+        values = [mylist.pop() for _ in range(5)]
+        assert values == list(range(99, 94, -1)) and not mylist
+        assert len(pool) == 4 and pool.dropped == 2
+        assert all(node.value is None for node in pool)
+        mylist.extend("abc")
+        cursor = mylist.cursor()
+        assert cursor.remove_current() == "a" and list(mylist) == ["b", "c"]
+        assert pool.stats() == {"free": 2, "hits": 104, "misses": 6, "dropped": 2}
+        assert mylist.memory_report().categories["pool"] > 0
+
+
+def test_linked_list_buffers():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList, UnrolledLinkedList
+    from array import array
+
+    values = array("d", [0.5 * value for value in range(20)])
+    for List in (
+        SinglyLinkedList,
+        DoublyLinkedList,
+        CirDoublyLinkedList,
+        UnrolledLinkedList,
+    ):
+        mylist = List.from_array(values)
+        assert list(mylist) == values.tolist() and len(mylist) == 20
+        mylist.extend_from_buffer(memoryview(array("l", [1, 2])))
+        mylist.extend_from_buffer(array("d"))
+        assert list(mylist)[-3:] == [9.5, 1, 2] and mylist[-1] == 2
+        mylist.append(3)
+        assert list(reversed(mylist))[:4] == [3, 2, 1, 9.5]
+        assert mylist.to_array(typecode="d") == array("d", [*values, 1, 2, 3])
+        with pytest.raises(TypeError):
+            mylist.to_array()
+        out = array("d", [0.0] * 30)
+        assert mylist.to_array(out) is out
+        assert out.tolist() == [*values, 1, 2, 3] + [0] * 7
+        with pytest.raises(TypeError):
+            mylist.to_array(array("l", [0] * 30))
+        with pytest.raises(ValueError):
+            mylist.to_array(bytearray(8))
+    big = [2**62 + 1, -(2**53) - 1]  # No float could hold them
+    assert SinglyLinkedList(big).to_array(typecode="q").tolist() == big
+    pooled = SinglyLinkedList.from_array(bytes([1, 2, 3]), pool_size=2)
+    assert list(pooled) == [1, 2, 3] and pooled.pool is not None
+
+    np = pytest.importorskip("numpy")
+    matrix = np.arange(12, dtype=np.int64).reshape(3, 4)
+    for List in DoublyLinkedList, CirDoublyLinkedList:
+        mylist = List.from_array(matrix)
+        assert list(mylist) == list(range(12))
+        out = np.zeros(12)
+        mylist.to_array(out)
+        assert (out == np.arange(12)).all()
+        assert list(List.from_array(memoryview(matrix))) == list(range(12))
+
+
+def test_linked_list_sort_splice():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList, UnrolledLinkedList
+    import random as rand
+
+    def check(mylist, pylist):
+        assert list(mylist) == pylist and len(mylist) == len(pylist)
+        assert list(reversed(mylist)) == pylist[::-1]
+        if pylist:
+            assert mylist[-1] == pylist[-1] and mylist[0] == pylist[0]
+
+    lists = SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList
+    for List in (*lists, UnrolledLinkedList):
+        for size in *range(6), 37:
+            pairs = [(rand.randrange(4), index) for index in range(size)]
+            for key in None, lambda pair: pair[0]:
+                for reverse in False, True:
+                    mylist, pylist = List(pairs), pairs.copy()
+                    mylist.sort(key=key, reverse=reverse)
+                    pylist.sort(key=key, reverse=reverse)  # type: ignore
+                    check(mylist, pylist)
+                    mylist.append((9, 9)), pylist.append((9, 9))
+                    check(mylist, pylist)
+
+    # A raising key leaves the list as it was, incomparable values or
+    # keys leave every item in it, with consistent links
+    for List in (*lists, UnrolledLinkedList):
+        mylist = List(["3", "1", "x", "2"])
+        with pytest.raises(ValueError):
+            mylist.sort(key=int)
+        check(mylist, ["3", "1", "x", "2"])
+        for values, key in (
+            ([3, 1, "a", 2, 0], None),
+            ([3, 1, 2, 0], lambda value: "a" if value == 2 else value),
+        ):
+            mylist = List(values)
+            with pytest.raises(TypeError):
+                mylist.sort(key=key)
+            assert sorted(map(str, mylist)) == sorted(map(str, values))
+            check(mylist, list(mylist))
+        mylist = List([3, 1, 2, 0])
+        mylist.sort()
+        check(mylist, [0, 1, 2, 3])
+
+    for List in lists:
+        for size, other in (0, 0), (0, 3), (4, 0), (5, 3), (1, 1):
+            for index in range(-size - 1, size + 2):
+                mylist, pylist = List(range(size)), list(range(size))
+                values = list(range(10, 10 + other))
+                extra = List(values)
+                mylist.splice(index, extra)
+                pylist[index:index] = values
+                check(mylist, pylist), check(extra, [])
+                mylist.concat(List("ab")), pylist.extend("ab")
+                check(mylist, pylist)
+                rest = mylist.split_at(index)
+                assert type(rest) is List
+                check(rest, pylist[index:]), check(mylist, pylist[:index])
+                mylist.append("x"), rest.append("y")
+                check(mylist, [*pylist[:index], "x"])
+                check(rest, [*pylist[index:], "y"])
+        mylist = List(range(3))
+        with pytest.raises(TypeError):
+            mylist.concat(UnrolledLinkedList())  # type: ignore
+        with pytest.raises(ValueError):
+            mylist.concat(mylist)
+
+
+def test_linked_list_reverse():
+    from .linked_list.list import SinglyLinkedList, DoublyLinkedList
+    from .linked_list.list import CirDoublyLinkedList, UnrolledLinkedList
+    from .queue import Deque, RingDeque
+    from functools import partial
+
+    unrolled = partial(UnrolledLinkedList, block_size=3)
+    for List in SinglyLinkedList, DoublyLinkedList, CirDoublyLinkedList, unrolled:
+        for size in range(8):
+            mylist, pylist = List(range(size)), list(range(size))
+            nodes = {id(node) for node in mylist._list}
+            mylist.reverse(), pylist.reverse()
+            assert list(mylist) == pylist and list(reversed(mylist)) == pylist[::-1]
+            if List is not unrolled:
+                assert {id(node) for node in mylist._list} == nodes
+            mylist.append(-1), pylist.append(-1)
+            mylist.insert(0, -2), pylist.insert(0, -2)
+            assert list(mylist) == pylist and mylist[-2] == pylist[-2]
+            view = mylist.reversed_view()
+            assert list(view) == pylist[::-1] and len(view) == len(pylist)
+            assert view[0] == pylist[-1] and view[-1] == pylist[0]
+            assert list(reversed(view)) == pylist
+            mylist.append(-3)
+            assert view[0] == -3
+            with pytest.raises(IndexError):
+                view[len(mylist)]
+
+    for deque in Deque(range(5)), RingDeque(range(5)):
+        deque.reverse()
+        assert [deque.popleft() for _ in range(5)] == [4, 3, 2, 1, 0]
+
+
+def test_skip_list():
+    from .skip_list import SkipList
+    from bisect import bisect_left
+    import random as rand
+
+    for p, max_level in (0.5, 32), (0.25, 4), (0.9, 2):
+        skip, pydict = SkipList[int, int](p=p, max_level=max_level), {}
+        for _ in range(600):
+            op, key = rand.randrange(4), rand.randrange(200)
+            if op < 2:
+                skip.insert(key, -key), pydict.update({key: -key})
+            elif op == 2 and key in pydict:
+                assert skip.delete(key) == pydict.pop(key)
+            elif op == 2:
+                with pytest.raises(KeyError):
+                    skip.delete(key)
+            keys = sorted(pydict)
+            assert len(skip) == len(keys) and (key in skip) == (key in pydict)
+            index = bisect_left(keys, key)
+            assert skip.rank(key) == index
+            if index < len(keys):
+                assert skip.ceil(key) == (keys[index], -keys[index])
+                assert skip.at(index) == (keys[index], -keys[index])
+            else:
+                with pytest.raises(KeyError):
+                    skip.ceil(key)
+            if key in pydict:
+                assert skip.floor(key) == (key, -key) and skip[key] == -key
+            elif index:
+                assert skip.floor(key) == (keys[index - 1], -keys[index - 1])
+            else:
+                with pytest.raises(KeyError):
+                    skip.floor(key)
+        keys = sorted(pydict)
+        assert list(skip) == keys and list(reversed(skip)) == keys[::-1]
+        assert list(skip.values()) == [-key for key in keys]
+        assert skip.at(-1) == (keys[-1], -keys[-1])
+        between = [(key, -key) for key in keys if 50 <= key < 150]
+        assert list(skip.irange(50, 150)) == between
+        assert list(skip.irange(50, 150, reverse=True)) == between[::-1]
+        assert [key for key, _ in skip.irange(high=10, reverse=True)] == [
+            key for key in keys[::-1] if key < 10
+        ]
+        assert skip == pydict
+        assert skip.memory_report().categories["nodes"] > 0
+        skip.clear()
+        assert not skip and list(skip) == []
+        skip.update({1: "a", 0: "b"})
+        assert list(skip.items()) == [(0, "b"), (1, "a")]
+
+
+def test_disjoint_set():
+    from .disjoint_set import DisjointSet
+    import random as rand
+
+    for dense in False, True:
+        dset, model = DisjointSet(range(50), dense=dense), [{e} for e in range(50)]
+
+        def of(element):
+            return next(part for part in model if element in part)
+
+        for _ in range(300):
+            op, e1, e2 = rand.randrange(6), rand.randrange(60), rand.randrange(60)
+            present = any(e1 in part for part in model)
+            if op == 0 and not present:
+                dset.add(e1), model.append({e1})
+            elif op == 0:
+                with pytest.raises(ValueError):
+                    dset.add(e1)
+            elif op == 1 and present and e2 in dset:
+                p1, p2 = of(e1), of(e2)
+                assert dset.same(e1, e2) == (p1 is p2) != dset.disjoint(e1, e2)
+                dset.merge(e1, e2)
+                if p1 is not p2:
+                    model.remove(p2), p1.update(p2)
+            elif op == 2 and present:
+                dset.remove(e1)
+                of(e1).remove(e1)
+                model = [part for part in model if part]
+            elif op == 3 and present and rand.random() < 0.2:
+                dset.remove_partition(e1)
+                model.remove(of(e1))
+            elif not present:
+                with pytest.raises(KeyError):
+                    dset.partition(e1)
+                with pytest.raises(KeyError):
+                    dset.find(e1)
+            assert len(dset) == len(model)
+            assert dset.elements == sum(map(len, model))
+            if present and e1 in dset:
+                assert dset.partition(e1) == of(e1)
+                assert dset.partition_size(e1) == len(of(e1))
+            assert sorted(map(sorted, dset)) == sorted(map(sorted, model))
+        dset.merge_if(lambda e: e % 7 == 0)
+        sevens = [e for part in model for e in part if e % 7 == 0]
+        assert all(dset.same(sevens[0], e) for e in sevens)
+        if len(dset) > 1:
+            members = [next(iter(part)) for part in model]
+            dset.merge_all(*members)
+            assert len(dset) == 1
+        dset.clear()
+        assert not len(dset) and not dset.elements and 3 not in dset
+    for element in "a", True:
+        with pytest.raises(TypeError):
+            DisjointSet([element], dense=True)
+    dense = DisjointSet(range(3), dense=True)
+    assert True not in dense and False not in dense
+    for missing in -1, True:
+        with pytest.raises(KeyError):
+            dense.find(missing)
+    with pytest.raises(KeyError):
+        dense.merge(False, 2)
@@ -52,6 +52,30 @@ def bit_hashes(
     return hash_function
 
 
+def bit_hashes_many(
+    hasher: mhash.Hasher | None,
+    clamp_shifts: tuple[tuple[int, int], ...],
+):
+    """
+    Batch counterpart of `bit_hashes`, the returned function
+    hashes all values once per clamp_shift pair with
+    `mhash.hash_many` and yields the bit indices of each value.
+    """
+
+    def hash_function(
+        values: ty.Iterable[mhash.Hashable], bit_count: int
+    ) -> ty.Iterator[list[int]]:
+        if not hasattr(values, "tolist"):
+            values = list(values)
+        columns = (
+            mhash.hash_many(values, clamp, shift, hasher=hasher)
+            for clamp, shift in clamp_shifts
+        )
+        return ([h % bit_count for h in row] for row in zip(*columns))
+
+    return hash_function
+
+
 class BloomFilterABC(ty.Protocol):
     def extend(self, values: ty.Iterable[mhash.Hashable]): ...
     def add(self, value: mhash.Hashable): ...
@@ -82,6 +106,7 @@ class BloomFilter(BloomFilterABC):
             clamp_shifts = self.clamp_shifts
         assert clamp_shifts, "Must provide atleast one clamp_shift pair"
         self._bit_hash = bit_hashes(hasher, clamp_shifts)
+        self._bit_hash_many = bit_hashes_many(hasher, clamp_shifts)
         self._max_markers = len(clamp_shifts)
         self._size_hint = 0
 
@@ -115,14 +140,14 @@ class BloomFilter(BloomFilterABC):
         self._pool.write_bits(map(lambda i: (i, True), h1))
 
     def extend(self, values: ty.Iterable[mhash.Hashable]):
-        from itertools import chain, tee
+        from itertools import chain
 
-        def _hash(value: mhash.Hashable):
-            h1, h2 = tee(self._hash(value))
-            self._size_hint += not self._has(h1)
-            return h2
+        def _mark(hashes: list[int]):
+            self._size_hint += not self._has(hashes)
+            return hashes
 
-        indices = chain.from_iterable(map(_hash, values))
+        hashes = self._bit_hash_many(values, self._pool.size)
+        indices = chain.from_iterable(map(_mark, hashes))
         self._pool.write_bits(map(lambda i: (i, True), indices))
 
     def has(self, value: mhash.Hashable) -> bool:
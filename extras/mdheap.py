@@ -1,6 +1,6 @@
 import typing
 
-__all__ = "heapify", "heappush", "heappop", "DHeap"
+__all__ = "heapify", "heappush", "heappop", "DHeap", "Handle", "IndexedDHeap"
 
 
 class _LessThan(typing.Protocol):
@@ -12,14 +12,13 @@ def _findmin[T: _LessThan](items: list[T], indices: range) -> int:
     Find the smallest item in a sublist of D items.
     Returns the index of the smallest item in the list
     Takes `O(D)` regardless of size of list.
+    The indices must exist, see `_children`.
     """
     minindex: int = indices.start
-    try:
-        for index in indices:
-            if items[index] < items[minindex]:
-                minindex = index
-    except IndexError:
-        ...
+    minimum = items[minindex]
+    for index in indices[1:]:
+        if items[index] < minimum:
+            minindex, minimum = index, items[index]
     return minindex
 
 
@@ -41,14 +40,16 @@ def _siftup[T: _LessThan](dheap: list[T], current_index: int, D: int):
     dheap[current_index] = current
 
 
-def _children(parent_index: int, D: int):
+def _children(parent_index: int, D: int, size: int | None = None):
     """
     Get the indices of the children of the parent
     item at index `parent_index`, the children may
     not exist; raise an error if accessed.
+    Given the `size` of the heap, only existing children are returned.
     """
     parent_index = parent_index * D
-    return range(parent_index + 1, parent_index + D + 1)
+    stop = parent_index + D + 1
+    return range(parent_index + 1, stop if size is None else min(stop, size))
 
 
 def _siftdown[T: _LessThan](dheap: list[T], current_index: int, D: int):
@@ -57,10 +58,10 @@ def _siftdown[T: _LessThan](dheap: list[T], current_index: int, D: int):
     Takes `O(D*logD(n))`, n being the size of the heap
     and D the branching factor of the heap.
     """
-    current = dheap[current_index]
-    last_parent: int = (len(dheap) - 2) // D
+    current, size = dheap[current_index], len(dheap)
+    last_parent: int = (size - 2) // D
     while current_index <= last_parent:
-        child_index = _findmin(dheap, _children(current_index, D))
+        child_index = _findmin(dheap, _children(current_index, D, size))
         if dheap[child_index] < current:
             dheap[current_index] = dheap[child_index]
             current_index = child_index
@@ -69,14 +70,40 @@ def _siftdown[T: _LessThan](dheap: list[T], current_index: int, D: int):
     dheap[current_index] = current
 
 
-def heapify[T: _LessThan](dheap: list[T], D: int):
+def _siftdown_bottomup[T: _LessThan](dheap: list[T], current_index: int, D: int):
+    """
+    Push an element down from `current_index`, bouncing.
+    The hole left by the element follows the smallest children down to
+    a leaf, `D-1` comparisons per level, then the element bubbles back
+    up from there; a replacement taken from the bottom of the heap
+    rarely climbs far. Saves about a comparison per level over
+    `_siftdown`, which counts when comparing items is expensive.
+    """
+    start, current, size = current_index, dheap[current_index], len(dheap)
+    last_parent: int = (size - 2) // D
+    while current_index <= last_parent:
+        child_index = _findmin(dheap, _children(current_index, D, size))
+        dheap[current_index] = dheap[child_index]
+        current_index = child_index
+    while current_index > start:
+        parent_index = (current_index - 1) // D
+        if current < dheap[parent_index]:
+            dheap[current_index] = dheap[parent_index]
+            current_index = parent_index
+        else:
+            break
+    dheap[current_index] = current
+
+
+def heapify[T: _LessThan](dheap: list[T], D: int, bottomup: bool = False):
     """
     Heapify a list into a heap with branching factor D.
     Takes `O(n)`, funny story; a bit complicated
     to calculate an conclude to this but it is true.
     """
+    siftdown = _siftdown_bottomup if bottomup else _siftdown
     for index in range((len(dheap) - 1) // D, -1, -1):
-        _siftdown(dheap, index, D)
+        siftdown(dheap, index, D)
 
 
 def heappush[T: _LessThan](dheap: list[T], item: T, D: int):
@@ -90,7 +117,7 @@ def heappush[T: _LessThan](dheap: list[T], item: T, D: int):
     _siftup(dheap, index, D)
 
 
-def heappop[T: _LessThan](dheap: list[T], D: int) -> T:
+def heappop[T: _LessThan](dheap: list[T], D: int, bottomup: bool = False) -> T:
     """
     Remove the most minimum element from the dheap.
     Takes `O(D*logD(n))`, main operation is siftdown.
@@ -99,34 +126,216 @@ def heappop[T: _LessThan](dheap: list[T], D: int) -> T:
     if not dheap:
         return replacement
     target, dheap[0] = dheap[0], replacement
-    _siftdown(dheap, 0, D)
+    (_siftdown_bottomup if bottomup else _siftdown)(dheap, 0, D)
     return target
 
 
+type Workload = typing.Literal["push", "pop", "balanced", "decrease_key"]
+
+# Fastest branching factors measured by `speed_test.branching_speed_test`,
+# D=2 is the slowest everywhere as the python overhead per level outweighs
+# the extra comparisons of a wide node. Pops favour the widest nodes, the
+# shallower the heap the fewer levels a siftdown goes through.
+_AUTO_D: dict[str, int] = {"push": 8, "pop": 16, "balanced": 8, "decrease_key": 4}
+
+
 class DHeap[T: _LessThan]:
-    __slots__ = ("_D",)
+    """
+    Heap operations of branching factor D. Given `bottomup`, heapify
+    and pop sift down bouncing (see `_siftdown_bottomup`), for items
+    whose comparisons cost more than the index arithmetic.
+    """
+
+    __slots__ = ("_D", "_bottomup")
 
-    def __init__(self, D: int, /) -> None:
+    @classmethod
+    def auto(
+        cls, workload: Workload = "balanced", *, bottomup: bool = False
+    ) -> "DHeap[T]":
+        """
+        A dheap with the branching factor found fastest for `workload`,
+        mostly pushes, mostly pops, as many of both or mostly decrease-keys.
+        """
+        if workload not in _AUTO_D:
+            raise ValueError(f"Unknown workload {workload!r}, one of {[*_AUTO_D]}")
+        return cls(_AUTO_D[workload], bottomup=bottomup)
+
+    def __init__(self, D: int, /, *, bottomup: bool = False) -> None:
         assert isinstance(D, int) and D > 0, (
             "Expected a positive integer greater than 0: %r" % D
         )
         self._D: typing.Final[int] = D
+        self._bottomup: typing.Final[bool] = bottomup
+
+    @property
+    def bottomup(self) -> bool:
+        return self._bottomup
 
     @property
     def branching_factor(self) -> int:
         return self._D
 
     def heapify(self, dheap: list[T]):
-        return heapify(dheap, self._D)
+        return heapify(dheap, self._D, self._bottomup)
 
     def heappush(self, dheap: list[T], item: T):
         return heappush(dheap, item, self._D)
 
     def heappop(self, dheap: list[T]) -> T:
-        return heappop(dheap, self._D)
+        return heappop(dheap, self._D, self._bottomup)
 
     # Shortcuts
     fy = heapify
     pop = heappop
     push = heappush
     D = branching_factor
+
+
+class Handle[T: _LessThan]:
+    """
+    An item pushed to an `IndexedDHeap` and its index
+    in the heap, kept up to date while it is sifted.
+    """
+
+    __slots__ = ("item", "index")
+
+    def __init__(self, item: T, index: int) -> None:
+        self.item = item
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"Handle({self.item!r}, index={self.index})"
+
+
+class IndexedDHeap[T: _LessThan]:
+    """
+    A min dheap of branching factor D handing out a `Handle` per item
+    pushed, through which the item can be changed or removed
+    in `O(D*logD(n))` without looking for it.
+    """
+
+    __slots__ = ("_D", "_heap")
+
+    def __init__(self, D: int, iterable: typing.Iterable[T] | None = None, /) -> None:
+        assert isinstance(D, int) and D > 0, (
+            "Expected a positive integer greater than 0: %r" % D
+        )
+        self._D: typing.Final[int] = D
+        self._heap: list[Handle[T]] = []
+        if iterable is not None:
+            self.pushmany(iterable)
+
+    @property
+    def branching_factor(self) -> int:
+        return self._D
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, handle: object) -> bool:
+        if not isinstance(handle, Handle):
+            return False
+        index = handle.index
+        return 0 <= index < len(self._heap) and self._heap[index] is handle
+
+    def _check(self, handle: Handle[T]) -> int:
+        if handle not in self:
+            raise ValueError(f"{handle!r} is not in this heap")
+        return handle.index
+
+    def _siftup(self, current_index: int):
+        "`_siftup` over handles, moving each handle's index along."
+        dheap, D = self._heap, self._D
+        current = dheap[current_index]
+        while current_index > 0:
+            parent_index = (current_index - 1) // D
+            parent = dheap[parent_index]
+            if current.item < parent.item:
+                dheap[current_index] = parent
+                parent.index = current_index
+                current_index = parent_index
+            else:
+                break
+        dheap[current_index] = current
+        current.index = current_index
+
+    def _siftdown(self, current_index: int):
+        "`_siftdown` over handles, moving each handle's index along."
+        dheap, D = self._heap, self._D
+        current, size = dheap[current_index], len(dheap)
+        while True:
+            first = current_index * D + 1
+            if first >= size:
+                break
+            child_index = first
+            for index in range(first + 1, min(first + D, size)):
+                if dheap[index].item < dheap[child_index].item:
+                    child_index = index
+            child = dheap[child_index]
+            if child.item < current.item:
+                dheap[current_index] = child
+                child.index = current_index
+                current_index = child_index
+            else:
+                break
+        dheap[current_index] = current
+        current.index = current_index
+
+    def push(self, item: T) -> Handle[T]:
+        "Takes `O(logD(n))`, like `heappush`."
+        handle = Handle(item, len(self._heap))
+        self._heap.append(handle)
+        self._siftup(handle.index)
+        return handle
+
+    def pushmany(self, items: typing.Iterable[T]) -> list[Handle[T]]:
+        "Push all items then heapify, `O(n)`. Returns their handles."
+        size = len(self._heap)
+        handles = [Handle(item, size + index) for index, item in enumerate(items)]
+        self._heap.extend(handles)
+        for index in range((len(self._heap) - 2) // self._D, -1, -1):
+            self._siftdown(index)
+        return handles
+
+    def peek(self) -> T:
+        return self._heap[0].item
+
+    def pop(self) -> T:
+        "Takes `O(D*logD(n))`, like `heappop`."
+        if not self._heap:
+            raise IndexError("pop from an empty heap")
+        return self.remove(self._heap[0])
+
+    def remove(self, handle: Handle[T]) -> T:
+        "Remove the item of `handle`, the handle is invalidated."
+        index = self._check(handle)
+        last = self._heap.pop()
+        if last is not handle:
+            self._heap[index] = last
+            self._siftup(index)
+            self._siftdown(last.index)
+        handle.index = -1
+        return handle.item
+
+    def decrease_key(self, handle: Handle[T], item: T):
+        "Make the item of `handle` smaller, takes `O(logD(n))`."
+        index = self._check(handle)
+        if handle.item < item:
+            raise ValueError(f"{item!r} is greater than {handle.item!r}")
+        handle.item = item
+        self._siftup(index)
+
+    def increase_key(self, handle: Handle[T], item: T):
+        "Make the item of `handle` bigger, takes `O(D*logD(n))`."
+        index = self._check(handle)
+        if item < handle.item:
+            raise ValueError(f"{item!r} is less than {handle.item!r}")
+        handle.item = item
+        self._siftdown(index)
+
+    def update(self, handle: Handle[T], item: T):
+        "Change the item of `handle`, in whichever direction."
+        if item < handle.item:
+            self.decrease_key(handle, item)
+        else:
+            self.increase_key(handle, item)
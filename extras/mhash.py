@@ -1,6 +1,8 @@
 import typing as ty
+from functools import cache
+from itertools import repeat
 
-__all__ = ("hash", "Hashable")
+__all__ = ("hash", "hash_many", "Hashable")
 
 Hashable = bytes | bytearray | memoryview | str | int | float | complex | bool
 Hasher = ty.Callable[[ty.Iterable[int], int, int, int], int]
@@ -21,20 +23,42 @@ def mmh3_hasher(value: ty.Iterable[int], seed: int, clamp: int, shift: int) -> i
 
 def py_hasher(value: ty.Iterable[int], seed: int, clamp: int, shift: int):
     seed *= clamp * shift
-    return __builtins__.hash(bytes(value)) * seed
+    from builtins import hash  # shadowed by `hash` below
+
+    return hash(bytes(value)) * seed
+
+
+@cache
+def _my_hasher_terms(shift: int) -> tuple[tuple[int, int, int, int, int], ...]:
+    """
+    The terms of `my_hasher` that only depend on a byte and the shift,
+    they involve huge powers so they are computed once per shift.
+    """
+    return tuple(
+        (
+            byte ** (byte // (shift + 1)),
+            byte**shift * 362717 * (byte ^ 82757**shift),
+            403133 * shift**byte,
+            ((byte << shift) ^ 570373**byte) ^ 570461 ** (byte + shift),
+            byte**shift ^ (821297 // (byte + 1)),
+        )
+        for byte in range(256)
+    )
 
 
 def my_hasher(value: ty.Iterable[int], seed: int, clamp: int, shift: int):
     total = 1
+    terms = _my_hasher_terms(shift)
     for byte in value:
-        total = (total * byte ** (byte // (shift + 1))) & clamp
+        power, mixer, scale, constant, factor = terms[byte]
+        total = (total * power) & clamp
         seed <<= shift
         seed ^= ((total << shift) | byte) * byte
-        seed ^= byte**shift * 362717 * (byte ^ 82757**shift)
-        seed ^= (seed >> shift) * 403133 * shift**byte
-        seed ^= ((byte << shift) ^ 570373**byte) ^ 570461 ** (byte + shift)
+        seed ^= mixer
+        seed ^= (seed >> shift) * scale
+        seed ^= constant
         seed ^= ((total * byte) ** shift) & (seed >> shift)
-        seed ^= (byte**shift ^ (821297 // (byte + 1))) * total
+        seed ^= factor * total
         seed = (seed >> shift) & clamp
     return seed + total
 
@@ -53,25 +77,8 @@ def _default_hasher() -> Hasher:
         return mmh3_hasher
 
 
-def hash(
-    value: Hashable,
-    clamp: int | None = None,
-    shift: int | None = None,
-    hasher: Hasher | None = None,
-) -> int:
-    """
-    This is a parametric hash function, this means by tuning
-    the input values `clamp` and `shift` it can yield
-    wildly different hash values hence can be used where
-    multiple hash functions are needed like in a bloom filter.
-
-    It can produce different values depending on the type of
-    data; hash(b'Hey') != hash('Hey'), hash(-90) != hash(90),
-    hash(1) != hash(1.0) != hash(1 + 0j) != hash(1.0 + 0j).
-    """
-    hasher = _default_hasher() if hasher is None else hasher
-    shift = 8 if shift is None else shift
-    clamp = (1 << ((clamp or 64) + shift)) - 1
+def _encode(value: Hashable) -> tuple[ty.Iterable[int], int]:
+    "The bytes fed to the hasher and the seed for a value."
     bytes_seq: ty.Iterable[int]
     hash_value = 7919
 
@@ -103,5 +110,87 @@ def hash(
             msg = "Unhashable type, %r of type %s"
             raise TypeError(msg % (value, type(value).__name__))
 
+    return bytes_seq, hash_value
+
+
+def hash(
+    value: Hashable,
+    clamp: int | None = None,
+    shift: int | None = None,
+    hasher: Hasher | None = None,
+) -> int:
+    """
+    This is a parametric hash function, this means by tuning
+    the input values `clamp` and `shift` it can yield
+    wildly different hash values hence can be used where
+    multiple hash functions are needed like in a bloom filter.
+
+    It can produce different values depending on the type of
+    data; hash(b'Hey') != hash('Hey'), hash(-90) != hash(90),
+    hash(1) != hash(1.0) != hash(1 + 0j) != hash(1.0 + 0j).
+    """
+    hasher = _default_hasher() if hasher is None else hasher
+    shift = 8 if shift is None else shift
+    clamp = (1 << ((clamp or 64) + shift)) - 1
+    bytes_seq, hash_value = _encode(value)
     hash_value = hasher(bytes_seq, hash_value, clamp, shift)
     return (hash_value + clamp * shift) & (clamp >> shift)
+
+
+_INT_SEED = 7919 * 892189  # The seed `_encode` gives ints
+
+
+def _ints_to_bytes(np: ty.Any, values: ty.Any) -> list[bytes]:
+    """
+    `_to_bytes` of every item of a NumPy integer array, vectorised. Each
+    int is written as 9 big endian bytes, a sign byte then its 64 bits,
+    all in one buffer, of which each value keeps its last
+    `bit_length // 8 + 1` bytes.
+    """
+    unsigned = values.dtype.kind == "u"
+    words = values.astype(np.uint64 if unsigned else np.int64)
+    negative = np.zeros(words.shape, bool) if unsigned else words < 0
+    magnitude = words.astype(np.uint64)
+    magnitude = np.where(negative, -magnitude, magnitude)  # Wraps, -2**63 too
+    lengths = np.ones(words.shape, np.int64)
+    for count in range(1, 9):  # bit_length >= 8 * count
+        lengths += magnitude >= np.uint64(1 << (8 * count - 1))
+    rows = np.empty((words.size, 9), np.uint8)
+    rows[:, 0] = np.where(negative, 0xFF, 0)
+    big_endian = words.astype(">u8" if unsigned else ">i8")
+    rows[:, 1:] = big_endian.view(np.uint8).reshape(-1, 8)
+    data = rows.tobytes()
+    ends = np.arange(9, 9 * words.size + 1, 9)
+    starts = (ends - lengths).tolist()
+    return [data[start:end] for start, end in zip(starts, ends.tolist())]
+
+
+def hash_many(
+    values: ty.Iterable[Hashable],
+    clamp: int | None = None,
+    shift: int | None = None,
+    hasher: Hasher | None = None,
+) -> list[int]:
+    """
+    Batch version of `hash` over any iterable or a NumPy array.
+    The hasher and the clamp and shift masks are resolved once for the
+    whole batch. NumPy integer arrays are turned into the bytes hashed
+    in one vectorised pass, other arrays into python scalars in a
+    single call. The hasher itself runs per value, it is a callable over
+    one value's bytes doing bignum arithmetic, more than 64 bits wide.
+    """
+    hasher = _default_hasher() if hasher is None else hasher
+    shift = 8 if shift is None else shift
+    clamp = (1 << ((clamp or 64) + shift)) - 1
+    mask, offset = clamp >> shift, clamp * shift
+    encoded: ty.Iterable[tuple[ty.Iterable[int], int]]
+    if getattr(getattr(values, "dtype", None), "kind", None) in ("b", "i", "u"):
+        import numpy as np
+
+        chunks = _ints_to_bytes(np, np.ravel(values))
+        encoded = zip(chunks, repeat(_INT_SEED))
+    else:
+        if hasattr(values, "tolist"):
+            values = values.tolist()  # type: ignore
+        encoded = map(_encode, values)
+    return [(hasher(seq, seed, clamp, shift) + offset) & mask for seq, seed in encoded]
@@ -0,0 +1,91 @@
+import random, typing as ty
+
+try:
+    import mdheap
+except ImportError:  # Collected from the repository root
+    from . import mdheap
+
+BRANCHING_FACTORS = 2, 3, 4, 6, 8, 12, 16
+
+
+def timer[
+    **P
+](function: ty.Callable[P, object], runs: int = 3) -> ty.Callable[P, float]:
+    "The best lapse of `runs` calls of `function`."
+
+    def _timeit(*args: P.args, **kwargs: P.kwargs) -> float:
+        from time import perf_counter
+
+        best = float("inf")
+        for _ in range(runs):
+            start = perf_counter()
+            function(*args, **kwargs)
+            best = min(best, perf_counter() - start)
+        return best
+
+    return _timeit
+
+
+def push_heavy(heap: mdheap.DHeap, items: list[float]):
+    "Every item is pushed, a tenth of them popped."
+    dheap: list[float] = []
+    for index, item in enumerate(items):
+        heap.push(dheap, item)
+        if not index % 10:
+            heap.pop(dheap)
+
+
+def pop_heavy(heap: mdheap.DHeap, items: list[float]):
+    "The items are heapified once then all popped."
+    dheap = items.copy()
+    heap.fy(dheap)
+    while dheap:
+        heap.pop(dheap)
+
+
+def balanced(heap: mdheap.DHeap, items: list[float]):
+    "Every item is pushed and popped."
+    dheap: list[float] = []
+    for item in items:
+        heap.push(dheap, item)
+    while dheap:
+        heap.pop(dheap)
+
+
+def decrease_key_heavy(heap: mdheap.DHeap, items: list[float]):
+    "Dijkstra like, each item is decreased 4 times on average before the pops."
+    indexed = mdheap.IndexedDHeap(heap.D, items)
+    handles = [*indexed._heap]
+    for handle in random.choices(handles, k=4 * len(items)):
+        indexed.decrease_key(handle, handle.item - random.random())
+    while indexed:
+        indexed.pop()
+
+
+WORKLOADS = {
+    "push": push_heavy,
+    "pop": pop_heavy,
+    "balanced": balanced,
+    "decrease_key": decrease_key_heavy,
+}
+
+
+def branching_speed_test(sizes: ty.Iterable[int], runs: int):
+    "Sweep D across heap sizes and workloads, the fastest D of each is marked."
+    for size in sizes:
+        items = [random.random() for _ in range(size)]
+        for name, workload in WORKLOADS.items():
+            lapses = {
+                D: timer(workload, runs)(mdheap.DHeap(D), items)
+                for D in BRANCHING_FACTORS
+            }
+            best = min(lapses, key=lapses.__getitem__)
+            row = "  ".join(
+                f"D={D}: {lapse:.3f}s" + ("*" if D == best else " ")
+                for D, lapse in lapses.items()
+            )
+            print(f"{name:>12} n={size:<8} {row}")
+
+
+if __name__ == "__main__":
+    branching_speed_test((10_000, 100_000, 1_000_000), 3)
@@ -171,8 +171,10 @@ def test_bloom_filter():
     assert not any(bloom.has(d) for d in others), repr(bloom)
 
 
-def _test_heapsort(shuffled_data: list[int], sorted_data: list[int], D: int):
-    heap = mdheap.DHeap(D)
+def _test_heapsort(
+    shuffled_data: list[int], sorted_data: list[int], D: int, bottomup: bool = False
+):
+    heap = mdheap.DHeap(D, bottomup=bottomup)
     heap.fy(shuffled_data)
     minimum = shuffled_data[0] - 1
     heap.push(shuffled_data, minimum)
@@ -189,3 +191,81 @@ def test_mdheap():
     random.shuffle(data)
     for D in range(1, 11):
         _test_heapsort(data.copy(), okay, D)
+        _test_heapsort(data.copy(), okay, D, bottomup=True)
+
+
+def test_mdheap_bottomup_comparisons():
+    class Counted:
+        comparisons = 0
+
+        def __init__(self, key: tuple[str, ...]) -> None:
+            self.key = key
+
+        def __lt__(self, other: "Counted") -> bool:
+            Counted.comparisons += 1
+            return self.key < other.key
+
+    keys = [tuple(random.choices("abcdef", k=3)) for _ in range(2000)]
+    counts = {}
+    for bottomup in False, True:
+        heap, items = mdheap.DHeap(4, bottomup=bottomup), [*map(Counted, keys)]
+        Counted.comparisons = 0
+        heap.fy(items)
+        popped = [heap.pop(items).key for _ in range(len(keys))]
+        assert popped == sorted(keys)
+        counts[bottomup] = Counted.comparisons
+    assert counts[True] < counts[False]
+
+
+def test_mhash_many():
+    import mhash
+
+    data = [*range(-50, 50), "Simon", b"Nganga", 0.25, 3 + 4j, bytearray(b"x")]
+    for hasher in mhash.py_hasher, mhash.my_hasher:
+        for clamp, shift in (None, None), (103, 11), (211, 3):
+            hashes = [mhash.hash(d, clamp, shift, hasher) for d in data]
+            assert mhash.hash_many(data, clamp, shift, hasher) == hashes
+
+    # NumPy int arrays are turned into bytes in bulk, to the same hashes
+    np = pytest.importorskip("numpy")
+    ints = [0, 1, -1, 127, 128, -128, -129, 255, 256, -(2**63), 2**63 - 1]
+    for array in (
+        np.array(ints, np.int64),
+        np.array([0, 255, 256, 2**63, 2**64 - 1], np.uint64),
+        np.array([-3, 70], np.int8),
+        np.array([True, False]),
+    ):
+        for hasher in mhash.py_hasher, mhash.my_hasher:
+            hashes = [mhash.hash(value, 103, 11, hasher) for value in array.tolist()]
+            assert mhash.hash_many(array, 103, 11, hasher) == hashes
+
+
+def test_indexed_mdheap():
+    for D in range(1, 7):
+        heap = mdheap.IndexedDHeap(D, random.choices(range(100), k=50))
+        handles = [heap.push(item) for item in random.choices(range(100), k=50)]
+        for handle in random.sample(handles, 30):
+            op = random.randrange(3)
+            if op == 0:
+                heap.decrease_key(handle, handle.item - random.randrange(50))
+            elif op == 1:
+                heap.increase_key(handle, handle.item + random.randrange(50))
+            else:
+                assert heap.remove(handle) == handle.item and handle not in heap
+        assert all(heap._heap[handle.index] is handle for handle in heap._heap)
+        expected = sorted(handle.item for handle in heap._heap)
+        assert [heap.pop() for _ in range(len(heap))] == expected
+        with pytest.raises(ValueError):
+            heap.update(handles[0], 0)
+
+
+def test_mdheap_auto():
+    data = list(range(1, 201))
+    okay = data.copy()
+    random.shuffle(data)
+    for workload in "push", "pop", "balanced", "decrease_key":
+        heap = mdheap.DHeap.auto(workload)
+        assert heap.D > 2
+        _test_heapsort(data.copy(), okay, heap.D)
+    with pytest.raises(ValueError):
+        mdheap.DHeap.auto("sort")